@@ -0,0 +1,221 @@
+"""Baseline schema
+
+Captures the schema previously produced at startup by ``create_all`` plus the
+``ALTER TABLE jobs`` backfills. Every statement is idempotent so the revision
+applies cleanly both to empty databases and to ones created by the old boot
+path; run ``python migrate.py upgrade`` once to stamp those.
+
+Legacy databases can hold several jobs with the same ``source_url``: the
+column had no constraint and the scraper checks for a URL before inserting,
+which races. Before the unique index is built, every duplicate but the newest
+is deactivated, pointed at the newest as its canonical job and has its URL
+cleared, so no row is deleted. Without that step the index, and with it this
+migration, would fail on such data.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ENUM_TYPES = {
+    "subscriptiontier": ("FREE", "PRO", "ENTERPRISE"),
+    "applicationstatus": ("DRAFT", "APPLIED", "SCREENING", "INTERVIEW", "OFFER", "REJECTED", "ACCEPTED"),
+    "interviewtype": ("PHONE", "VIDEO", "IN_PERSON", "PANEL"),
+    "interviewstatus": ("SCHEDULED", "COMPLETED", "CANCELLED", "NO_SHOW"),
+}
+
+TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id UUID PRIMARY KEY,
+        email VARCHAR(255) NOT NULL,
+        password_hash VARCHAR(255),
+        full_name VARCHAR(255) NOT NULL,
+        profile_picture_url VARCHAR,
+        phone VARCHAR(50),
+        location VARCHAR(255),
+        linkedin_url VARCHAR,
+        github_url VARCHAR,
+        portfolio_url VARCHAR,
+        google_id VARCHAR(255) UNIQUE,
+        linkedin_id VARCHAR(255) UNIQUE,
+        email_verified BOOLEAN,
+        is_active BOOLEAN,
+        subscription_tier subscriptiontier NOT NULL,
+        subscription_expires_at TIMESTAMP,
+        created_at TIMESTAMP NOT NULL DEFAULT now(),
+        updated_at TIMESTAMP DEFAULT now(),
+        last_login_at TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS resumes (
+        id UUID PRIMARY KEY,
+        user_id UUID NOT NULL REFERENCES users(id),
+        title VARCHAR(255) NOT NULL,
+        file_url VARCHAR,
+        file_type VARCHAR(50),
+        is_primary BOOLEAN,
+        raw_text TEXT,
+        ats_score FLOAT,
+        keyword_match_score FLOAT,
+        strengths JSON,
+        weaknesses JSON,
+        suggestions JSON,
+        missing_keywords JSON,
+        created_at TIMESTAMP NOT NULL DEFAULT now(),
+        updated_at TIMESTAMP DEFAULT now()
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id UUID PRIMARY KEY,
+        title VARCHAR(255) NOT NULL,
+        company VARCHAR(255) NOT NULL,
+        location VARCHAR(255) NOT NULL,
+        remote_type VARCHAR(50),
+        description TEXT NOT NULL,
+        requirements TEXT,
+        salary_min FLOAT,
+        salary_max FLOAT,
+        job_type VARCHAR(50),
+        experience_level VARCHAR(50),
+        source_url VARCHAR,
+        is_active BOOLEAN,
+        posted_date TIMESTAMP,
+        created_at TIMESTAMP NOT NULL DEFAULT now()
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS applications (
+        id UUID PRIMARY KEY,
+        user_id UUID NOT NULL REFERENCES users(id),
+        job_id UUID REFERENCES jobs(id),
+        company_name VARCHAR(255) NOT NULL,
+        job_title VARCHAR(255) NOT NULL,
+        job_url VARCHAR,
+        status applicationstatus NOT NULL,
+        applied_date TIMESTAMP,
+        source VARCHAR(100),
+        notes TEXT,
+        match_score FLOAT,
+        created_at TIMESTAMP NOT NULL DEFAULT now(),
+        updated_at TIMESTAMP DEFAULT now()
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS interviews (
+        id UUID PRIMARY KEY,
+        application_id UUID NOT NULL REFERENCES applications(id),
+        user_id UUID NOT NULL REFERENCES users(id),
+        interview_type interviewtype NOT NULL,
+        status interviewstatus NOT NULL,
+        scheduled_at TIMESTAMP NOT NULL,
+        duration_minutes VARCHAR(50),
+        interviewer_name VARCHAR(255),
+        interviewer_email VARCHAR(255),
+        location_or_url VARCHAR,
+        notes TEXT,
+        feedback TEXT,
+        created_at TIMESTAMP NOT NULL DEFAULT now(),
+        updated_at TIMESTAMP DEFAULT now()
+    )
+    """,
+]
+
+# Columns that older databases may lack because they were added after the
+# jobs table was first created.
+JOB_COLUMNS = [
+    "raw_description TEXT",
+    "ai_summary TEXT",
+    "ai_highlights VARCHAR[]",
+    "ai_required_skills VARCHAR[]",
+    "ai_compensation VARCHAR(255)",
+    "ai_remote_policy VARCHAR(255)",
+    "ai_last_enriched_at TIMESTAMP",
+    "validated_source_url VARCHAR",
+    "source_site VARCHAR(100)",
+    "content_fingerprint VARCHAR(40)",
+    "minhash_signature BIGINT[]",
+    "canonical_job_id UUID REFERENCES jobs(id) ON DELETE SET NULL",
+]
+
+LSH_TABLE = """
+    CREATE TABLE IF NOT EXISTS job_lsh_buckets (
+        bucket VARCHAR(24) NOT NULL,
+        job_id UUID NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+        PRIMARY KEY (bucket, job_id)
+    )
+"""
+
+# Keep the newest row per source_url; older copies stay for the applications
+# that reference them but give up the URL.
+DEDUPE_SOURCE_URLS = """
+    WITH ranked AS (
+        SELECT id,
+               first_value(id) OVER same_url AS keeper,
+               row_number() OVER same_url AS position
+        FROM jobs
+        WHERE source_url IS NOT NULL
+        WINDOW same_url AS (PARTITION BY source_url ORDER BY created_at DESC, id DESC)
+    )
+    UPDATE jobs
+    SET source_url = NULL, is_active = false, canonical_job_id = ranked.keeper
+    FROM ranked
+    WHERE jobs.id = ranked.id AND ranked.position > 1
+"""
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_users_id ON users (id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email)",
+    "CREATE INDEX IF NOT EXISTS ix_resumes_id ON resumes (id)",
+    "CREATE INDEX IF NOT EXISTS ix_resumes_user_id ON resumes (user_id)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_id ON jobs (id)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_title ON jobs (title)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_company ON jobs (company)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_jobs_source_url ON jobs (source_url)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_content_fingerprint ON jobs (content_fingerprint)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_canonical_job_id ON jobs (canonical_job_id)",
+    "CREATE INDEX IF NOT EXISTS ix_applications_id ON applications (id)",
+    "CREATE INDEX IF NOT EXISTS ix_applications_user_id ON applications (user_id)",
+    "CREATE INDEX IF NOT EXISTS ix_interviews_id ON interviews (id)",
+    "CREATE INDEX IF NOT EXISTS ix_interviews_application_id ON interviews (application_id)",
+    "CREATE INDEX IF NOT EXISTS ix_interviews_user_id ON interviews (user_id)",
+    "CREATE INDEX IF NOT EXISTS ix_job_lsh_buckets_job_id ON job_lsh_buckets (job_id)",
+]
+
+
+def upgrade() -> None:
+    for name, labels in ENUM_TYPES.items():
+        values = ", ".join(f"'{label}'" for label in labels)
+        op.execute(
+            f"DO $$ BEGIN CREATE TYPE {name} AS ENUM ({values}); "
+            "EXCEPTION WHEN duplicate_object THEN NULL; END $$"
+        )
+    for ddl in TABLES:
+        op.execute(ddl)
+    for column in JOB_COLUMNS:
+        op.execute(f"ALTER TABLE jobs ADD COLUMN IF NOT EXISTS {column}")
+    op.execute(LSH_TABLE)
+    op.execute(DEDUPE_SOURCE_URLS)
+    for ddl in INDEXES:
+        op.execute(ddl)
+
+
+def downgrade() -> None:
+    for table in ("job_lsh_buckets", "interviews", "applications", "jobs", "resumes", "users"):
+        op.execute(f"DROP TABLE IF EXISTS {table}")
+    for name in ENUM_TYPES:
+        op.execute(f"DROP TYPE IF EXISTS {name}")
@@ -0,0 +1,43 @@
+"""Per-job resume analysis results
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "resume_job_analyses",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("resume_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("ats_score", sa.Float(), nullable=True),
+        sa.Column("keyword_match_score", sa.Float(), nullable=True),
+        sa.Column("strengths", sa.JSON(), nullable=True),
+        sa.Column("weaknesses", sa.JSON(), nullable=True),
+        sa.Column("suggestions", sa.JSON(), nullable=True),
+        sa.Column("missing_keywords", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.UniqueConstraint("resume_id", "job_id", name="uq_resume_job_analyses_resume_job"),
+    )
+    op.create_index("ix_resume_job_analyses_resume_id", "resume_job_analyses", ["resume_id"])
+    op.create_index("ix_resume_job_analyses_job_id", "resume_job_analyses", ["job_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("resume_job_analyses")
@@ -0,0 +1,104 @@
+"""Normalized job skills with a GIN index and per-skill counts
+
+Adds ``jobs.skills_normalized`` and the ``job_skill_counts`` aggregate. A row
+trigger keeps the counts current for active canonical jobs on every insert,
+update and delete, including bulk upserts that never load ORM objects.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.services.skills import normalize_skills
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+MAINTAIN_COUNTS = """
+CREATE OR REPLACE FUNCTION job_skill_counts_maintain() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE')
+       AND OLD.is_active AND OLD.canonical_job_id IS NULL AND OLD.skills_normalized IS NOT NULL THEN
+        UPDATE job_skill_counts c SET job_count = c.job_count - 1
+        FROM unnest(OLD.skills_normalized) AS s(skill)
+        WHERE c.skill = s.skill;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE')
+       AND NEW.is_active AND NEW.canonical_job_id IS NULL AND NEW.skills_normalized IS NOT NULL THEN
+        INSERT INTO job_skill_counts (skill, job_count)
+        SELECT DISTINCT s.skill, 1 FROM unnest(NEW.skills_normalized) AS s(skill)
+        ON CONFLICT (skill) DO UPDATE SET job_count = job_skill_counts.job_count + 1;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+COUNT_TRIGGER = """
+CREATE TRIGGER jobs_skill_counts
+AFTER INSERT OR DELETE OR UPDATE OF skills_normalized, is_active, canonical_job_id ON jobs
+FOR EACH ROW EXECUTE FUNCTION job_skill_counts_maintain()
+"""
+
+INITIAL_COUNTS = """
+INSERT INTO job_skill_counts (skill, job_count)
+SELECT s.skill, count(*) FROM jobs, unnest(jobs.skills_normalized) AS s(skill)
+WHERE jobs.is_active AND jobs.canonical_job_id IS NULL
+GROUP BY s.skill
+"""
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("skills_normalized", postgresql.ARRAY(sa.String()), nullable=True))
+    op.create_index("ix_jobs_skills_normalized", "jobs", ["skills_normalized"], postgresql_using="gin")
+    op.create_table(
+        "job_skill_counts",
+        sa.Column("skill", sa.String(length=100), primary_key=True),
+        sa.Column("job_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Backfill before the trigger exists, then count once.
+    bind = op.get_bind()
+    jobs = sa.table(
+        "jobs",
+        sa.column("id", postgresql.UUID(as_uuid=True)),
+        sa.column("ai_required_skills", postgresql.ARRAY(sa.String())),
+        sa.column("skills_normalized", postgresql.ARRAY(sa.String())),
+    )
+    last_id = None
+    while True:
+        query = sa.select(jobs.c.id, jobs.c.ai_required_skills).where(jobs.c.ai_required_skills.isnot(None))
+        if last_id is not None:
+            query = query.where(jobs.c.id > last_id)
+        rows = bind.execute(query.order_by(jobs.c.id).limit(BACKFILL_BATCH_SIZE)).all()
+        if not rows:
+            break
+        bind.execute(
+            jobs.update().where(jobs.c.id == sa.bindparam("job_id")).values(skills_normalized=sa.bindparam("skills")),
+            [{"job_id": row.id, "skills": normalize_skills(row.ai_required_skills)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+    op.execute(INITIAL_COUNTS)
+    op.execute(MAINTAIN_COUNTS)
+    op.execute(COUNT_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS jobs_skill_counts ON jobs")
+    op.execute("DROP FUNCTION IF EXISTS job_skill_counts_maintain()")
+    op.drop_table("job_skill_counts")
+    op.drop_index("ix_jobs_skills_normalized", table_name="jobs")
+    op.drop_column("jobs", "skills_normalized")
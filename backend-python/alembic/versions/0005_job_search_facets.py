@@ -0,0 +1,85 @@
+"""Partial filter indexes and precomputed facet counts for job search
+
+Adds partial indexes over listed jobs (active, canonical) for each faceted
+filter and the ``job_facet_counts`` materialized view holding the unfiltered
+facet counts. The unique index lets the view be refreshed concurrently.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LISTED_JOBS = sa.text("is_active AND canonical_job_id IS NULL")
+
+FILTER_INDEXES = {
+    "ix_jobs_listed_remote_type": ["remote_type"],
+    "ix_jobs_listed_job_type": ["job_type"],
+    "ix_jobs_listed_experience_level": ["experience_level"],
+    "ix_jobs_listed_source_site": ["source_site"],
+    "ix_jobs_listed_posted_date": ["posted_date"],
+    "ix_jobs_listed_salary_ceiling": [sa.text("coalesce(salary_max, salary_min)")],
+    "ix_jobs_listed_salary_floor": [sa.text("coalesce(salary_min, salary_max)")],
+}
+
+# Buckets mirror app.services.job_facets.SALARY_BUCKETS.
+FACET_VIEW = """
+CREATE MATERIALIZED VIEW job_facet_counts AS
+WITH listed AS (
+    SELECT remote_type, job_type, experience_level, source_site,
+           CASE
+               WHEN coalesce(salary_max, salary_min) IS NULL THEN 'unspecified'
+               WHEN coalesce(salary_max, salary_min) < 50000 THEN '<50k'
+               WHEN coalesce(salary_max, salary_min) < 100000 THEN '50k-100k'
+               WHEN coalesce(salary_max, salary_min) < 150000 THEN '100k-150k'
+               WHEN coalesce(salary_max, salary_min) < 200000 THEN '150k-200k'
+               ELSE '200k+'
+           END AS salary_bucket
+    FROM jobs
+    WHERE is_active AND canonical_job_id IS NULL
+)
+SELECT
+    CASE
+        WHEN grouping(remote_type) = 0 THEN 'remote_type'
+        WHEN grouping(job_type) = 0 THEN 'job_type'
+        WHEN grouping(experience_level) = 0 THEN 'experience_level'
+        WHEN grouping(source_site) = 0 THEN 'source_site'
+        WHEN grouping(salary_bucket) = 0 THEN 'salary_bucket'
+        ELSE 'total'
+    END AS dimension,
+    CASE
+        WHEN grouping(remote_type) = 0 THEN coalesce(remote_type, 'unspecified')
+        WHEN grouping(job_type) = 0 THEN coalesce(job_type, 'unspecified')
+        WHEN grouping(experience_level) = 0 THEN coalesce(experience_level, 'unspecified')
+        WHEN grouping(source_site) = 0 THEN coalesce(source_site, 'unspecified')
+        WHEN grouping(salary_bucket) = 0 THEN salary_bucket
+        ELSE ''
+    END AS value,
+    count(*) AS job_count
+FROM listed
+GROUP BY GROUPING SETS ((remote_type), (job_type), (experience_level), (source_site), (salary_bucket), ())
+"""
+
+
+def upgrade() -> None:
+    for name, columns in FILTER_INDEXES.items():
+        op.create_index(name, "jobs", columns, postgresql_where=LISTED_JOBS)
+    op.execute(FACET_VIEW)
+    op.create_index("uq_job_facet_counts", "job_facet_counts", ["dimension", "value"], unique=True)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS job_facet_counts")
+    for name in FILTER_INDEXES:
+        op.drop_index(name, table_name="jobs")
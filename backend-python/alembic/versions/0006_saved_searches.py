@@ -0,0 +1,53 @@
+"""Saved searches and their per-user match feed
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "saved_searches",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("query", sa.String(length=255), nullable=True),
+        sa.Column("skills", postgresql.ARRAY(sa.String()), nullable=True),
+        sa.Column("filters", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+    )
+    op.create_index("ix_saved_searches_user_id", "saved_searches", ["user_id"])
+    op.create_table(
+        "saved_search_matches",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "saved_search_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("saved_searches.id", ondelete="CASCADE"), nullable=False,
+        ),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("matched_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("saved_search_id", "job_id", name="uq_saved_search_matches_search_job"),
+    )
+    op.create_index("ix_saved_search_matches_user_feed", "saved_search_matches", ["user_id", "id"])
+    op.create_index("ix_saved_search_matches_job_id", "saved_search_matches", ["job_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("saved_search_matches")
+    op.drop_table("saved_searches")
@@ -0,0 +1,41 @@
+"""Composite indexes for paginated per-user collections
+
+Each index matches a keyset page: the user, optionally a status filter, then
+the sort column and id tie-breaker.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_applications_user_updated": ("applications", ["user_id", "updated_at", "id"]),
+    "ix_applications_user_created": ("applications", ["user_id", "created_at", "id"]),
+    "ix_applications_user_status_updated": ("applications", ["user_id", "status", "updated_at", "id"]),
+    "ix_interviews_user_scheduled": ("interviews", ["user_id", "scheduled_at", "id"]),
+    "ix_interviews_user_created": ("interviews", ["user_id", "created_at", "id"]),
+    "ix_interviews_user_status_scheduled": ("interviews", ["user_id", "status", "scheduled_at", "id"]),
+    "ix_resumes_user_updated": ("resumes", ["user_id", "updated_at", "id"]),
+    "ix_resumes_user_created": ("resumes", ["user_id", "created_at", "id"]),
+}
+
+
+def upgrade() -> None:
+    for name, (table, columns) in INDEXES.items():
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table)
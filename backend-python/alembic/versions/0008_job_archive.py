@@ -0,0 +1,46 @@
+"""Job expiry indexes and the jobs_archive table
+
+Adds the partial indexes the lifecycle task scans (active jobs by expiry
+date, inactive jobs by age), an index on applications.job_id for the
+"still referenced" check, and ``jobs_archive`` with the columns of ``jobs``
+plus ``archived_at``. The archive has no foreign keys or unique source_url,
+so archived rows never block writes to ``jobs``.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_jobs_active_expiry", "jobs", [sa.text("coalesce(posted_date, created_at)")],
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index("ix_jobs_inactive_created", "jobs", ["created_at"], postgresql_where=sa.text("NOT is_active"))
+    op.create_index("ix_applications_job_id", "applications", ["job_id"])
+    op.execute(
+        "CREATE TABLE jobs_archive ("
+        " LIKE jobs INCLUDING DEFAULTS,"
+        " archived_at timestamp without time zone NOT NULL DEFAULT now(),"
+        " PRIMARY KEY (id))"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("jobs_archive")
+    op.drop_index("ix_applications_job_id", table_name="applications")
+    op.drop_index("ix_jobs_inactive_created", table_name="jobs")
+    op.drop_index("ix_jobs_active_expiry", table_name="jobs")
@@ -0,0 +1,79 @@
+"""Recount job_skill_counts periodically instead of per row
+
+The ``jobs_skill_counts`` row trigger updated shared counter rows (e.g.
+``python``) inside every job write. Concurrent bulk ingests, each one long
+transaction, serialized on those hot rows and could deadlock by locking
+the same skills in different orders. The trigger is dropped; the facet
+refresh task now recounts the table (app.services.job_facets), so counts
+lag by up to FACET_REFRESH_SECONDS like the facet view.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors app.services.job_facets.RECOUNT_SKILLS.
+RECOUNT_SKILLS = """
+WITH fresh AS (
+    SELECT s.skill, count(*) AS job_count
+    FROM jobs, unnest(jobs.skills_normalized) AS s(skill)
+    WHERE jobs.is_active AND jobs.canonical_job_id IS NULL
+    GROUP BY s.skill
+), upserted AS (
+    INSERT INTO job_skill_counts (skill, job_count)
+    SELECT skill, job_count FROM fresh
+    ON CONFLICT (skill) DO UPDATE SET job_count = EXCLUDED.job_count
+    WHERE job_skill_counts.job_count <> EXCLUDED.job_count
+)
+DELETE FROM job_skill_counts c WHERE NOT EXISTS (SELECT 1 FROM fresh WHERE fresh.skill = c.skill)
+"""
+
+# Trigger body from revision 0004, restored on downgrade.
+MAINTAIN_COUNTS = """
+CREATE OR REPLACE FUNCTION job_skill_counts_maintain() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE')
+       AND OLD.is_active AND OLD.canonical_job_id IS NULL AND OLD.skills_normalized IS NOT NULL THEN
+        UPDATE job_skill_counts c SET job_count = c.job_count - 1
+        FROM unnest(OLD.skills_normalized) AS s(skill)
+        WHERE c.skill = s.skill;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE')
+       AND NEW.is_active AND NEW.canonical_job_id IS NULL AND NEW.skills_normalized IS NOT NULL THEN
+        INSERT INTO job_skill_counts (skill, job_count)
+        SELECT DISTINCT s.skill, 1 FROM unnest(NEW.skills_normalized) AS s(skill)
+        ON CONFLICT (skill) DO UPDATE SET job_count = job_skill_counts.job_count + 1;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+COUNT_TRIGGER = """
+CREATE TRIGGER jobs_skill_counts
+AFTER INSERT OR DELETE OR UPDATE OF skills_normalized, is_active, canonical_job_id ON jobs
+FOR EACH ROW EXECUTE FUNCTION job_skill_counts_maintain()
+"""
+
+
+def upgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS jobs_skill_counts ON jobs")
+    op.execute("DROP FUNCTION IF EXISTS job_skill_counts_maintain()")
+    op.execute(RECOUNT_SKILLS)
+
+
+def downgrade() -> None:
+    op.execute(RECOUNT_SKILLS)
+    op.execute(MAINTAIN_COUNTS)
+    op.execute(COUNT_TRIGGER)
@@ -0,0 +1,40 @@
+"""Order the saved-search feed by inserting transaction
+
+Adds ``saved_search_matches.xact_id``, the id of the transaction that
+inserted the row, and re-keys the feed index on ``(user_id, xact_id, id)``.
+BIGSERIAL ids are handed out at insert time, not commit time, so a long
+ingest transaction could commit ids below a cursor a client had already
+polled past. The feed now only serves rows whose transaction is older
+than every transaction still running.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "saved_search_matches",
+        sa.Column("xact_id", sa.BigInteger(), server_default=sa.text("txid_current()"), nullable=False),
+    )
+    op.drop_index("ix_saved_search_matches_user_feed", table_name="saved_search_matches")
+    op.create_index("ix_saved_search_matches_user_feed", "saved_search_matches", ["user_id", "xact_id", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_saved_search_matches_user_feed", table_name="saved_search_matches")
+    op.create_index("ix_saved_search_matches_user_feed", "saved_search_matches", ["user_id", "id"])
+    op.drop_column("saved_search_matches", "xact_id")
@@ -0,0 +1,99 @@
+"""Keep job_skill_counts incremental through an append-only delta table
+
+Revision 0009 replaced the per-row counter trigger with a periodic full
+recount, which rescans every listed job each interval. Statement-level
+triggers now append one ``(skill, delta)`` row per skill a write statement
+changed to ``job_skill_count_deltas``; being insert-only, concurrent ingests
+never wait on each other. The facet refresh task folds the deltas into
+``job_skill_counts`` in batches (app.services.job_facets).
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Net change per skill over the statement's old and new rows; transition
+# tables a trigger does not declare are only referenced on branches it never runs.
+RECORD_DELTAS = """
+CREATE OR REPLACE FUNCTION job_skill_count_deltas_record() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO job_skill_count_deltas (skill, delta)
+        SELECT s.skill, count(*) FROM new_jobs j, unnest(j.skills_normalized) AS s(skill)
+        WHERE j.is_active AND j.canonical_job_id IS NULL
+        GROUP BY s.skill;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO job_skill_count_deltas (skill, delta)
+        SELECT s.skill, -count(*) FROM old_jobs j, unnest(j.skills_normalized) AS s(skill)
+        WHERE j.is_active AND j.canonical_job_id IS NULL
+        GROUP BY s.skill;
+    ELSE
+        INSERT INTO job_skill_count_deltas (skill, delta)
+        SELECT skill, sum(delta) FROM (
+            SELECT s.skill, 1 AS delta FROM new_jobs j, unnest(j.skills_normalized) AS s(skill)
+            WHERE j.is_active AND j.canonical_job_id IS NULL
+            UNION ALL
+            SELECT s.skill, -1 FROM old_jobs j, unnest(j.skills_normalized) AS s(skill)
+            WHERE j.is_active AND j.canonical_job_id IS NULL
+        ) changes
+        GROUP BY skill
+        HAVING sum(delta) <> 0;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+TRIGGERS = {
+    "jobs_skill_deltas_insert": "AFTER INSERT ON jobs REFERENCING NEW TABLE AS new_jobs",
+    "jobs_skill_deltas_update": "AFTER UPDATE ON jobs REFERENCING OLD TABLE AS old_jobs NEW TABLE AS new_jobs",
+    "jobs_skill_deltas_delete": "AFTER DELETE ON jobs REFERENCING OLD TABLE AS old_jobs",
+}
+
+# Same statement as revision 0009; resynchronizes counts before the deltas take over.
+RECOUNT_SKILLS = """
+WITH fresh AS (
+    SELECT s.skill, count(*) AS job_count
+    FROM jobs, unnest(jobs.skills_normalized) AS s(skill)
+    WHERE jobs.is_active AND jobs.canonical_job_id IS NULL
+    GROUP BY s.skill
+), upserted AS (
+    INSERT INTO job_skill_counts (skill, job_count)
+    SELECT skill, job_count FROM fresh
+    ON CONFLICT (skill) DO UPDATE SET job_count = EXCLUDED.job_count
+    WHERE job_skill_counts.job_count <> EXCLUDED.job_count
+)
+DELETE FROM job_skill_counts c WHERE NOT EXISTS (SELECT 1 FROM fresh WHERE fresh.skill = c.skill)
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_skill_count_deltas",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("skill", sa.String(length=100), nullable=False),
+        sa.Column("delta", sa.Integer(), nullable=False),
+    )
+    op.execute(RECORD_DELTAS)
+    for name, timing in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER {name} {timing} FOR EACH STATEMENT EXECUTE FUNCTION job_skill_count_deltas_record()")
+    op.execute(RECOUNT_SKILLS)
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON jobs")
+    op.execute("DROP FUNCTION IF EXISTS job_skill_count_deltas_record()")
+    op.drop_table("job_skill_count_deltas")
@@ -1,15 +1,36 @@
 """JobForge AI - API Dependencies"""
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, status, Query, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from typing import Generator, Optional, Sequence
 from uuid import UUID
+from app.core import replicas
 from app.core.database import get_db
 from app.core.security import verify_token
 from app.crud import user as user_crud
+from app.crud.pagination import InvalidCursorError, Page, PageRequest, decode_cursor
 from app.models.user import User
 
 security = HTTPBearer()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """Session for read-only endpoints: a healthy replica unless the user wrote recently"""
+    pool = replicas.get_pool()
+    replica = None
+    if pool and not replicas.is_pinned_to_primary(request):
+        replica = pool.next_healthy()
+    if replica is None:
+        yield from get_db()
+        return
+    # Fails over to the primary by itself if the replica errors mid-request.
+    db = replica.session()
+    try:
+        yield db
+    finally:
+        db.close()
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -40,3 +61,27 @@ async def get_current_user(
             detail="Inactive user"
         )
     return user
+
+def page_params(sorts: Sequence[str], default_order: str = "desc"):
+    """Build a dependency parsing limit/cursor/sort/order for a collection endpoint"""
+    def dependency(
+        limit: int = Query(50, ge=1, le=200),
+        cursor: Optional[str] = Query(None, description=f"Value of the previous page's {NEXT_CURSOR_HEADER} header"),
+        sort: str = Query(sorts[0], pattern=f"^({'|'.join(sorts)})$"),
+        order: str = Query(default_order, pattern="^(asc|desc)$"),
+    ) -> PageRequest:
+        descending = order == "desc"
+        after = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor, sort, descending)
+            except InvalidCursorError as exc:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+        return PageRequest(limit=limit, sort=sort, descending=descending, after=after)
+    return dependency
+
+def page_response(response: Response, page: Page) -> list:
+    """Expose the next page's cursor as a header and return the page items"""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
@@ -1,6 +1,7 @@
 """AI content generation endpoints (cover letters, interview prep)."""
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from typing import Dict
 from uuid import UUID
 
 from app.api.deps import get_current_user
@@ -14,8 +15,8 @@ from app.schemas.ai import (
     InterviewQuestionsRequest,
     InterviewQuestionsResponse,
     InterviewQuestion,
+    UpstreamMetricsResponse,
 )
-from app.services import ai_content
 
 router = APIRouter()
 
@@ -53,6 +54,8 @@ async def generate_cover_letter(
         job_company = job.company
         job_description = job.description or job.raw_description or ""
 
+    from app.services import ai_content
+
     try:
         result = ai_content.generate_cover_letter(
             resume_text=resume.raw_text,
@@ -86,6 +89,8 @@ async def generate_interview_questions(
             detail="Job not found",
         )
 
+    from app.services import ai_content
+
     try:
         result = ai_content.generate_interview_questions(
             job_title=job.title,
@@ -109,3 +114,11 @@ async def generate_interview_questions(
         prompt_tokens=result.get("prompt_tokens"),
         completion_tokens=result.get("completion_tokens"),
     )
+
+
+@router.get("/metrics", response_model=Dict[str, UpstreamMetricsResponse])
+def get_upstream_metrics(current_user: User = Depends(get_current_user)):
+    """Per-provider LLM concurrency limit, queue depth and outcome counters for this worker."""
+    from app.services import llm_limiter
+
+    return llm_limiter.snapshot_all()
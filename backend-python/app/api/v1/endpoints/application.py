@@ -1,46 +1,111 @@
 """JobForge AI - Application Endpoints"""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_read_db, page_params, page_response
+from app.crud.pagination import PageRequest
 from app.models.user import User
-from app.models.application import Application
-from app.schemas.application import ApplicationCreate, ApplicationUpdate, ApplicationResponse, ApplicationStats
+from app.models.application import Application, ApplicationStatus
+from app.schemas.application import (
+    ApplicationCreate, ApplicationUpdate, ApplicationResponse, ApplicationDetailResponse, ApplicationStats,
+    ApplicationImportResponse,
+)
+from app.schemas.interview import InterviewResponse
+from app.schemas.job import JobResponse
 from app.crud import application as application_crud
 
 router = APIRouter()
 
-@router.get("/", response_model=List[ApplicationResponse])
+def _include_params(
+    include: Optional[str] = Query(
+        None, description=f"Comma-separated related rows to embed: {', '.join(application_crud.APPLICATION_INCLUDES)}"
+    )
+) -> List[str]:
+    names = [name.strip() for name in (include or "").split(",") if name.strip()]
+    unknown = sorted(set(names) - set(application_crud.APPLICATION_INCLUDES))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown include: {', '.join(unknown)}"
+        )
+    return list(dict.fromkeys(names))
+
+def _expand(application: Application, include: List[str]) -> ApplicationDetailResponse:
+    # Only touch relationships that were eager-loaded; anything else would lazy-load per row.
+    detail = ApplicationDetailResponse(**ApplicationResponse.model_validate(application).model_dump())
+    if "job" in include and application.job is not None:
+        detail.job = JobResponse.model_validate(application.job)
+    if "interviews" in include:
+        detail.interviews = [InterviewResponse.model_validate(item) for item in application.interviews]
+    return detail
+
+@router.get("/", response_model=List[ApplicationDetailResponse])
 def list_applications(
+    response: Response,
+    status_filter: Optional[ApplicationStatus] = Query(None, alias="status"),
+    page: PageRequest = Depends(page_params(list(application_crud.APPLICATION_SORTS))),
+    include: List[str] = Depends(_include_params),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the current user's applications a page at a time"""
+    applications = application_crud.get_applications_by_user(
+        db, current_user.id, page, status=status_filter, include=include
+    )
+    return [_expand(application, include) for application in page_response(response, applications)]
+
+@router.get("/export")
+def export_applications(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    current_user: User = Depends(get_current_user)
+):
+    """Download all of the current user's applications as CSV or NDJSON"""
+    from app.services.export import export_response
+
+    user_id = current_user.id
+    return export_response(
+        lambda db: application_crud.export_applications_query(db, user_id), format, "applications"
+    )
+
+@router.post("/import", response_model=ApplicationImportResponse)
+async def import_applications(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all applications for the current user"""
-    applications = application_crud.get_applications_by_user(db, current_user.id)
-    return applications
+    """Import applications from a CSV (text/csv), NDJSON or JSON array body in one transaction"""
+    from app.services.application_import import ApplicationImportError, import_application_stream
+
+    try:
+        return await import_application_stream(
+            db, current_user.id, request.stream(), request.headers.get("content-type")
+        )
+    except ApplicationImportError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
 @router.get("/stats", response_model=ApplicationStats)
 def get_application_stats(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get statistics for the current user's applications"""
     stats = application_crud.get_application_stats(db, current_user.id)
     return stats
 
-@router.get("/{application_id}", response_model=ApplicationResponse)
+@router.get("/{application_id}", response_model=ApplicationDetailResponse)
 def get_application(
     application_id: UUID,
+    include: List[str] = Depends(_include_params),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get a specific application"""
-    application = application_crud.get_application(db, application_id)
+    application = application_crud.get_application(db, application_id, include=include)
     if not application or application.user_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
-    return application
+    return _expand(application, include)
 
 @router.post("/", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
 def create_application(
@@ -60,11 +125,9 @@ def update_application(
     db: Session = Depends(get_db)
 ):
     """Update an application"""
-    application = application_crud.get_application(db, application_id)
-    if not application or application.user_id != current_user.id:
+    updated_application = application_crud.update_application(db, application_id, application_update, owner_id=current_user.id)
+    if not updated_application:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
-    
-    updated_application = application_crud.update_application(db, application_id, application_update)
     return updated_application
 
 @router.delete("/{application_id}")
@@ -89,15 +152,14 @@ def update_application_status(
     db: Session = Depends(get_db)
 ):
     """Update application status"""
-    application = application_crud.get_application(db, application_id)
-    if not application or application.user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
-    
     from app.models.application import ApplicationStatus
     status_value = status_update.get("status")
     try:
         new_status = ApplicationStatus(status_value)
-        updated_application = application_crud.update_application_status(db, application_id, new_status)
-        return updated_application
     except ValueError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status value")
+
+    updated_application = application_crud.update_application_status(db, application_id, new_status, owner_id=current_user.id)
+    if not updated_application:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
+    return updated_application
@@ -0,0 +1,16 @@
+"""JobForge AI - Dashboard Endpoints"""
+from fastapi import APIRouter, Depends, Request
+from app.api.deps import get_current_user
+from app.core.compression import cached_json_response
+from app.core.config import settings
+from app.models.user import User
+from app.schemas.dashboard import DashboardResponse
+
+router = APIRouter()
+
+@router.get("", response_model=DashboardResponse)
+def get_dashboard(request: Request, current_user: User = Depends(get_current_user)):
+    """Profile, application stats, recent applications, upcoming interviews and resumes in one call"""
+    from app.services.dashboard import render_dashboard
+
+    return cached_json_response(request, render_dashboard(current_user), settings.DASHBOARD_CACHE_TTL_SECONDS)
@@ -0,0 +1,18 @@
+"""JobForge AI - Uploaded File Delivery"""
+import mimetypes
+from fastapi import APIRouter, HTTPException, Request, status
+from app.core.config import settings
+
+router = APIRouter()
+
+@router.get("/{file_path:path}")
+def serve_upload(file_path: str, request: Request):
+    """Serve a stored upload; signed URLs are checked without touching the database"""
+    from app.services.file_storage import UPLOAD_ROUTE_PREFIX, resolve_file_path
+    from app.services.file_delivery import build_file_response, verify_signed_request
+
+    if settings.SIGNED_URLS_REQUIRED and not verify_signed_request(request):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid or expired file link")
+    path = resolve_file_path(f"/{UPLOAD_ROUTE_PREFIX}/{file_path}")
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    return build_file_response(request, path, media_type)
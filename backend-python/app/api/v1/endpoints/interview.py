@@ -1,12 +1,13 @@
 """JobForge AI - Interview Endpoints"""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, page_params, page_response
+from app.crud.pagination import PageRequest
 from app.models.user import User
-from app.models.interview import Interview
+from app.models.interview import Interview, InterviewStatus
 from app.schemas.interview import InterviewCreate, InterviewUpdate, InterviewResponse
 from app.crud import interview as interview_crud
 
@@ -14,21 +15,26 @@ router = APIRouter()
 
 @router.get("/", response_model=List[InterviewResponse])
 def list_interviews(
+    response: Response,
+    status_filter: Optional[InterviewStatus] = Query(None, alias="status"),
+    page: PageRequest = Depends(page_params(list(interview_crud.INTERVIEW_SORTS))),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all interviews for the current user"""
-    interviews = interview_crud.get_interviews_by_user(db, current_user.id)
-    return interviews
+    """Get the current user's interviews a page at a time"""
+    interviews = interview_crud.get_interviews_by_user(db, current_user.id, page, status=status_filter)
+    return page_response(response, interviews)
 
 @router.get("/upcoming", response_model=List[InterviewResponse])
 def get_upcoming_interviews(
+    response: Response,
+    page: PageRequest = Depends(page_params(["scheduled_at"], default_order="asc")),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get upcoming interviews for the current user"""
-    interviews = interview_crud.get_upcoming_interviews(db, current_user.id)
-    return interviews
+    """Get upcoming interviews for the current user, soonest first"""
+    interviews = interview_crud.get_upcoming_interviews(db, current_user.id, page)
+    return page_response(response, interviews)
 
 @router.get("/{interview_id}", response_model=InterviewResponse)
 def get_interview(
@@ -69,11 +75,9 @@ def update_interview(
     db: Session = Depends(get_db)
 ):
     """Update an interview"""
-    interview = interview_crud.get_interview(db, interview_id)
-    if not interview or interview.user_id != current_user.id:
+    updated_interview = interview_crud.update_interview(db, interview_id, interview_update, owner_id=current_user.id)
+    if not updated_interview:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview not found")
-    
-    updated_interview = interview_crud.update_interview(db, interview_id, interview_update)
     return updated_interview
 
 @router.delete("/{interview_id}")
@@ -98,15 +102,14 @@ def update_interview_status(
     db: Session = Depends(get_db)
 ):
     """Update interview status"""
-    interview = interview_crud.get_interview(db, interview_id)
-    if not interview or interview.user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview not found")
-    
     from app.models.interview import InterviewStatus
     status_value = status_update.get("status")
     try:
         new_status = InterviewStatus(status_value)
-        updated_interview = interview_crud.update_interview_status(db, interview_id, new_status)
-        return updated_interview
     except ValueError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status value")
+
+    updated_interview = interview_crud.update_interview_status(db, interview_id, new_status, owner_id=current_user.id)
+    if not updated_interview:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview not found")
+    return updated_interview
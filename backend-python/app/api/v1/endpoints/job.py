@@ -1,62 +1,154 @@
 """JobForge AI - Job Endpoints"""
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
+from app.core import replicas
+from app.core.compression import cached_json_response
+from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User
-from app.api.deps import get_current_user
-from app.schemas.job import JobCreate, JobUpdate, JobResponse
+from app.api.deps import get_current_user, get_read_db
+from app.schemas.job import (
+    JobCreate, JobUpdate, JobResponse, JobBulkIngestResponse, JobBatchEnrichResponse, SkillCountResponse,
+    JobFilters, FacetedJobSearchResponse,
+)
 from app.crud import job as job_crud
-from app.services.job_enrichment import JobEnrichmentError
+from app.services import job_cache
 
 router = APIRouter()
 
+def _skill_params(skills: Optional[List[str]]) -> Optional[List[str]]:
+    """Accept both ?skills=a&skills=b and ?skills=a,b"""
+    if not skills:
+        return None
+    return [part for value in skills for part in value.split(",") if part.strip()]
+
 @router.get("/", response_model=List[JobResponse])
 def list_jobs(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db)
+    skills: Optional[List[str]] = Query(None, description="Only jobs requiring all of these skills"),
+    filters: JobFilters = Depends(),
+    db: Session = Depends(get_read_db)
 ):
     """Get all active jobs"""
-    jobs = job_crud.get_jobs(db, skip=skip, limit=limit)
-    return jobs
+    skills = _skill_params(skills)
+    payload = job_cache.cached_job_list(
+        skip, limit, lambda: job_crud.get_jobs(db, skip=skip, limit=limit, skills=skills, filters=filters),
+        skills, filters, from_replica=replicas.is_replica_session(db),
+    )
+    return cached_json_response(request, payload, settings.JOB_CACHE_TTL_SECONDS)
 
 @router.get("/search", response_model=List[JobResponse])
 def search_jobs(
+    request: Request,
     q: str = Query(..., min_length=1),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db)
+    skills: Optional[List[str]] = Query(None, description="Only jobs requiring all of these skills"),
+    filters: JobFilters = Depends(),
+    db: Session = Depends(get_read_db)
 ):
     """Search jobs by title, company, or location"""
-    jobs = job_crud.search_jobs(db, q, skip=skip, limit=limit)
-    return jobs
+    skills = _skill_params(skills)
+    payload = job_cache.cached_job_search(
+        q, skip, limit, lambda: job_crud.search_jobs(db, q, skip=skip, limit=limit, skills=skills, filters=filters),
+        skills, filters, from_replica=replicas.is_replica_session(db),
+    )
+    return cached_json_response(request, payload, settings.JOB_CACHE_TTL_SECONDS)
+
+@router.get("/faceted", response_model=FacetedJobSearchResponse)
+def faceted_search_jobs(
+    request: Request,
+    q: Optional[str] = Query(None, min_length=1),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    skills: Optional[List[str]] = Query(None, description="Only jobs requiring all of these skills"),
+    filters: JobFilters = Depends(),
+    db: Session = Depends(get_read_db)
+):
+    """Filtered jobs with total and per-facet counts for the whole match"""
+    skills = _skill_params(skills)
+    payload = job_cache.cached_faceted_search(
+        q, skip, limit,
+        lambda: job_crud.faceted_search_jobs(db, q, skip=skip, limit=limit, skills=skills, filters=filters),
+        skills, filters, from_replica=replicas.is_replica_session(db),
+    )
+    return cached_json_response(request, payload, settings.JOB_CACHE_TTL_SECONDS)
+
+@router.get("/export")
+def export_jobs(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    q: Optional[str] = Query(None, min_length=1),
+    skills: Optional[List[str]] = Query(None, description="Only jobs requiring all of these skills"),
+    filters: JobFilters = Depends(),
+    current_user: User = Depends(get_current_user)
+):
+    """Download every listed job matching the search as CSV or NDJSON"""
+    from app.services.export import export_response
+
+    skills = _skill_params(skills)
+    return export_response(
+        lambda db: job_crud.export_jobs_query(db, q, skills=skills, filters=filters), format, "jobs"
+    )
+
+@router.get("/skills/top", response_model=List[SkillCountResponse])
+def top_skills(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_read_db)
+):
+    """Most requested skills with the number of active jobs asking for each"""
+    payload = job_cache.cached_top_skills(
+        limit, lambda: job_crud.get_top_skills(db, limit=limit), from_replica=replicas.is_replica_session(db)
+    )
+    return cached_json_response(request, payload, settings.JOB_CACHE_TTL_SECONDS)
 
 @router.get("/{job_id}", response_model=JobResponse)
 def get_job(
+    request: Request,
     job_id: UUID,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get a specific job"""
-    job = job_crud.get_job(db, job_id)
-    if not job:
+    payload = job_cache.cached_job_detail(
+        job_id, lambda: job_crud.get_job(db, job_id), from_replica=replicas.is_replica_session(db)
+    )
+    if payload is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-    return job
+    return cached_json_response(request, payload, settings.JOB_CACHE_TTL_SECONDS)
+
+@router.post("/enrich/batch", response_model=JobBatchEnrichResponse, status_code=status.HTTP_202_ACCEPTED)
+def reenrich_jobs(
+    background_tasks: BackgroundTasks,
+    limit: int = Query(50, ge=1, le=500),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Queue re-enrichment of jobs whose content changed since their last enrichment"""
+    stale_ids, counts = job_crud.find_stale_jobs(db, limit=limit)
+    if stale_ids:
+        background_tasks.add_task(job_crud.reenrich_jobs, stale_ids)
+    return JobBatchEnrichResponse(**counts, queued=len(stale_ids))
 
 @router.post("/{job_id}/enrich", response_model=JobResponse)
 def enrich_job(
     job_id: UUID,
+    force: bool = Query(False, description="Re-run enrichment even if the content is unchanged"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Trigger AI enrichment for a job posting."""
+    from app.services.job_enrichment import JobEnrichmentError
+
     job = job_crud.get_job(db, job_id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
 
     try:
-        enriched_job = job_crud.enrich_job_listing(db, job_id)
+        enriched_job = job_crud.enrich_job_listing(db, job_id, force=force)
     except JobEnrichmentError as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -73,9 +165,27 @@ def create_job(
 ):
     """Create a new job (admin only)"""
     # In a real app, check if user is admin
-    job = job_crud.create_job(db, job_data)
+    try:
+        job = job_crud.create_job(db, job_data)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
     return job
 
+@router.post("/bulk", response_model=JobBulkIngestResponse)
+async def bulk_ingest_jobs(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Bulk upsert jobs from an NDJSON or JSON array body, keyed on source_url (admin only)"""
+    from app.services.job_ingest import JobIngestError, ingest_job_stream
+
+    try:
+        result = await ingest_job_stream(db, request.stream(), request.headers.get("content-type"))
+    except JobIngestError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return result
+
 @router.put("/{job_id}", response_model=JobResponse)
 def update_job(
     job_id: UUID,
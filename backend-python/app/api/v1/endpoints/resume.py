@@ -1,29 +1,34 @@
 """JobForge AI - Resume Endpoints"""
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Body
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Body, Request, Query, Response
 from sqlalchemy.orm import Session
 from typing import List
+from datetime import datetime
 from uuid import UUID
 from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, page_params, page_response
+from app.crud.pagination import PageRequest
 from app.models.user import User
+from app.models.job import Job
 from app.models.resume import Resume
-from app.schemas.resume import ResumeCreate, ResumeUpdate, ResumeResponse, ResumeAnalysisRequest
+from app.schemas.job import JobMatchResponse, JobResponse
+from app.schemas.resume import (
+    ResumeCreate, ResumeUpdate, ResumeResponse, ResumeAnalysisRequest, SignedUrlResponse,
+    ResumeBatchAnalysisRequest, ResumeBatchAnalysisResponse, ResumeJobAnalysisResponse,
+)
 from app.crud import resume as resume_crud
-from app.services.file_storage import save_resume_file, resolve_file_path
-from app.services.resume_processing import extract_text_from_file
-from app.services.resume_analysis import analyze_resume_text, ResumeAnalysisError
 
 router = APIRouter()
 
 @router.get("/", response_model=List[ResumeResponse])
 def list_resumes(
+    response: Response,
+    page: PageRequest = Depends(page_params(list(resume_crud.RESUME_SORTS))),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all resumes for the current user"""
-    resumes = resume_crud.get_resumes_by_user(db, current_user.id)
-    return resumes
+    """Get the current user's resumes a page at a time"""
+    resumes = resume_crud.get_resumes_by_user(db, current_user.id, page)
+    return page_response(response, resumes)
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
 def get_resume(
@@ -45,6 +50,9 @@ async def upload_resume(
     db: Session = Depends(get_db)
 ):
     """Upload a new resume"""
+    from app.services.file_storage import save_resume_file
+    from app.services.resume_processing import extract_text_from_file
+
     file_bytes = await file.read()
     stored_path, relative_url = save_resume_file(
         user_id=current_user.id,
@@ -71,11 +79,9 @@ def update_resume(
     db: Session = Depends(get_db)
 ):
     """Update a resume"""
-    resume = resume_crud.get_resume(db, resume_id)
-    if not resume or resume.user_id != current_user.id:
+    updated_resume = resume_crud.update_resume(db, resume_id, resume_update, owner_id=current_user.id)
+    if not updated_resume:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
-    
-    updated_resume = resume_crud.update_resume(db, resume_id, resume_update)
     return updated_resume
 
 @router.delete("/{resume_id}")
@@ -99,11 +105,9 @@ def set_primary_resume(
     db: Session = Depends(get_db)
 ):
     """Set a resume as primary"""
-    resume = resume_crud.get_resume(db, resume_id)
-    if not resume or resume.user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
-    
     updated_resume = resume_crud.set_primary_resume(db, current_user.id, resume_id)
+    if not updated_resume:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
     return updated_resume
 
 @router.post("/{resume_id}/analyze", response_model=ResumeResponse)
@@ -114,6 +118,10 @@ def analyze_resume(
     db: Session = Depends(get_db)
 ):
     """Analyze a resume (AI-powered)"""
+    from app.services.file_storage import resolve_file_path
+    from app.services.resume_processing import extract_text_from_file
+    from app.services.resume_analysis import analyze_resume_text, ResumeAnalysisError
+
     resume = resume_crud.get_resume(db, resume_id)
     if not resume or resume.user_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
@@ -151,13 +159,99 @@ def analyze_resume(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to save analysis results")
     return updated_resume
 
+@router.post("/{resume_id}/analyze/batch", response_model=ResumeBatchAnalysisResponse)
+def analyze_resume_batch(
+    resume_id: UUID,
+    analysis_input: ResumeBatchAnalysisRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Analyze a resume against several jobs at once and store one result per job"""
+    from app.services.resume_analysis import analyze_resume_for_jobs, ResumeAnalysisError
+
+    resume = resume_crud.get_resume(db, resume_id)
+    if not resume or resume.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
+    if not resume.raw_text:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Resume text not available. Please re-upload your resume."
+        )
+
+    job_ids = list(dict.fromkeys(analysis_input.job_ids))
+    jobs = db.query(Job).filter(Job.id.in_(job_ids)).all()
+    missing = set(job_ids) - {job.id for job in jobs}
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Jobs not found: {', '.join(sorted(str(job_id) for job_id in missing))}"
+        )
+
+    try:
+        results = analyze_resume_for_jobs(resume.raw_text, jobs)
+    except ResumeAnalysisError as exc:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc))
+
+    analyses = resume_crud.save_job_analyses(db, resume_id, results)
+    return ResumeBatchAnalysisResponse(
+        resume_id=resume_id,
+        results=[ResumeJobAnalysisResponse.model_validate(analysis) for analysis in analyses],
+        failed_job_ids=[job_id for job_id in job_ids if job_id not in results],
+    )
+
+@router.get("/{resume_id}/analyses", response_model=List[ResumeJobAnalysisResponse])
+def list_resume_job_analyses(
+    resume_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Stored per-job analyses for a resume, most recent first"""
+    resume = resume_crud.get_resume(db, resume_id)
+    if not resume or resume.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
+    return resume_crud.get_job_analyses(db, resume_id)
+
+@router.get("/{resume_id}/ranked-jobs", response_model=List[JobMatchResponse])
+def get_ranked_jobs(
+    resume_id: UUID,
+    limit: int = Query(20, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Rank active jobs by local match score against this resume"""
+    from app.services.match_scoring import rank_jobs
+
+    resume = resume_crud.get_resume(db, resume_id)
+    if not resume or resume.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
+    if not resume.raw_text:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Resume text is missing; upload or parse resume first.")
+
+    ranked = rank_jobs(db, resume.raw_text, limit)
+    if ranked is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Job matching is warming up; try again shortly.",
+            headers={"Retry-After": "5"},
+        )
+    jobs = {job.id: job for job in db.query(Job).filter(Job.id.in_([job_id for job_id, _ in ranked]))}
+    return [
+        JobMatchResponse(job=JobResponse.model_validate(jobs[job_id]), match_score=score)
+        for job_id, score in ranked
+        if job_id in jobs
+    ]
+
 @router.get("/{resume_id}/download")
 def download_resume(
     resume_id: UUID,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Download the original resume file"""
+    from app.services.file_storage import resolve_file_path
+    from app.services.file_delivery import build_file_response
+
     resume = resume_crud.get_resume(db, resume_id)
     if not resume or resume.user_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
@@ -166,8 +260,22 @@ def download_resume(
 
     file_path = resolve_file_path(resume.file_url)
     media_type = resume.file_type or "application/octet-stream"
-    return FileResponse(
-        path=file_path,
-        media_type=media_type,
-        filename=file_path.name
-    )
+    return build_file_response(request, file_path, media_type, filename=file_path.name)
+
+@router.get("/{resume_id}/download-url", response_model=SignedUrlResponse)
+def get_resume_download_url(
+    resume_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Issue a short-lived signed link to the resume file that needs no auth or DB lookup"""
+    from app.services.file_delivery import sign_file_url
+
+    resume = resume_crud.get_resume(db, resume_id)
+    if not resume or resume.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
+    if not resume.file_url:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No file stored for this resume")
+
+    url, expires = sign_file_url(resume.file_url)
+    return SignedUrlResponse(url=url, expires_at=datetime.utcfromtimestamp(expires))
@@ -0,0 +1,100 @@
+"""JobForge AI - Saved Search Endpoints"""
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from uuid import UUID
+from app.core.database import get_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.schemas.job import JobResponse
+from app.schemas.saved_search import (
+    SavedSearchCreate, SavedSearchUpdate, SavedSearchResponse, SavedSearchFeedItem,
+)
+from app.crud import saved_search as saved_search_crud
+from app.crud.pagination import InvalidCursorError
+
+router = APIRouter()
+
+@router.get("/", response_model=List[SavedSearchResponse])
+def list_saved_searches(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get all saved searches for the current user"""
+    return saved_search_crud.get_saved_searches_by_user(db, current_user.id)
+
+@router.get("/feed", response_model=List[SavedSearchFeedItem])
+def get_feed(
+    after: Optional[str] = Query(None, description="Only items after this feed item's cursor"),
+    limit: int = Query(50, ge=1, le=200),
+    saved_search_id: Optional[UUID] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """New jobs matching the user's saved searches; poll with the last seen cursor as ``after``"""
+    position = None
+    if after:
+        try:
+            position = saved_search_crud.decode_feed_cursor(after)
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    rows = saved_search_crud.get_feed(
+        db, current_user.id, after=position, limit=limit, saved_search_id=saved_search_id
+    )
+    return [
+        SavedSearchFeedItem(
+            id=match.id,
+            cursor=saved_search_crud.encode_feed_cursor(match),
+            saved_search_id=match.saved_search_id,
+            matched_at=match.matched_at,
+            job=JobResponse.model_validate(job),
+        )
+        for match, job in rows
+    ]
+
+@router.get("/{saved_search_id}", response_model=SavedSearchResponse)
+def get_saved_search(
+    saved_search_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get a specific saved search"""
+    saved_search = saved_search_crud.get_saved_search(db, saved_search_id)
+    if not saved_search or saved_search.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Saved search not found")
+    return saved_search
+
+@router.post("/", response_model=SavedSearchResponse, status_code=status.HTTP_201_CREATED)
+def create_saved_search(
+    saved_search_data: SavedSearchCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Save a search; jobs ingested from now on that match it appear in the feed"""
+    return saved_search_crud.create_saved_search(db, saved_search_data, current_user.id)
+
+@router.put("/{saved_search_id}", response_model=SavedSearchResponse)
+def update_saved_search(
+    saved_search_id: UUID,
+    saved_search_update: SavedSearchUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Update a saved search"""
+    saved_search = saved_search_crud.get_saved_search(db, saved_search_id)
+    if not saved_search or saved_search.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Saved search not found")
+    return saved_search_crud.update_saved_search(db, saved_search_id, saved_search_update)
+
+@router.delete("/{saved_search_id}")
+def delete_saved_search(
+    saved_search_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete a saved search and its feed items"""
+    saved_search = saved_search_crud.get_saved_search(db, saved_search_id)
+    if not saved_search or saved_search.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Saved search not found")
+    saved_search_crud.delete_saved_search(db, saved_search_id)
+    return {"message": "Saved search deleted successfully"}
@@ -0,0 +1,328 @@
+"""JobForge AI - Shared Cache Layer
+
+Read-through cache backed by Redis with an in-process fallback. Entries live
+under versioned namespaces so a write can invalidate every derived key with a
+single INCR, and loads are single-flighted (per process and across workers)
+with probabilistic early refresh so hot keys never expire all at once.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import random
+import secrets
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Logical TTL is extended by this factor for the physical TTL so a stale value
+# can still be served while one caller refreshes it.
+STALE_TTL_FACTOR = 2
+# XFetch beta; values > 1 favour earlier recomputation.
+EARLY_REFRESH_BETA = 1.0
+LOCK_TIMEOUT_SECONDS = 10.0
+LOCK_WAIT_SECONDS = 2.0
+LOCAL_MAX_ENTRIES = 10_000
+
+
+class _LocalBackend:
+    """Thread-safe in-process store used when Redis is unavailable."""
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key: str) -> Optional[bytes]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.time():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._live(key)
+
+    def _prune(self) -> None:
+        if len(self._data) < LOCAL_MAX_ENTRIES:
+            return
+        now = time.time()
+        for key in [k for k, (expires_at, _) in self._data.items() if expires_at < now]:
+            del self._data[key]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._prune()
+            self._data[key] = (time.time() + ttl, value)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        with self._lock:
+            if self._live(key) is not None:
+                return False
+            self._data[key] = (time.time() + ttl, value)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_if(self, key: str, value: bytes) -> None:
+        with self._lock:
+            if self._live(key) == value:
+                del self._data[key]
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            current = int(self._live(key) or 0) + 1
+            self._data[key] = (float("inf"), str(current).encode())
+            return current
+
+
+# Compare-and-delete, so a lock is only released by the holder that set it.
+_DELETE_IF_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class _RedisBackend:
+    """Redis store; every error degrades to a cache miss instead of a 500."""
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+        self._delete_if = client.register_script(_DELETE_IF_SCRIPT)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._client.get(key)
+        except Exception:
+            logger.warning("Redis GET failed for %s", key, exc_info=True)
+            return None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        try:
+            self._client.set(key, value, px=int(ttl * 1000))
+        except Exception:
+            logger.warning("Redis SET failed for %s", key, exc_info=True)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        try:
+            return bool(self._client.set(key, value, px=int(ttl * 1000), nx=True))
+        except Exception:
+            logger.warning("Redis SET NX failed for %s", key, exc_info=True)
+            return True
+
+    def delete(self, key: str) -> None:
+        try:
+            self._client.delete(key)
+        except Exception:
+            logger.warning("Redis DEL failed for %s", key, exc_info=True)
+
+    def delete_if(self, key: str, value: bytes) -> None:
+        try:
+            self._delete_if(keys=[key], args=[value])
+        except Exception:
+            logger.warning("Redis compare-and-delete failed for %s", key, exc_info=True)
+
+    def incr(self, key: str) -> int:
+        try:
+            return int(self._client.incr(key))
+        except Exception:
+            logger.warning("Redis INCR failed for %s", key, exc_info=True)
+            return int(time.time() * 1000)
+
+
+_backend: Optional[Any] = None
+_backend_lock = threading.Lock()
+_local_flights: Dict[str, threading.Lock] = {}
+_local_flights_lock = threading.Lock()
+
+
+def get_backend():
+    """Return the shared cache backend, connecting to Redis on first use."""
+    global _backend
+    if _backend is not None:
+        return _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = _connect()
+    return _backend
+
+
+def _connect():
+    if not settings.CACHE_ENABLED or not settings.REDIS_URL:
+        return _LocalBackend()
+    try:
+        import redis
+
+        client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+        client.ping()
+        return _RedisBackend(client)
+    except Exception:
+        logger.warning("Redis unavailable; using in-process cache", exc_info=True)
+        return _LocalBackend()
+
+
+def make_key(namespace: str, *parts: Any) -> str:
+    """Build a versioned cache key; bumping the namespace orphans every old key."""
+    version = namespace_version(namespace)
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.sha1(raw.encode()).hexdigest()
+    return f"jf:{namespace}:v{version}:{digest}"
+
+
+def namespace_version(namespace: str) -> int:
+    value = get_backend().get(f"jf:{namespace}:version")
+    return int(value) if value else 0
+
+
+def bump_namespace(namespace: str) -> None:
+    """Invalidate every key built from ``namespace``."""
+    backend = get_backend()
+    backend.incr(f"jf:{namespace}:version")
+    # Replicas can lag this write; see ``recently_written``.
+    backend.set(f"jf:{namespace}:written", b"1", settings.READ_YOUR_WRITES_SECONDS)
+
+
+def recently_written(namespace: str) -> bool:
+    """Whether ``namespace`` was bumped within READ_YOUR_WRITES_SECONDS.
+
+    While it was, a value loaded from a replica may predate the write and must
+    not be stored under the new version.
+    """
+    return get_backend().get(f"jf:{namespace}:written") is not None
+
+
+def _pack(payload: bytes, ttl: float, delta: float) -> bytes:
+    return f"{time.time() + ttl:.3f}:{delta:.4f}:".encode() + payload
+
+
+def _unpack(entry: bytes) -> Tuple[float, float, bytes]:
+    expires_at, delta, payload = entry.split(b":", 2)
+    return float(expires_at), float(delta), payload
+
+
+def _is_fresh(expires_at: float, delta: float) -> bool:
+    # XFetch: recompute early with a probability that grows as expiry nears
+    # and with how expensive the value was to compute.
+    jitter = delta * EARLY_REFRESH_BETA * -math.log(random.random() or 1e-12)
+    return time.time() + jitter < expires_at
+
+
+def _local_flight(key: str) -> threading.Lock:
+    with _local_flights_lock:
+        lock = _local_flights.get(key)
+        if lock is None:
+            if len(_local_flights) >= LOCAL_MAX_ENTRIES:
+                for idle in [k for k, v in _local_flights.items() if not v.locked()]:
+                    del _local_flights[idle]
+            lock = _local_flights[key] = threading.Lock()
+        return lock
+
+
+def acquire_lock(name: str, ttl: float = LOCK_TIMEOUT_SECONDS) -> Optional[str]:
+    """
+    Try to take a cross-worker lock.
+
+    Returns the holder's token, needed to release it, or None if another
+    holder exists.
+    """
+    token = secrets.token_hex(16)
+    if get_backend().add(f"jf:lock:{name}", token.encode(), ttl):
+        return token
+    return None
+
+
+def release_lock(name: str, token: str) -> None:
+    """Release the lock if ``token`` still holds it; an expired lock may have a new owner."""
+    get_backend().delete_if(f"jf:lock:{name}", token.encode())
+
+
+def get_or_load(
+    key: str,
+    loader: Callable[[], Optional[bytes]],
+    ttl: Optional[float] = None,
+    store: bool = True,
+) -> Optional[bytes]:
+    """
+    Return the cached payload for ``key`` or compute it with ``loader``.
+
+    Only one caller per process (and, via Redis, per cluster) runs ``loader``
+    for a given key; concurrent callers either serve the stale value or wait
+    briefly for the fresh one. A loader returning ``None`` is not cached, and
+    with ``store=False`` a miss is loaded for this caller only.
+    """
+    ttl = ttl or settings.CACHE_DEFAULT_TTL_SECONDS
+    backend = get_backend()
+
+    stale: Optional[bytes] = None
+    entry = backend.get(key)
+    if entry is not None:
+        expires_at, delta, payload = _unpack(entry)
+        if _is_fresh(expires_at, delta):
+            return payload
+        stale = payload
+    if not store:
+        return loader()
+
+    flight = _local_flight(key)
+    if not flight.acquire(blocking=stale is None, timeout=LOCK_WAIT_SECONDS if stale is None else -1):
+        if stale is not None:
+            return stale
+        return _load_and_store(key, loader, ttl)
+    try:
+        if stale is None:
+            # Another thread may have filled the key while we waited.
+            entry = backend.get(key)
+            if entry is not None:
+                return _unpack(entry)[2]
+        token = acquire_lock(key)
+        if token is None:
+            if stale is not None:
+                return stale
+            filled = _wait_for(key)
+            if filled is not None:
+                return filled
+            # The holder is slow or gone; load without taking over its lock.
+            return _load_and_store(key, loader, ttl)
+        try:
+            return _load_and_store(key, loader, ttl)
+        finally:
+            release_lock(key, token)
+    finally:
+        flight.release()
+
+
+def _wait_for(key: str) -> Optional[bytes]:
+    backend = get_backend()
+    deadline = time.time() + LOCK_WAIT_SECONDS
+    while time.time() < deadline:
+        time.sleep(0.05)
+        entry = backend.get(key)
+        if entry is not None:
+            return _unpack(entry)[2]
+    return None
+
+
+def _load_and_store(key: str, loader: Callable[[], Optional[bytes]], ttl: float) -> Optional[bytes]:
+    started = time.time()
+    payload = loader()
+    if payload is None:
+        return None
+    delta = time.time() - started
+    get_backend().set(key, _pack(payload, ttl, delta), ttl * STALE_TTL_FACTOR)
+    return payload
@@ -0,0 +1,167 @@
+"""Response compression: gzip/brotli negotiated from Accept-Encoding.
+
+``CompressionMiddleware`` compresses compressible responses at or above
+``COMPRESSION_MINIMUM_SIZE`` bytes, streaming bodies included.
+``cached_json_response`` serves payloads that come from the cache layer: their
+compressed form is stored in the cache backend keyed by content digest, so a
+hot payload is compressed once per TTL rather than on every request. The
+middleware leaves responses that already carry Content-Encoding alone.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import zlib
+from functools import lru_cache
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import cache
+from app.core.config import settings
+
+COMPRESSIBLE_TYPES = (
+    "application/json", "application/x-ndjson", "application/javascript", "application/xml", "text/",
+)
+# Cached payloads are compressed once, so they can afford a denser setting.
+CACHED_GZIP_LEVEL = 9
+CACHED_BROTLI_QUALITY = 9
+
+
+@lru_cache()
+def _brotli():
+    try:
+        import brotli
+    except ImportError:  # pragma: no cover - brotli is pinned in requirements
+        return None
+    return brotli
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick ``br`` or ``gzip`` from an Accept-Encoding header, or None"""
+    accepted = set()
+    for part in (accept_encoding or "").lower().split(","):
+        name, _, params = part.partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip())
+    if "br" in accepted and _brotli() is not None:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    if encoding == "br":
+        return _brotli().compress(body, quality=level if level is not None else settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=level if level is not None else settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def cached_json_response(request: Request, payload: bytes, ttl: Optional[float] = None) -> Response:
+    """JSON response for a cached payload, compressed from the cache when the client allows it"""
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if encoding is None or len(payload) < settings.COMPRESSION_MINIMUM_SIZE:
+        return Response(content=payload, media_type="application/json", headers={"Vary": "Accept-Encoding"})
+    key = f"jf:compressed:{encoding}:{hashlib.sha1(payload).hexdigest()}"
+    backend = cache.get_backend()
+    body = backend.get(key)
+    if body is None:
+        level = CACHED_BROTLI_QUALITY if encoding == "br" else CACHED_GZIP_LEVEL
+        body = compress(payload, encoding, level)
+        backend.set(key, body, ttl or settings.CACHE_DEFAULT_TTL_SECONDS)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+    )
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str) -> None:
+        if encoding == "br":
+            self._compressor = _brotli().Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self.process, self.finish = self._compressor.process, self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self.process, self.finish = self._compressor.compress, self._compressor.flush
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressionResponder(self.app, encoding)(scope, receive, send)
+
+
+class _CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.send: Send
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_StreamCompressor] = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_wrapper)
+
+    def _should_compress(self, headers: Headers) -> bool:
+        if self.start["status"] in (204, 206, 304) or "content-encoding" in headers or "content-range" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def send_wrapper(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            self.passthrough = not self._should_compress(Headers(raw=message["headers"]))
+            if self.passthrough:
+                await self.send(message)
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            headers = MutableHeaders(raw=self.start["headers"])
+            if not more_body:
+                # Whole body in one message: compress it in one go, or not at all if small.
+                if len(body) >= settings.COMPRESSION_MINIMUM_SIZE:
+                    body = compress(body, self.encoding)
+                    headers["Content-Encoding"] = self.encoding
+                    headers["Content-Length"] = str(len(body))
+                    headers.add_vary_header("Accept-Encoding")
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            del headers["Content-Length"]
+            self.compressor = _StreamCompressor(self.encoding)
+            await self.send(self.start)
+
+        chunk = self.compressor.process(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        if chunk or not more_body:
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
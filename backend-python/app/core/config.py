@@ -12,8 +12,33 @@ class Settings(BaseSettings):
     PORT: int = 8000
     
     DATABASE_URL: str
+    # Read-only endpoints are spread over these when set (JSON list in env).
+    DATABASE_REPLICA_URLS: List[str] = []
+    REPLICA_MAX_LAG_SECONDS: float = 2.0
+    REPLICA_HEALTH_CHECK_SECONDS: int = 5
+    # How long a client's reads stay on the primary after it writes.
+    READ_YOUR_WRITES_SECONDS: int = 10
     DB_ECHO: bool = False
+    DB_AUTO_MIGRATE: bool = False
     REDIS_URL: str
+    CACHE_ENABLED: bool = True
+    CACHE_DEFAULT_TTL_SECONDS: int = 60
+    JOB_CACHE_TTL_SECONDS: int = 120
+    # How often the in-process match index is rebuilt in the background after job writes.
+    MATCH_INDEX_REFRESH_SECONDS: int = 300
+    # How often the unfiltered job facet counts are recomputed.
+    FACET_REFRESH_SECONDS: int = 300
+    # Also bounds how long a passed interview can linger in "upcoming".
+    DASHBOARD_CACHE_TTL_SECONDS: int = 60
+    # Jobs are deactivated this long after posted_date (created_at if unknown);
+    # inactive jobs without applications are then moved to jobs_archive.
+    JOB_EXPIRY_DAYS: int = 60
+    JOB_ARCHIVE_BATCH_SIZE: int = 500
+    JOB_LIFECYCLE_INTERVAL_SECONDS: int = 3600
+    # Responses smaller than this are sent uncompressed.
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
     QDRANT_URL: str
     QDRANT_COLLECTION_NAME: str = "resumes"
 
@@ -26,13 +51,43 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str
     OPENAI_BASE_URL: str = "https://openrouter.ai/api/v1"
     OPENAI_MODEL: str = "meta-llama/llama-3.1-8b-instruct"
+    PROMPT_MAX_TOKENS: int = 6000
+    # How long duplicate requests wait on another worker's identical in-flight completion.
+    LLM_COALESCE_WAIT_SECONDS: int = 90
+    # Upstream traffic control: per-request deadline, retries and AIMD concurrency bounds.
+    LLM_DEADLINE_SECONDS: int = 60
+    LLM_MAX_RETRIES: int = 3
+    LLM_CONCURRENCY_INITIAL: int = 8
+    LLM_CONCURRENCY_MIN: int = 1
+    LLM_CONCURRENCY_MAX: int = 32
+    LLM_LATENCY_TARGET_SECONDS: float = 20.0
+    # Providers tried in order; "fallback" is any OpenAI-compatible endpoint.
+    # Unconfigured providers are skipped.
+    LLM_PROVIDERS: List[str] = ["openai", "fallback", "anthropic"]
+    LLM_FALLBACK_BASE_URL: Optional[str] = None
+    LLM_FALLBACK_API_KEY: Optional[str] = None
+    LLM_FALLBACK_MODEL: Optional[str] = None
+    # Race the next provider when no first token arrives within the observed
+    # p95 (LLM_HEDGE_DELAY_SECONDS until enough samples exist).
+    LLM_HEDGE_ENABLED: bool = True
+    LLM_HEDGE_DELAY_SECONDS: float = 5.0
+    LLM_HEDGE_MIN_SECONDS: float = 1.0
+    # Enrichment calls in flight for one background re-enrichment batch.
+    JOB_REENRICH_CONCURRENCY: int = 4
 
-    # Optional (future)
+    # Optional failover provider
     ANTHROPIC_API_KEY: Optional[str] = None
+    ANTHROPIC_MODEL: str = "claude-3-haiku-20240307"
+    ANTHROPIC_BASE_URL: Optional[str] = None
     
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
     UPLOAD_DIR: str = "uploads"
     RESUME_UPLOAD_SUBDIR: str = "resumes"
+    # direct | x-accel-redirect (nginx) | x-sendfile (apache/lighttpd)
+    FILE_DELIVERY_MODE: str = "direct"
+    FILE_ACCEL_REDIRECT_PREFIX: str = "/protected-uploads"
+    SIGNED_URL_TTL_SECONDS: int = 300
+    SIGNED_URLS_REQUIRED: bool = False
     
     class Config:
         env_file = ".env"
@@ -42,4 +97,16 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     return Settings()
 
-settings = get_settings()
+class _LazySettings:
+    """Module-level ``settings`` that reads the environment on first attribute access, not at import."""
+
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(get_settings(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(get_settings(), name)
+
+settings = _LazySettings()
@@ -1,21 +1,38 @@
 """JobForge AI - Database Configuration"""
+from functools import lru_cache
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Generator, Optional
 from app.core.config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DB_ECHO,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
-)
+@lru_cache()
+def get_engine() -> Engine:
+    """The primary's engine, created on first use so importing this module needs no settings."""
+    return create_engine(
+        settings.DATABASE_URL,
+        echo=settings.DB_ECHO,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20
+    )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+class _PrimarySession(Session):
+    def __init__(self, **kwargs):
+        kwargs.setdefault("bind", get_engine())
+        super().__init__(**kwargs)
+
+SessionLocal = sessionmaker(class_=_PrimarySession, autocommit=False, autoflush=False)
 Base = declarative_base()
 
+def __getattr__(name: str):
+    # Keeps ``from app.core.database import engine`` working without building it at import.
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
@@ -23,24 +40,34 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+class SchemaOutOfDateError(RuntimeError):
+    """Raised at startup when the database is not at the alembic head this build ships."""
+
+
+def get_schema_revision() -> Optional[str]:
+    """Return the revision stamped in alembic_version, or None if unmigrated."""
+    with get_engine().connect() as conn:
+        try:
+            return conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+        except ProgrammingError:
+            return None
+
+
 def init_db() -> None:
-    Base.metadata.create_all(bind=engine)
-    _ensure_job_ai_columns()
-
-
-def _ensure_job_ai_columns() -> None:
-    """Backfill missing AI-related columns on the jobs table for existing databases."""
-    ddl_statements = [
-        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS raw_description TEXT",
-        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS ai_summary TEXT",
-        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS ai_highlights TEXT[]",
-        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS ai_required_skills TEXT[]",
-        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS ai_compensation VARCHAR(255)",
-        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS ai_remote_policy VARCHAR(255)",
-        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS ai_last_enriched_at TIMESTAMP",
-        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS validated_source_url VARCHAR",
-        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS source_site VARCHAR(100)",
-    ]
-    with engine.begin() as conn:
-        for stmt in ddl_statements:
-            conn.execute(text(stmt))
+    """
+    Verify the schema with a single query instead of running DDL on boot.
+
+    Migrations are applied out of band with ``python migrate.py upgrade``;
+    set DB_AUTO_MIGRATE for local development to apply them here instead.
+    """
+    from app.core.migrations import head_revision, upgrade_to_head
+
+    if settings.DB_AUTO_MIGRATE:
+        upgrade_to_head()
+        return
+    current, expected = get_schema_revision(), head_revision()
+    if current != expected:
+        raise SchemaOutOfDateError(
+            f"Database schema is at revision {current or 'none'}, expected {expected}. "
+            "Run `python migrate.py upgrade` before starting the API."
+        )
@@ -0,0 +1,47 @@
+"""JobForge AI - Schema Migrations
+
+Thin wrapper around Alembic so the migrate command, local auto-migration and
+init_db.py all apply the same versioned migration tree.
+"""
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from app.core.database import get_engine
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _config():
+    from alembic.config import Config
+
+    config = Config(str(BACKEND_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_ROOT / "alembic"))
+    return config
+
+
+@lru_cache()
+def head_revision() -> Optional[str]:
+    """The newest revision in alembic/versions: the schema this build of the code expects."""
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(_config()).get_current_head()
+
+
+def upgrade_to_head(revision: str = "head") -> None:
+    """Apply pending migrations inside one connection."""
+    from alembic import command
+
+    config = _config()
+    with get_engine().begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+
+
+def downgrade(revision: str) -> None:
+    from alembic import command
+
+    config = _config()
+    with get_engine().begin() as connection:
+        config.attributes["connection"] = connection
+        command.downgrade(config, revision)
@@ -0,0 +1,166 @@
+"""JobForge AI - Read Replica Routing
+
+Read-only endpoints take their session from ``get_read_db`` (app.api.deps),
+which hands out the healthy replicas in DATABASE_REPLICA_URLS round-robin.
+A periodic check marks a replica down when it fails or replays more than
+REPLICA_MAX_LAG_SECONDS behind the primary, and back up once it recovers;
+with no replica healthy, or none configured, reads go to the primary. A
+statement that fails on a replica with an OperationalError marks it down and
+is re-run on the primary, so the request is still answered.
+
+After a successful write by an authenticated user, a short-lived cache key
+keeps that user's reads on the primary (read-your-writes) for
+READ_YOUR_WRITES_SECONDS. The key follows the bearer token, so it holds
+however the client calls the API and across workers.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+from functools import lru_cache
+from typing import List, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core import cache
+from app.core.config import settings
+from app.core.database import get_engine
+from app.core.security import verify_token
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_PIN_KEY = "jf:read-primary:{user_id}"
+# Marks sessions handed out by a replica (Session.info).
+REPLICA_SESSION = "replica"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Seconds behind the primary. Zero once everything received has been
+# replayed, so a quiet primary does not read as lag; zero on a non-replica.
+LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class ReplicaSession(Session):
+    """Read session on a replica that moves to the primary when the replica fails."""
+
+    def __init__(self, replica: "Replica", **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.replica = replica
+
+    def _fail_over(self) -> None:
+        get_pool().mark_down(self.replica)
+        self.rollback()
+        self.bind = get_engine()
+        self.info[REPLICA_SESSION] = False
+
+    def _run(self, method, *args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        except OperationalError:
+            if not is_replica_session(self):
+                raise
+            self._fail_over()
+            return method(*args, **kwargs)
+
+    # Query, get() and lazy loads all go through execute().
+    def execute(self, *args, **kwargs):
+        return self._run(super().execute, *args, **kwargs)
+
+    def scalar(self, *args, **kwargs):
+        return self._run(super().scalar, *args, **kwargs)
+
+    def scalars(self, *args, **kwargs):
+        return self._run(super().scalars, *args, **kwargs)
+
+
+class Replica:
+    def __init__(self, url: str) -> None:
+        self.engine = create_engine(
+            url,
+            echo=settings.DB_ECHO,
+            pool_pre_ping=True,
+            pool_size=10,
+            max_overflow=20,
+        )
+        self.name = self.engine.url.render_as_string(hide_password=True)
+        self.healthy = True
+        self._sessionmaker = sessionmaker(class_=ReplicaSession, autocommit=False, autoflush=False, bind=self.engine)
+
+    def session(self) -> ReplicaSession:
+        return self._sessionmaker(replica=self, info={REPLICA_SESSION: True})
+
+    def lag_seconds(self) -> Optional[float]:
+        """Replay lag, or None if the replica cannot be queried."""
+        try:
+            with self.engine.connect() as conn:
+                return float(conn.execute(LAG_QUERY).scalar() or 0)
+        except SQLAlchemyError:
+            logger.warning("Replica %s is unreachable", self.name, exc_info=True)
+            return None
+
+
+class ReplicaPool:
+    def __init__(self, urls: List[str]) -> None:
+        self.replicas = [Replica(url) for url in urls]
+        self._turn = itertools.count()
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def next_healthy(self) -> Optional[Replica]:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._turn) % len(healthy)]
+
+    def mark_down(self, replica: Replica) -> None:
+        """Take a replica out of rotation until the next check finds it healthy."""
+        if replica.healthy:
+            logger.warning("Replica %s failed a query; routing reads elsewhere", replica.name)
+        replica.healthy = False
+
+    def check(self) -> None:
+        for replica in self.replicas:
+            lag = replica.lag_seconds()
+            healthy = lag is not None and lag <= settings.REPLICA_MAX_LAG_SECONDS
+            if healthy != replica.healthy:
+                logger.info("Replica %s is now %s (lag %s)", replica.name, "up" if healthy else "down", lag)
+            replica.healthy = healthy
+
+
+@lru_cache()
+def get_pool() -> ReplicaPool:
+    return ReplicaPool(settings.DATABASE_REPLICA_URLS)
+
+
+def check_replicas() -> None:
+    get_pool().check()
+
+
+def _request_user_id(request) -> Optional[str]:
+    """User id from the request's access token, decoded once per request."""
+    if not hasattr(request.state, "read_pin_user_id"):
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        payload = verify_token(token, token_type="access") if scheme.lower() == "bearer" and token else None
+        request.state.read_pin_user_id = payload.get("sub") if payload else None
+    return request.state.read_pin_user_id
+
+
+def pin_to_primary(request) -> None:
+    """Keep the requesting user's reads on the primary for READ_YOUR_WRITES_SECONDS."""
+    user_id = _request_user_id(request)
+    if user_id:
+        cache.get_backend().set(PRIMARY_PIN_KEY.format(user_id=user_id), b"1", settings.READ_YOUR_WRITES_SECONDS)
+
+
+def is_pinned_to_primary(request) -> bool:
+    user_id = _request_user_id(request)
+    return bool(user_id) and cache.get_backend().get(PRIMARY_PIN_KEY.format(user_id=user_id)) is not None
+
+
+def is_replica_session(db: Session) -> bool:
+    return bool(db.info.get(REPLICA_SESSION))
@@ -0,0 +1,28 @@
+"""Periodic background work run inside the API process."""
+import asyncio
+import logging
+from typing import Callable, List
+
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+
+async def _run_every(interval: float, func: Callable[[], None]) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(func)
+        except Exception:
+            logger.exception("Periodic task %s failed", func.__name__)
+
+
+def start_periodic(jobs: List[tuple]) -> List[asyncio.Task]:
+    """Start ``(interval_seconds, func)`` pairs; blocking funcs run in the threadpool."""
+    return [asyncio.create_task(_run_every(interval, func)) for interval, func in jobs]
+
+
+async def stop_periodic(tasks: List[asyncio.Task]) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
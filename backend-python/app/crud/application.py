@@ -1,15 +1,46 @@
 """JobForge AI - Application CRUD Operations"""
-from sqlalchemy.orm import Session
-from typing import Optional, List
-from uuid import UUID
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import Optional, List, Collection, Dict, Tuple
+from uuid import UUID, uuid4
 from app.models.application import Application, ApplicationStatus
+from app.models.job import Job
+from app.models.resume import Resume
 from app.schemas.application import ApplicationCreate, ApplicationUpdate
+from app.services.match_scoring import score_job
+from app.crud.base import commit_detached, update_returning
+from app.crud.pagination import Page, PageRequest, paginate
+from app.services.dashboard_cache import invalidate_dashboard
 
-def get_application(db: Session, application_id: UUID) -> Optional[Application]:
-    return db.query(Application).filter(Application.id == application_id).first()
+APPLICATION_SORTS = {"updated_at": Application.updated_at, "created_at": Application.created_at}
+# Related rows an application can be loaded with: one extra query per
+# collection (or a join for the job), however many applications are loaded.
+APPLICATION_INCLUDES = {
+    "job": joinedload(Application.job),
+    "interviews": selectinload(Application.interviews),
+}
 
-def get_applications_by_user(db: Session, user_id: UUID) -> List[Application]:
-    return db.query(Application).filter(Application.user_id == user_id).all()
+def _with_includes(query, include: Collection[str]):
+    return query.options(*[APPLICATION_INCLUDES[name] for name in include])
+
+def get_application(db: Session, application_id: UUID, include: Collection[str] = ()) -> Optional[Application]:
+    query = db.query(Application).filter(Application.id == application_id)
+    return _with_includes(query, include).first()
+
+def get_applications_by_user(
+    db: Session,
+    user_id: UUID,
+    page: Optional[PageRequest] = None,
+    status: Optional[ApplicationStatus] = None,
+    include: Collection[str] = (),
+) -> Page:
+    page = page or PageRequest()
+    page.sort = page.sort or "updated_at"
+    query = _with_includes(db.query(Application).filter(Application.user_id == user_id), include)
+    if status is not None:
+        query = query.filter(Application.status == status)
+    return paginate(query, APPLICATION_SORTS[page.sort], Application.id, page)
 
 def get_applications_by_status(db: Session, user_id: UUID, status: ApplicationStatus) -> List[Application]:
     return db.query(Application).filter(
@@ -17,6 +48,23 @@ def get_applications_by_status(db: Session, user_id: UUID, status: ApplicationSt
         Application.status == status
     ).all()
 
+def get_scoring_resume_text(db: Session, user_id: UUID) -> Optional[str]:
+    """Text of the user's primary (or latest) resume, used for match scores"""
+    row = db.query(Resume.raw_text).filter(
+        Resume.user_id == user_id,
+        Resume.raw_text.isnot(None)
+    ).order_by(Resume.is_primary.desc().nullslast(), Resume.created_at.desc()).first()
+    return row.raw_text if row else None
+
+def _match_score(db: Session, user_id: UUID, job_id: Optional[UUID]) -> Optional[float]:
+    """Score the user's primary (or latest) resume against the linked job"""
+    if not job_id:
+        return None
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        return None
+    return score_job(db, get_scoring_resume_text(db, user_id), job)
+
 def create_application(db: Session, application: ApplicationCreate, user_id: UUID) -> Application:
     db_application = Application(
         user_id=user_id,
@@ -27,22 +75,32 @@ def create_application(db: Session, application: ApplicationCreate, user_id: UUI
         applied_date=application.applied_date,
         source=application.source,
         notes=application.notes,
-        job_id=application.job_id
+        job_id=application.job_id,
+        match_score=_match_score(db, user_id, application.job_id)
     )
     db.add(db_application)
-    db.commit()
-    db.refresh(db_application)
+    commit_detached(db, db_application)
+    invalidate_dashboard(user_id)
     return db_application
 
-def update_application(db: Session, application_id: UUID, application_update: ApplicationUpdate) -> Optional[Application]:
-    db_application = get_application(db, application_id)
-    if not db_application:
-        return None
+def update_application(
+    db: Session, application_id: UUID, application_update: ApplicationUpdate, owner_id: Optional[UUID] = None
+) -> Optional[Application]:
+    """
+    Apply the update in one UPDATE ... RETURNING, restricted to ``owner_id``'s
+    rows when given. Unless the caller set ``match_score``, the linked job is
+    then rescored against the user's current resume; a second UPDATE is only
+    issued when the score moved.
+    """
     update_data = application_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_application, field, value)
-    db.commit()
-    db.refresh(db_application)
+    db_application = update_returning(db, Application, application_id, update_data, owner_id=owner_id)
+    if db_application is not None and "match_score" not in update_data:
+        score = _match_score(db, db_application.user_id, db_application.job_id)
+        if score is not None and score != db_application.match_score:
+            db_application = update_returning(db, Application, application_id, {"match_score": score})
+    db_application = commit_detached(db, db_application)
+    if db_application:
+        invalidate_dashboard(db_application.user_id)
     return db_application
 
 def delete_application(db: Session, application_id: UUID) -> bool:
@@ -51,30 +109,95 @@ def delete_application(db: Session, application_id: UUID) -> bool:
         return False
     db.delete(db_application)
     db.commit()
+    invalidate_dashboard(db_application.user_id)
     return True
 
-def update_application_status(db: Session, application_id: UUID, status: ApplicationStatus) -> Optional[Application]:
-    db_application = get_application(db, application_id)
-    if not db_application:
-        return None
-    db_application.status = status
-    db.commit()
-    db.refresh(db_application)
+def update_application_status(
+    db: Session, application_id: UUID, status: ApplicationStatus, owner_id: Optional[UUID] = None
+) -> Optional[Application]:
+    db_application = commit_detached(
+        db, update_returning(db, Application, application_id, {"status": status}, owner_id=owner_id)
+    )
+    if db_application:
+        invalidate_dashboard(db_application.user_id)
     return db_application
 
 def get_application_stats(db: Session, user_id: UUID) -> dict:
     """Get summary statistics for user's applications"""
-    total = db.query(Application).filter(Application.user_id == user_id).count()
-    
-    by_status = {}
-    for status in ApplicationStatus:
-        count = db.query(Application).filter(
-            Application.user_id == user_id,
-            Application.status == status
-        ).count()
-        by_status[status.value] = count
-    
+    counts = dict(
+        db.query(Application.status, func.count())
+        .filter(Application.user_id == user_id)
+        .group_by(Application.status)
+        .all()
+    )
+    by_status = {status.value: counts.get(status, 0) for status in ApplicationStatus}
+    total = sum(by_status.values())
+
     return {
         "total": total,
         "by_status": by_status
     }
+
+def bulk_insert_applications(
+    db: Session,
+    user_id: UUID,
+    applications: List[Tuple[int, ApplicationCreate]],
+    resume_text: Optional[str] = None,
+) -> Dict:
+    """
+    Insert ``(position, application)`` pairs with one multi-row INSERT.
+
+    Rows without a job_id are linked to the job whose source_url equals their
+    job_url; rows naming an unknown job_id are rejected. Linked rows get a
+    match score against ``resume_text``. Caller is responsible for committing.
+    """
+    job_ids = {app.job_id for _, app in applications if app.job_id}
+    urls = {app.job_url.strip() for _, app in applications if not app.job_id and app.job_url}
+    jobs = db.query(
+        Job.id, Job.source_url, Job.title, Job.description, Job.raw_description,
+        Job.requirements, Job.ai_required_skills,
+    ).filter(Job.id.in_(job_ids) | Job.source_url.in_(urls)).all() if job_ids or urls else []
+    by_id = {job.id: job for job in jobs}
+    by_url = {job.source_url: job for job in jobs if job.source_url}
+
+    rows: List[Dict] = []
+    rejected: List[Tuple[int, str]] = []
+    linked = 0
+    for position, app in applications:
+        if app.job_id:
+            job = by_id.get(app.job_id)
+            if job is None:
+                rejected.append((position, f"job_id: unknown job {app.job_id}"))
+                continue
+        else:
+            job = by_url.get(app.job_url.strip()) if app.job_url else None
+        linked += job is not None
+        rows.append({
+            "id": uuid4(),
+            "user_id": user_id,
+            "company_name": app.company_name,
+            "job_title": app.job_title,
+            "job_url": app.job_url,
+            "status": ApplicationStatus(app.status.value) if app.status else ApplicationStatus.DRAFT,
+            "applied_date": app.applied_date,
+            "source": app.source,
+            "notes": app.notes,
+            "job_id": job.id if job is not None else None,
+            "match_score": score_job(db, resume_text, job) if job is not None else None,
+        })
+    if rows:
+        db.execute(insert(Application).values(rows))
+    return {"inserted": len(rows), "linked": linked, "rejected": rejected}
+
+# Columns written by application exports, in output order.
+EXPORT_COLUMNS = [
+    Application.id, Application.company_name, Application.job_title, Application.job_url,
+    Application.status, Application.applied_date, Application.source, Application.notes,
+    Application.match_score, Application.job_id, Application.created_at, Application.updated_at,
+]
+
+def export_applications_query(db: Session, user_id: UUID):
+    """The user's applications as plain column tuples, oldest first, for streaming exports"""
+    return db.query(*EXPORT_COLUMNS).filter(Application.user_id == user_id).order_by(
+        Application.created_at, Application.id
+    )
@@ -0,0 +1,41 @@
+"""Single-round-trip write helpers shared by the CRUD modules.
+
+``update_returning`` applies an update as one ``UPDATE ... RETURNING`` that
+also carries the ownership check, replacing SELECT + setattr + refresh.
+``commit_detached`` commits without expiring the returned object, so reading
+it afterwards does not cost another SELECT. Detached objects must not be used
+to lazy-load relationships.
+"""
+from typing import Any, Dict, Optional, Type, TypeVar
+from uuid import UUID
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+ModelT = TypeVar("ModelT")
+
+def update_returning(
+    db: Session,
+    model: Type[ModelT],
+    object_id: UUID,
+    values: Dict[str, Any],
+    owner_id: Optional[UUID] = None,
+) -> Optional[ModelT]:
+    """
+    Update one row by id (and ``user_id`` when ``owner_id`` is given) and
+    return it, or None if no such row. Does not commit.
+    """
+    criteria = [model.id == object_id]
+    if owner_id is not None:
+        criteria.append(model.user_id == owner_id)
+    if not values:
+        return db.query(model).filter(*criteria).first()
+    stmt = update(model).where(*criteria).values(**values).returning(model)
+    return db.scalars(stmt, execution_options={"populate_existing": True}).first()
+
+def commit_detached(db: Session, obj: Optional[ModelT]) -> Optional[ModelT]:
+    """Flush, detach ``obj`` with its loaded state and commit"""
+    if obj is not None:
+        db.flush()
+        db.expunge(obj)
+    db.commit()
+    return obj
@@ -4,24 +4,42 @@ from typing import Optional, List
 from uuid import UUID
 from app.models.interview import Interview, InterviewStatus
 from app.schemas.interview import InterviewCreate, InterviewUpdate
+from app.crud.base import commit_detached, update_returning
+from app.crud.pagination import Page, PageRequest, paginate
+from app.services.dashboard_cache import invalidate_dashboard
+
+INTERVIEW_SORTS = {"scheduled_at": Interview.scheduled_at, "created_at": Interview.created_at}
 
 def get_interview(db: Session, interview_id: UUID) -> Optional[Interview]:
     return db.query(Interview).filter(Interview.id == interview_id).first()
 
-def get_interviews_by_user(db: Session, user_id: UUID) -> List[Interview]:
-    return db.query(Interview).filter(Interview.user_id == user_id).all()
+def get_interviews_by_user(
+    db: Session,
+    user_id: UUID,
+    page: Optional[PageRequest] = None,
+    status: Optional[InterviewStatus] = None,
+) -> Page:
+    page = page or PageRequest()
+    page.sort = page.sort or "scheduled_at"
+    query = db.query(Interview).filter(Interview.user_id == user_id)
+    if status is not None:
+        query = query.filter(Interview.status == status)
+    return paginate(query, INTERVIEW_SORTS[page.sort], Interview.id, page)
 
 def get_interviews_by_application(db: Session, application_id: UUID) -> List[Interview]:
     return db.query(Interview).filter(Interview.application_id == application_id).all()
 
-def get_upcoming_interviews(db: Session, user_id: UUID) -> List[Interview]:
-    """Get upcoming scheduled interviews"""
+def get_upcoming_interviews(db: Session, user_id: UUID, page: Optional[PageRequest] = None) -> Page:
+    """Get upcoming scheduled interviews, soonest first"""
     from datetime import datetime
-    return db.query(Interview).filter(
+    page = page or PageRequest(descending=False)
+    page.sort = "scheduled_at"
+    query = db.query(Interview).filter(
         Interview.user_id == user_id,
         Interview.status == InterviewStatus.SCHEDULED,
         Interview.scheduled_at >= datetime.utcnow()
-    ).all()
+    )
+    return paginate(query, Interview.scheduled_at, Interview.id, page)
 
 def create_interview(db: Session, interview: InterviewCreate, user_id: UUID) -> Interview:
     db_interview = Interview(
@@ -37,19 +55,20 @@ def create_interview(db: Session, interview: InterviewCreate, user_id: UUID) ->
         notes=interview.notes
     )
     db.add(db_interview)
-    db.commit()
-    db.refresh(db_interview)
+    commit_detached(db, db_interview)
+    invalidate_dashboard(user_id)
     return db_interview
 
-def update_interview(db: Session, interview_id: UUID, interview_update: InterviewUpdate) -> Optional[Interview]:
-    db_interview = get_interview(db, interview_id)
-    if not db_interview:
-        return None
+def update_interview(
+    db: Session, interview_id: UUID, interview_update: InterviewUpdate, owner_id: Optional[UUID] = None
+) -> Optional[Interview]:
+    """Apply the update in one UPDATE ... RETURNING, restricted to ``owner_id``'s rows when given"""
     update_data = interview_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_interview, field, value)
-    db.commit()
-    db.refresh(db_interview)
+    db_interview = commit_detached(
+        db, update_returning(db, Interview, interview_id, update_data, owner_id=owner_id)
+    )
+    if db_interview:
+        invalidate_dashboard(db_interview.user_id)
     return db_interview
 
 def delete_interview(db: Session, interview_id: UUID) -> bool:
@@ -58,13 +77,15 @@ def delete_interview(db: Session, interview_id: UUID) -> bool:
         return False
     db.delete(db_interview)
     db.commit()
+    invalidate_dashboard(db_interview.user_id)
     return True
 
-def update_interview_status(db: Session, interview_id: UUID, status: InterviewStatus) -> Optional[Interview]:
-    db_interview = get_interview(db, interview_id)
-    if not db_interview:
-        return None
-    db_interview.status = status
-    db.commit()
-    db.refresh(db_interview)
+def update_interview_status(
+    db: Session, interview_id: UUID, status: InterviewStatus, owner_id: Optional[UUID] = None
+) -> Optional[Interview]:
+    db_interview = commit_detached(
+        db, update_returning(db, Interview, interview_id, {"status": status}, owner_id=owner_id)
+    )
+    if db_interview:
+        invalidate_dashboard(db_interview.user_id)
     return db_interview
@@ -1,27 +1,137 @@
 """JobForge AI - Job CRUD Operations"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from sqlalchemy import func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import Optional, List
-from uuid import UUID
-from app.models.job import Job
-from app.schemas.job import JobCreate, JobUpdate
-from app.services.job_enrichment import enrich_job_posting
+from typing import Optional, List, Dict, Tuple
+from uuid import UUID, uuid4
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.job import Job, JobSkillCount
+from app.schemas.job import JobCreate, JobUpdate, JobFilters
+from app.services.job_enrichment import JobEnrichmentError, enrich_job_posting, enrichment_content_hash
+from app.services.job_cache import invalidate_jobs
+from app.services.job_dedupe import assign_duplicate_clusters, promote_canonical
+from app.services.job_facets import compute_facets, precomputed_facets
+from app.services.percolator import percolate_jobs
+from app.services.skills import normalize_skills
+from app.crud.base import commit_detached, update_returning
+
+logger = logging.getLogger(__name__)
+
+# Fields that feed the duplicate-detection signature.
+_SIGNATURE_FIELDS = {"title", "company", "description", "raw_description"}
 
 def get_job(db: Session, job_id: UUID) -> Optional[Job]:
     return db.query(Job).filter(Job.id == job_id).first()
 
-def get_jobs(db: Session, skip: int = 0, limit: int = 100) -> List[Job]:
-    return db.query(Job).filter(Job.is_active == True).offset(skip).limit(limit).all()
+def _filter_skills(query, skills: Optional[List[str]]):
+    """Require every given skill via array containment on the GIN-indexed column"""
+    normalized = normalize_skills(skills)
+    if normalized:
+        query = query.filter(Job.skills_normalized.contains(normalized))
+    return query
+
+def _apply_filters(query, filters: Optional[JobFilters]):
+    """Narrow a job query by the structured filters; salary ranges match on overlap"""
+    if filters is None:
+        return query
+    for column in ("remote_type", "job_type", "experience_level", "source_site"):
+        value = getattr(filters, column)
+        if value:
+            query = query.filter(getattr(Job, column) == value)
+    if filters.salary_min is not None:
+        query = query.filter(func.coalesce(Job.salary_max, Job.salary_min) >= filters.salary_min)
+    if filters.salary_max is not None:
+        query = query.filter(func.coalesce(Job.salary_min, Job.salary_max) <= filters.salary_max)
+    if filters.posted_after is not None:
+        query = query.filter(Job.posted_date >= filters.posted_after)
+    if filters.posted_before is not None:
+        query = query.filter(Job.posted_date < filters.posted_before)
+    return query
 
-def search_jobs(db: Session, query: str, skip: int = 0, limit: int = 100) -> List[Job]:
-    """Search jobs by title, company, or location"""
-    search_term = f"%{query}%"
-    return db.query(Job).filter(
+def _listing_query(
+    db: Session,
+    query: Optional[str] = None,
+    skills: Optional[List[str]] = None,
+    filters: Optional[JobFilters] = None,
+):
+    """Active jobs, one row per duplicate cluster, narrowed by search text, skills and filters"""
+    results = db.query(Job).filter(
         Job.is_active == True,
-        (Job.title.ilike(search_term) | 
-         Job.company.ilike(search_term) | 
-         Job.location.ilike(search_term))
-    ).offset(skip).limit(limit).all()
+        Job.canonical_job_id.is_(None)
+    )
+    if query:
+        search_term = f"%{query}%"
+        results = results.filter(
+            Job.title.ilike(search_term) |
+            Job.company.ilike(search_term) |
+            Job.location.ilike(search_term)
+        )
+    return _apply_filters(_filter_skills(results, skills), filters)
+
+def get_jobs(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    skills: Optional[List[str]] = None,
+    filters: Optional[JobFilters] = None,
+) -> List[Job]:
+    """List active jobs, one row per duplicate cluster"""
+    return _listing_query(db, skills=skills, filters=filters).offset(skip).limit(limit).all()
+
+def search_jobs(
+    db: Session,
+    query: str,
+    skip: int = 0,
+    limit: int = 100,
+    skills: Optional[List[str]] = None,
+    filters: Optional[JobFilters] = None,
+) -> List[Job]:
+    """Search jobs by title, company, or location, one row per duplicate cluster"""
+    return _listing_query(db, query, skills, filters).offset(skip).limit(limit).all()
+
+def faceted_search_jobs(
+    db: Session,
+    query: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 20,
+    skills: Optional[List[str]] = None,
+    filters: Optional[JobFilters] = None,
+) -> Dict:
+    """One page of matching jobs plus total and facet counts for the whole match"""
+    results = _listing_query(db, query, skills, filters)
+    if not query and not normalize_skills(skills) and (filters is None or filters.is_empty()):
+        total, facets = precomputed_facets(db)
+    else:
+        total, facets = compute_facets(db, results)
+    items = results.order_by(Job.posted_date.desc().nullslast(), Job.id).offset(skip).limit(limit).all()
+    return {"total": total, "items": items, "facets": facets}
+
+# Columns written by job exports, in output order.
+EXPORT_COLUMNS = [
+    Job.id, Job.title, Job.company, Job.location, Job.remote_type, Job.job_type,
+    Job.experience_level, Job.salary_min, Job.salary_max, Job.source_site, Job.source_url,
+    Job.skills_normalized, Job.posted_date, Job.created_at,
+]
+
+def export_jobs_query(
+    db: Session,
+    query: Optional[str] = None,
+    skills: Optional[List[str]] = None,
+    filters: Optional[JobFilters] = None,
+):
+    """Listed jobs as plain column tuples in a stable order, for streaming exports"""
+    return _listing_query(db, query, skills, filters).with_entities(*EXPORT_COLUMNS).order_by(Job.id)
+
+def get_top_skills(db: Session, limit: int = 50) -> List[JobSkillCount]:
+    """Most common skills across active jobs, read from the periodically recounted aggregate"""
+    return db.query(JobSkillCount).filter(
+        JobSkillCount.job_count > 0
+    ).order_by(JobSkillCount.job_count.desc(), JobSkillCount.skill).limit(limit).all()
 
 def create_job(db: Session, job: JobCreate) -> Job:
     db_job = Job(
@@ -45,22 +155,113 @@ def create_job(db: Session, job: JobCreate) -> Job:
         ai_compensation=job.ai_compensation,
         ai_remote_policy=job.ai_remote_policy,
         ai_last_enriched_at=job.ai_last_enriched_at,
+        skills_normalized=normalize_skills(job.ai_required_skills),
         posted_date=job.posted_date
     )
-    db.add(db_job)
-    db.commit()
+    try:
+        db.add(db_job)
+        db.flush()
+        assign_duplicate_clusters(db, [db_job.id])
+        percolate_jobs(db, [db_job.id])
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise ValueError("A job with this source URL already exists")
     db.refresh(db_job)
+    invalidate_jobs()
     return db_job
 
+# Columns refreshed from the incoming row when an existing source_url is re-ingested.
+_UPSERT_COLUMNS = [
+    "title", "company", "location", "remote_type", "description", "requirements",
+    "raw_description", "salary_min", "salary_max", "job_type", "experience_level",
+    "validated_source_url", "source_site", "posted_date",
+]
+# AI columns only overwrite stored values when the incoming row carries them,
+# so a re-scrape does not wipe a previous enrichment.
+_UPSERT_AI_COLUMNS = [
+    "ai_summary", "ai_highlights", "ai_required_skills", "ai_compensation",
+    "ai_remote_policy", "ai_last_enriched_at", "skills_normalized",
+]
+
+def _job_row(job: JobCreate) -> Dict:
+    row = job.model_dump(include=set(_UPSERT_COLUMNS + _UPSERT_AI_COLUMNS) | {"source_url"})
+    row["id"] = uuid4()
+    row["is_active"] = True
+    row["validated_source_url"] = job.validated_source_url or job.source_url
+    row["skills_normalized"] = normalize_skills(job.ai_required_skills)
+    return row
+
+def bulk_upsert_jobs(db: Session, jobs: List[JobCreate]) -> Dict[str, int]:
+    """
+    Write a chunk of jobs with one multi-row INSERT ... ON CONFLICT (source_url).
+
+    Rows whose content matches the stored job are left untouched and counted
+    as skipped, as are repeated source URLs within the same chunk (last wins).
+    Written rows are clustered with their near-duplicates, and newly inserted
+    ones are matched against saved searches. Caller is responsible for
+    committing.
+    """
+    keyed: Dict[str, Dict] = {}
+    unkeyed: List[Dict] = []
+    for job in jobs:
+        row = _job_row(job)
+        if row["source_url"]:
+            keyed[row["source_url"]] = row
+        else:
+            unkeyed.append(row)
+    counts = {"inserted": 0, "updated": 0, "skipped": len(jobs) - len(keyed) - len(unkeyed)}
+    written_ids: List[UUID] = []
+    inserted_ids: List[UUID] = []
+
+    if keyed:
+        stmt = insert(Job).values(list(keyed.values()))
+        excluded = stmt.excluded
+        set_ = {name: excluded[name] for name in _UPSERT_COLUMNS}
+        set_.update({
+            name: func.coalesce(excluded[name], getattr(Job, name))
+            for name in _UPSERT_AI_COLUMNS
+        })
+        set_["is_active"] = True
+        changed = or_(
+            Job.is_active.is_distinct_from(True),
+            *[getattr(Job, name).is_distinct_from(value) for name, value in set_.items() if name != "is_active"],
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Job.source_url],
+            set_=set_,
+            where=changed,
+        ).returning(Job.id, literal_column("(xmax = 0)").label("inserted"))
+        written = db.execute(stmt).all()
+        inserted = sum(1 for row in written if row.inserted)
+        counts["inserted"] += inserted
+        counts["updated"] += len(written) - inserted
+        counts["skipped"] += len(keyed) - len(written)
+        written_ids.extend(row.id for row in written)
+        inserted_ids.extend(row.id for row in written if row.inserted)
+
+    if unkeyed:
+        db.execute(insert(Job).values(unkeyed))
+        counts["inserted"] += len(unkeyed)
+        written_ids.extend(row["id"] for row in unkeyed)
+        inserted_ids.extend(row["id"] for row in unkeyed)
+
+    assign_duplicate_clusters(db, written_ids)
+    percolate_jobs(db, inserted_ids)
+    return counts
+
 def update_job(db: Session, job_id: UUID, job_update: JobUpdate) -> Optional[Job]:
-    db_job = get_job(db, job_id)
+    update_data = job_update.dict(exclude_unset=True)
+    if "ai_required_skills" in update_data:
+        update_data["skills_normalized"] = normalize_skills(update_data["ai_required_skills"])
+    db_job = update_returning(db, Job, job_id, update_data)
     if not db_job:
         return None
-    update_data = job_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_job, field, value)
-    db.commit()
-    db.refresh(db_job)
+    if _SIGNATURE_FIELDS & update_data.keys():
+        assign_duplicate_clusters(db, [job_id])
+        db.refresh(db_job)  # clustering may have moved canonical_job_id
+    commit_detached(db, db_job)
+    invalidate_jobs()
     return db_job
 
 def delete_job(db: Session, job_id: UUID) -> bool:
@@ -68,27 +269,108 @@ def delete_job(db: Session, job_id: UUID) -> bool:
     if not db_job:
         return False
     db_job.is_active = False
+    if db_job.canonical_job_id is None:
+        promote_canonical(db, job_id)
     db.commit()
+    invalidate_jobs()
     return True
 
-def enrich_job_listing(db: Session, job_id: UUID) -> Job:
-    job = get_job(db, job_id)
-    if not job:
+def enrich_job_listing(db: Session, job_id: UUID, force: bool = False) -> Job:
+    """
+    Enrich a job's cluster; duplicates delegate to their canonical job.
+
+    A no-op when the prompt inputs hash to the value stored by the last
+    enrichment, unless ``force`` is set. Returns the requested job, not the
+    canonical one it delegated to.
+    """
+    requested = get_job(db, job_id)
+    if not requested:
         raise ValueError("Job not found")
+    job = requested
+    if requested.canonical_job_id:
+        job = get_job(db, requested.canonical_job_id) or requested
+
+    content_hash = enrichment_content_hash(job)
+    if not force and job.ai_summary and job.ai_content_hash == content_hash:
+        return requested
 
+    _apply_enrichment(job, content_hash)
+    db.add(job)
+    db.commit()
+    db.refresh(requested)
+    invalidate_jobs()
+    return requested
+
+def _apply_enrichment(job: Job, content_hash: str) -> None:
     enrichment = enrich_job_posting(job)
 
     job.ai_summary = enrichment.summary
     job.ai_highlights = enrichment.highlights or None
     job.ai_required_skills = enrichment.required_skills or None
+    job.skills_normalized = normalize_skills(job.ai_required_skills)
     job.ai_compensation = enrichment.compensation
     job.ai_remote_policy = enrichment.remote_policy
     job.validated_source_url = (
         enrichment.validated_url or job.validated_source_url or job.source_url
     )
     job.ai_last_enriched_at = datetime.utcnow()
+    job.ai_content_hash = content_hash
 
-    db.add(job)
-    db.commit()
-    db.refresh(job)
-    return job
+def find_stale_jobs(db: Session, limit: int = 50) -> Tuple[List[UUID], Dict[str, int]]:
+    """
+    Ids of up to ``limit`` active canonical jobs whose content changed since
+    their last enrichment, with checked/unchanged counts. No LLM calls.
+    """
+    counts = {"checked": 0, "unchanged": 0}
+    # Hash from plain column tuples so the scan does not fill the identity map.
+    rows = db.execute(
+        select(
+            Job.id, Job.title, Job.company, Job.location, Job.remote_type, Job.job_type,
+            Job.salary_min, Job.salary_max, Job.raw_description, Job.description,
+            Job.requirements, Job.ai_summary, Job.ai_content_hash
+        ).where(
+            Job.is_active == True,
+            Job.canonical_job_id.is_(None)
+        ).order_by(Job.created_at).execution_options(yield_per=1000)
+    )
+    stale_ids: List[UUID] = []
+    try:
+        for row in rows:
+            counts["checked"] += 1
+            if row.ai_summary and row.ai_content_hash == enrichment_content_hash(row):
+                counts["unchanged"] += 1
+                continue
+            stale_ids.append(row.id)
+            if len(stale_ids) >= limit:
+                break
+    finally:
+        # Stopping early would otherwise leave the server-side cursor open.
+        rows.close()
+    return stale_ids, counts
+
+def reenrich_jobs(job_ids: List[UUID]) -> Dict[str, int]:
+    """
+    Re-enrich ``job_ids`` with at most JOB_REENRICH_CONCURRENCY LLM calls in
+    flight, each job in its own session and transaction. Meant to run in the
+    background after find_stale_jobs.
+    """
+    def reenrich(job_id: UUID) -> bool:
+        with SessionLocal() as db:
+            job = get_job(db, job_id)
+            if not job:
+                return False
+            try:
+                _apply_enrichment(job, enrichment_content_hash(job))
+            except JobEnrichmentError:
+                logger.warning("Re-enrichment of job %s failed", job_id, exc_info=True)
+                return False
+            db.commit()
+            return True
+
+    with ThreadPoolExecutor(max_workers=settings.JOB_REENRICH_CONCURRENCY) as pool:
+        results = list(pool.map(reenrich, job_ids))
+    counts = {"enriched": sum(results), "failed": len(results) - sum(results)}
+    if counts["enriched"]:
+        invalidate_jobs()
+    logger.info("Re-enriched %d jobs, %d failed", counts["enriched"], counts["failed"])
+    return counts
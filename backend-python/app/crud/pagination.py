@@ -0,0 +1,62 @@
+"""Keyset pagination for per-user collections.
+
+Pages are ordered by a timestamp column with the primary key as tie-breaker
+and continue from an opaque cursor holding the last row's ``(sort value,
+id)``, so each page is an index range scan on ``(user_id, ..., sort, id)``
+however deep the client pages.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import tuple_
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or was issued for a different ordering."""
+
+@dataclass
+class PageRequest:
+    limit: int = 50
+    sort: Optional[str] = None  # None uses the collection's default ordering
+    descending: bool = True
+    after: Optional[Tuple[datetime, UUID]] = None
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str]
+
+def encode_cursor(sort: str, descending: bool, value: datetime, row_id: UUID) -> str:
+    raw = json.dumps([sort, "desc" if descending else "asc", value.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, sort: str, descending: bool) -> Tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, order, value, row_id = json.loads(raw)
+        decoded = datetime.fromisoformat(value), UUID(row_id)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+    if cursor_sort != sort or order != ("desc" if descending else "asc"):
+        raise InvalidCursorError("Cursor was issued for a different sort order")
+    return decoded
+
+def paginate(query, sort_column, id_column, page: PageRequest) -> Page:
+    """Apply keyset ordering, the cursor bound and the limit to ``query``"""
+    if page.after is not None:
+        key, bound = tuple_(sort_column, id_column), tuple_(*page.after)
+        query = query.filter(key < bound if page.descending else key > bound)
+    if page.descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    rows = query.limit(page.limit + 1).all()
+    if len(rows) <= page.limit:
+        return Page(rows, None)
+    last = rows[page.limit - 1]
+    return Page(
+        rows[:page.limit],
+        encode_cursor(page.sort, page.descending, getattr(last, sort_column.key), getattr(last, id_column.key)),
+    )
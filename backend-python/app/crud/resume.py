@@ -1,15 +1,25 @@
 """JobForge AI - Resume CRUD Operations"""
-from sqlalchemy.orm import Session
-from typing import Optional, List
-from uuid import UUID
-from app.models.resume import Resume
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased
+from typing import Optional, List, Dict
+from uuid import UUID, uuid4
+from app.models.resume import Resume, ResumeJobAnalysis
 from app.schemas.resume import ResumeCreate, ResumeUpdate
+from app.crud.base import commit_detached, update_returning
+from app.crud.pagination import Page, PageRequest, paginate
+from app.services.dashboard_cache import invalidate_dashboard
+
+RESUME_SORTS = {"updated_at": Resume.updated_at, "created_at": Resume.created_at}
 
 def get_resume(db: Session, resume_id: UUID) -> Optional[Resume]:
     return db.query(Resume).filter(Resume.id == resume_id).first()
 
-def get_resumes_by_user(db: Session, user_id: UUID) -> List[Resume]:
-    return db.query(Resume).filter(Resume.user_id == user_id).all()
+def get_resumes_by_user(db: Session, user_id: UUID, page: Optional[PageRequest] = None) -> Page:
+    page = page or PageRequest()
+    page.sort = page.sort or "updated_at"
+    query = db.query(Resume).filter(Resume.user_id == user_id)
+    return paginate(query, RESUME_SORTS[page.sort], Resume.id, page)
 
 def get_primary_resume(db: Session, user_id: UUID) -> Optional[Resume]:
     return db.query(Resume).filter(
@@ -18,8 +28,15 @@ def get_primary_resume(db: Session, user_id: UUID) -> Optional[Resume]:
     ).first()
 
 def create_resume(db: Session, resume: ResumeCreate, user_id: UUID) -> Resume:
-    has_existing_resume = db.query(Resume.id).filter(Resume.user_id == user_id).first() is not None
-    should_be_primary = bool(resume.is_primary) or not has_existing_resume
+    """Insert the resume, demoting the current primary if it takes over, in one transaction"""
+    if resume.is_primary:
+        should_be_primary = True
+        db.query(Resume).filter(
+            Resume.user_id == user_id,
+            Resume.is_primary == True
+        ).update({"is_primary": False}, synchronize_session=False)
+    else:
+        should_be_primary = db.query(Resume.id).filter(Resume.user_id == user_id).first() is None
 
     db_resume = Resume(
         user_id=user_id,
@@ -30,22 +47,18 @@ def create_resume(db: Session, resume: ResumeCreate, user_id: UUID) -> Resume:
         is_primary=should_be_primary,
     )
     db.add(db_resume)
-    db.commit()
-    db.refresh(db_resume)
-
-    if should_be_primary:
-        db_resume = set_primary_resume(db, user_id, db_resume.id) or db_resume
+    commit_detached(db, db_resume)
+    invalidate_dashboard(user_id)
     return db_resume
 
-def update_resume(db: Session, resume_id: UUID, resume_update: ResumeUpdate) -> Optional[Resume]:
-    db_resume = get_resume(db, resume_id)
-    if not db_resume:
-        return None
+def update_resume(
+    db: Session, resume_id: UUID, resume_update: ResumeUpdate, owner_id: Optional[UUID] = None
+) -> Optional[Resume]:
+    """Apply the update in one UPDATE ... RETURNING, restricted to ``owner_id``'s rows when given"""
     update_data = resume_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_resume, field, value)
-    db.commit()
-    db.refresh(db_resume)
+    db_resume = commit_detached(db, update_returning(db, Resume, resume_id, update_data, owner_id=owner_id))
+    if db_resume:
+        invalidate_dashboard(db_resume.user_id)
     return db_resume
 
 def delete_resume(db: Session, resume_id: UUID) -> bool:
@@ -54,20 +67,55 @@ def delete_resume(db: Session, resume_id: UUID) -> bool:
         return False
     db.delete(db_resume)
     db.commit()
+    invalidate_dashboard(db_resume.user_id)
     return True
 
 def set_primary_resume(db: Session, user_id: UUID, resume_id: UUID) -> Optional[Resume]:
-    # Remove primary from all other resumes
-    db.query(Resume).filter(
-        Resume.user_id == user_id, 
-        Resume.is_primary == True
-    ).update({"is_primary": False})
-    
-    # Set new primary
-    db_resume = get_resume(db, resume_id)
-    if db_resume and db_resume.user_id == user_id:
-        db_resume.is_primary = True
-        db.commit()
-        db.refresh(db_resume)
-        return db_resume
-    return None
+    """
+    Make ``resume_id`` the user's only primary resume with a single UPDATE.
+
+    Touches only the target and the current primary, and nothing at all if
+    the resume does not belong to the user (returns None).
+    """
+    owned = aliased(Resume)
+    stmt = update(Resume).where(
+        Resume.user_id == user_id,
+        (Resume.is_primary == True) | (Resume.id == resume_id),
+        select(owned.id).where(owned.id == resume_id, owned.user_id == user_id).exists(),
+    ).values(is_primary=(Resume.id == resume_id)).returning(Resume)
+    rows = db.scalars(stmt, execution_options={"populate_existing": True}).all()
+    db_resume = next((row for row in rows if row.id == resume_id), None)
+    commit_detached(db, db_resume)
+    if db_resume:
+        invalidate_dashboard(user_id)
+    return db_resume
+
+def get_job_analyses(db: Session, resume_id: UUID) -> List[ResumeJobAnalysis]:
+    return db.query(ResumeJobAnalysis).filter(
+        ResumeJobAnalysis.resume_id == resume_id
+    ).order_by(ResumeJobAnalysis.updated_at.desc()).all()
+
+def save_job_analyses(db: Session, resume_id: UUID, results: Dict[UUID, dict]) -> List[ResumeJobAnalysis]:
+    """Upsert per-job analysis results for a resume in a single statement"""
+    if not results:
+        return []
+    rows = [
+        {"id": uuid4(), "resume_id": resume_id, "job_id": job_id, **result}
+        for job_id, result in results.items()
+    ]
+    stmt = insert(ResumeJobAnalysis).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_resume_job_analyses_resume_job",
+        set_={
+            **{name: stmt.excluded[name] for name in (
+                "ats_score", "keyword_match_score", "strengths",
+                "weaknesses", "suggestions", "missing_keywords",
+            )},
+            "updated_at": func.now(),
+        },
+    ).returning(ResumeJobAnalysis)
+    analyses = db.scalars(
+        stmt, execution_options={"populate_existing": True}
+    ).all()
+    db.commit()
+    return analyses
@@ -0,0 +1,114 @@
+"""JobForge AI - Saved Search CRUD Operations"""
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session, aliased
+from typing import Optional, List, Tuple
+from uuid import UUID
+from app.crud.pagination import InvalidCursorError
+from app.models.job import Job
+from app.models.saved_search import SavedSearch, SavedSearchMatch
+from app.schemas.saved_search import SavedSearchCreate, SavedSearchUpdate
+from app.services.percolator import invalidate_saved_searches
+from app.services.skills import normalize_skills
+
+def get_saved_search(db: Session, saved_search_id: UUID) -> Optional[SavedSearch]:
+    return db.query(SavedSearch).filter(SavedSearch.id == saved_search_id).first()
+
+def get_saved_searches_by_user(db: Session, user_id: UUID) -> List[SavedSearch]:
+    return db.query(SavedSearch).filter(SavedSearch.user_id == user_id).order_by(SavedSearch.created_at).all()
+
+def create_saved_search(db: Session, saved_search: SavedSearchCreate, user_id: UUID) -> SavedSearch:
+    db_saved_search = SavedSearch(
+        user_id=user_id,
+        name=saved_search.name,
+        query=saved_search.query,
+        skills=normalize_skills(saved_search.skills),
+        filters=saved_search.filters.model_dump(mode="json", exclude_none=True) or None,
+    )
+    db.add(db_saved_search)
+    db.commit()
+    db.refresh(db_saved_search)
+    invalidate_saved_searches()
+    return db_saved_search
+
+def update_saved_search(db: Session, saved_search_id: UUID, saved_search_update: SavedSearchUpdate) -> Optional[SavedSearch]:
+    db_saved_search = get_saved_search(db, saved_search_id)
+    if not db_saved_search:
+        return None
+    update_data = saved_search_update.model_dump(exclude_unset=True)
+    if "skills" in update_data:
+        update_data["skills"] = normalize_skills(update_data["skills"])
+    if "filters" in update_data:
+        filters = saved_search_update.filters
+        update_data["filters"] = (filters.model_dump(mode="json", exclude_none=True) or None) if filters else None
+    for field, value in update_data.items():
+        setattr(db_saved_search, field, value)
+    db.commit()
+    db.refresh(db_saved_search)
+    invalidate_saved_searches()
+    return db_saved_search
+
+def delete_saved_search(db: Session, saved_search_id: UUID) -> bool:
+    db_saved_search = get_saved_search(db, saved_search_id)
+    if not db_saved_search:
+        return False
+    db.delete(db_saved_search)
+    db.commit()
+    invalidate_saved_searches()
+    return True
+
+def encode_feed_cursor(match: SavedSearchMatch) -> str:
+    return f"{match.xact_id}.{match.id}"
+
+def decode_feed_cursor(cursor: str) -> Tuple[Optional[int], int]:
+    """
+    ``(xact_id, id)`` from a cursor. A bare integer is a match id issued
+    before revision 0010; its xact_id is None and ``get_feed`` looks it up.
+    """
+    try:
+        if cursor.isdigit():
+            return None, int(cursor)
+        xact_id, match_id = cursor.split(".")
+        return int(xact_id), int(match_id)
+    except ValueError as exc:
+        raise InvalidCursorError("Malformed feed cursor") from exc
+
+def _legacy_xact_id(user_id: UUID, match_id: int):
+    """
+    xact_id for a bare match id cursor: its own row's; if it was deleted, the
+    next row's, or the latest earlier row's when the client had caught up.
+    """
+    # Aliased so the subqueries do not correlate with the feed query's rows.
+    match = aliased(SavedSearchMatch)
+    mine = match.user_id == user_id
+    own = select(match.xact_id).where(mine, match.id == match_id).scalar_subquery()
+    following = select(func.min(match.xact_id)).where(mine, match.id > match_id).scalar_subquery()
+    earlier = select(func.max(match.xact_id)).where(mine, match.id < match_id).scalar_subquery()
+    return func.coalesce(own, following, earlier, 0)
+
+def get_feed(
+    db: Session,
+    user_id: UUID,
+    after: Optional[Tuple[Optional[int], int]] = None,
+    limit: int = 50,
+    saved_search_id: Optional[UUID] = None,
+) -> List[Tuple[SavedSearchMatch, Job]]:
+    """
+    Matches after the ``(xact_id, id)`` cursor, in commit-safe order, with their jobs.
+
+    Only rows from transactions older than every transaction still running
+    are returned, so a long ingest that commits later can never land behind
+    a cursor a client has already moved past; its rows show up once it ends.
+    """
+    horizon = select(func.txid_snapshot_xmin(func.txid_current_snapshot())).scalar_subquery()
+    query = db.query(SavedSearchMatch, Job).join(Job, Job.id == SavedSearchMatch.job_id).filter(
+        SavedSearchMatch.user_id == user_id,
+        SavedSearchMatch.xact_id < horizon
+    )
+    if after is not None:
+        xact_id, match_id = after
+        if xact_id is None:
+            xact_id = _legacy_xact_id(user_id, match_id)
+        query = query.filter(tuple_(SavedSearchMatch.xact_id, SavedSearchMatch.id) > tuple_(xact_id, match_id))
+    if saved_search_id is not None:
+        query = query.filter(SavedSearchMatch.saved_search_id == saved_search_id)
+    return query.order_by(SavedSearchMatch.xact_id, SavedSearchMatch.id).limit(limit).all()
@@ -7,6 +7,7 @@ from datetime import datetime
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import get_password_hash, verify_password
+from app.crud.base import commit_detached, update_returning
 
 def get_user_by_id(db: Session, user_id: UUID) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
@@ -34,15 +35,8 @@ def create_user(db: Session, user: UserCreate) -> User:
         raise ValueError("Email already registered")
 
 def update_user(db: Session, user_id: UUID, user_update: UserUpdate) -> Optional[User]:
-    db_user = get_user_by_id(db, user_id)
-    if not db_user:
-        return None
     update_data = user_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_user, field, value)
-    db.commit()
-    db.refresh(db_user)
-    return db_user
+    return commit_detached(db, update_returning(db, User, user_id, update_data))
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     user = get_user_by_email(db, email)
@@ -3,12 +3,14 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 from contextlib import asynccontextmanager
 import time
-from pathlib import Path
 from app.core.config import settings
 from app.core.database import init_db
+from app.core import replicas
+from app.core.tasks import start_periodic, stop_periodic
+from app.core.compression import CompressionMiddleware
 import app.models
 from app.api.v1.endpoints import auth
 from app.api.v1.endpoints import resume
@@ -16,37 +18,58 @@ from app.api.v1.endpoints import application
 from app.api.v1.endpoints import interview
 from app.api.v1.endpoints import job
 from app.api.v1.endpoints import ai
+from app.api.v1.endpoints import files
+from app.api.v1.endpoints import saved_search
+from app.api.v1.endpoints import dashboard
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Background jobs pull in the scoring/facet services; load them at startup, not import.
+    from app.services.job_facets import refresh_facet_view
+    from app.services.job_lifecycle import run_job_lifecycle
+    from app.services.match_scoring import refresh_index, warm_index
+
+    # Settings are read here rather than at import (see app.core.config).
+    app.title, app.version = settings.APP_NAME, settings.VERSION
     print("🚀 Starting JobForge AI API...")
     print(f"Environment: {settings.ENVIRONMENT}")
     init_db()
-    print("✅ Database initialized")
+    print("✅ Database schema verified")
+    warm_index()
+    background = [
+        (settings.FACET_REFRESH_SECONDS, refresh_facet_view),
+        (settings.JOB_LIFECYCLE_INTERVAL_SECONDS, run_job_lifecycle),
+        (settings.MATCH_INDEX_REFRESH_SECONDS, refresh_index),
+    ]
+    if replicas.get_pool():
+        background.append((settings.REPLICA_HEALTH_CHECK_SECONDS, replicas.check_replicas))
+    periodic = start_periodic(background)
     yield
+    await stop_periodic(periodic)
     print("👋 Shutting down JobForge AI API...")
 
+class SettingsCORSMiddleware(CORSMiddleware):
+    """CORS with origins from settings, read when the middleware stack is built (first request)."""
+
+    def __init__(self, app, **options):
+        super().__init__(app, allow_origins=settings.CORS_ORIGINS, **options)
+
 app = FastAPI(
-    title=settings.APP_NAME,
-    version=settings.VERSION,
     description="AI-Powered Job Application Orchestrator API",
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan
 )
 
-upload_root = Path(settings.UPLOAD_DIR).expanduser().resolve()
-upload_root.mkdir(parents=True, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=upload_root), name="uploads")
-
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
+    SettingsCORSMiddleware,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
+app.add_middleware(CompressionMiddleware)
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -56,6 +79,14 @@ async def log_requests(request: Request, call_next):
     print(f"{request.method} {request.url.path} - {response.status_code} - {process_time:.2f}s")
     return response
 
+@app.middleware("http")
+async def pin_writers_to_primary(request: Request, call_next):
+    response = await call_next(request)
+    if replicas.get_pool() and request.method not in replicas.SAFE_METHODS and response.status_code < 400:
+        # Sets a Redis key; keep the blocking call off the event loop.
+        await run_in_threadpool(replicas.pin_to_primary, request)
+    return response
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     return JSONResponse(
@@ -74,19 +105,29 @@ def root():
 
 @app.get("/health")
 def health_check():
-    return {
+    health = {
         "status": "healthy",
         "service": "jobforge-api",
         "environment": settings.ENVIRONMENT,
         "version": settings.VERSION
     }
+    pool = replicas.get_pool()
+    if pool:
+        health["replicas"] = {
+            "configured": len(pool.replicas),
+            "healthy": sum(replica.healthy for replica in pool.replicas),
+        }
+    return health
 
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(resume.router, prefix="/api/v1/resumes", tags=["Resumes"])
 app.include_router(application.router, prefix="/api/v1/applications", tags=["Applications"])
 app.include_router(interview.router, prefix="/api/v1/interviews", tags=["Interviews"])
 app.include_router(job.router, prefix="/api/v1/jobs", tags=["Jobs"])
+app.include_router(dashboard.router, prefix="/api/v1/dashboard", tags=["Dashboard"])
+app.include_router(saved_search.router, prefix="/api/v1/saved-searches", tags=["Saved Searches"])
 app.include_router(ai.router, prefix="/api/v1/ai", tags=["AI"])
+app.include_router(files.router, prefix="/uploads", tags=["Files"])
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,17 +1,24 @@
 """JobForge AI Models"""
 from app.models.user import User, SubscriptionTier
-from app.models.resume import Resume
+from app.models.resume import Resume, ResumeJobAnalysis
 from app.models.application import Application, ApplicationStatus
-from app.models.job import Job
+from app.models.job import Job, JobLshBucket, JobSkillCount, JobSkillCountDelta
+from app.models.saved_search import SavedSearch, SavedSearchMatch
 from app.models.interview import Interview, InterviewType, InterviewStatus
 
 __all__ = [
     "User",
     "SubscriptionTier",
     "Resume",
+    "ResumeJobAnalysis",
     "Application",
     "ApplicationStatus",
     "Job",
+    "JobLshBucket",
+    "JobSkillCount",
+    "JobSkillCountDelta",
+    "SavedSearch",
+    "SavedSearchMatch",
     "Interview",
     "InterviewType",
     "InterviewStatus",
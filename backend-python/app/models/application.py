@@ -1,6 +1,7 @@
 """JobForge AI - Application Model"""
-from sqlalchemy import Column, String, DateTime, Float, Text, Enum, ForeignKey
+from sqlalchemy import Column, String, DateTime, Float, Text, Enum, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 import enum
@@ -17,10 +18,15 @@ class ApplicationStatus(str, enum.Enum):
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        Index("ix_applications_user_updated", "user_id", "updated_at", "id"),
+        Index("ix_applications_user_created", "user_id", "created_at", "id"),
+        Index("ix_applications_user_status_updated", "user_id", "status", "updated_at", "id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
-    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), nullable=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), nullable=True, index=True)
     company_name = Column(String(255), nullable=False)
     job_title = Column(String(255), nullable=False)
     job_url = Column(String, nullable=True)
@@ -31,6 +37,12 @@ class Application(Base):
     match_score = Column(Float, nullable=True)  # 0-100
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    user = relationship("User", back_populates="applications")
+    job = relationship("Job", back_populates="applications")
+    interviews = relationship(
+        "Interview", back_populates="application", passive_deletes=True, order_by="Interview.scheduled_at"
+    )
     
     def __repr__(self):
         return f"<Application {self.job_title} at {self.company_name}>"
@@ -1,6 +1,7 @@
 """JobForge AI - Interview Model"""
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 import enum
@@ -20,6 +21,11 @@ class InterviewStatus(str, enum.Enum):
 
 class Interview(Base):
     __tablename__ = "interviews"
+    __table_args__ = (
+        Index("ix_interviews_user_scheduled", "user_id", "scheduled_at", "id"),
+        Index("ix_interviews_user_created", "user_id", "created_at", "id"),
+        Index("ix_interviews_user_status_scheduled", "user_id", "status", "scheduled_at", "id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id"), nullable=False, index=True)
@@ -35,6 +41,9 @@ class Interview(Base):
     feedback = Column(Text, nullable=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    application = relationship("Application", back_populates="interviews")
+    user = relationship("User", back_populates="interviews")
     
     def __repr__(self):
         return f"<Interview {self.interview_type} on {self.scheduled_at}>"
@@ -1,12 +1,30 @@
 """JobForge AI - Job Model"""
-from sqlalchemy import Column, String, DateTime, Float, Text, Boolean
+from sqlalchemy import Column, String, DateTime, Float, Text, Boolean, BigInteger, Integer, ForeignKey, Index, Table
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func, text
 import uuid
 from app.core.database import Base
 
+# Rows the listing, search and facet queries read; filter indexes are partial on it.
+LISTED_JOBS = text("is_active AND canonical_job_id IS NULL")
+# Age a posting expires by (see app.services.job_lifecycle).
+EXPIRY_DATE = text("coalesce(posted_date, created_at)")
+
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_skills_normalized", "skills_normalized", postgresql_using="gin"),
+        Index("ix_jobs_listed_remote_type", "remote_type", postgresql_where=LISTED_JOBS),
+        Index("ix_jobs_listed_job_type", "job_type", postgresql_where=LISTED_JOBS),
+        Index("ix_jobs_listed_experience_level", "experience_level", postgresql_where=LISTED_JOBS),
+        Index("ix_jobs_listed_source_site", "source_site", postgresql_where=LISTED_JOBS),
+        Index("ix_jobs_listed_posted_date", "posted_date", postgresql_where=LISTED_JOBS),
+        Index("ix_jobs_listed_salary_ceiling", text("coalesce(salary_max, salary_min)"), postgresql_where=LISTED_JOBS),
+        Index("ix_jobs_listed_salary_floor", text("coalesce(salary_min, salary_max)"), postgresql_where=LISTED_JOBS),
+        Index("ix_jobs_active_expiry", EXPIRY_DATE, postgresql_where=text("is_active")),
+        Index("ix_jobs_inactive_created", "created_at", postgresql_where=text("NOT is_active")),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     title = Column(String(255), nullable=False, index=True)
@@ -19,7 +37,7 @@ class Job(Base):
     salary_max = Column(Float, nullable=True)
     job_type = Column(String(50), nullable=True)  # full-time, part-time, contract, etc
     experience_level = Column(String(50), nullable=True)  # entry, mid, senior, etc
-    source_url = Column(String, nullable=True)
+    source_url = Column(String, nullable=True, unique=True, index=True)
     validated_source_url = Column(String, nullable=True)
     source_site = Column(String(100), nullable=True)
     is_active = Column(Boolean, default=True)
@@ -31,7 +49,49 @@ class Job(Base):
     ai_compensation = Column(String(255), nullable=True)
     ai_remote_policy = Column(String(255), nullable=True)
     ai_last_enriched_at = Column(DateTime, nullable=True)
+    ai_content_hash = Column(String(64), nullable=True)  # inputs of the last enrichment
+    skills_normalized = Column(ARRAY(String), nullable=True)  # ai_required_skills via app.services.skills
+    content_fingerprint = Column(String(40), nullable=True, index=True)
+    minhash_signature = Column(ARRAY(BigInteger), nullable=True)
+    canonical_job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="SET NULL"), nullable=True, index=True)  # set on near-duplicates
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    applications = relationship("Application", back_populates="job", passive_deletes=True)
     
     def __repr__(self):
         return f"<Job {self.title} at {self.company}>"
+
+# Inactive jobs moved out of ``jobs`` by the archiver: the same columns, minus
+# constraints, plus when they were moved. Columns added to Job must be added
+# to jobs_archive in the same migration.
+job_archive = Table(
+    "jobs_archive",
+    Base.metadata,
+    *(
+        Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+        for column in Job.__table__.columns
+    ),
+    Column("archived_at", DateTime, server_default=func.now(), nullable=False),
+)
+
+class JobLshBucket(Base):
+    """LSH band of a job's MinHash signature, used to find near-duplicate candidates."""
+    __tablename__ = "job_lsh_buckets"
+
+    bucket = Column(String(24), primary_key=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True, index=True)
+
+class JobSkillCount(Base):
+    """Active canonical jobs per normalized skill, kept current by app.services.job_facets."""
+    __tablename__ = "job_skill_counts"
+
+    skill = Column(String(100), primary_key=True)
+    job_count = Column(Integer, nullable=False, default=0)
+
+class JobSkillCountDelta(Base):
+    """Pending changes to job_skill_counts, appended by statement triggers on jobs (revision 0011)."""
+    __tablename__ = "job_skill_count_deltas"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    skill = Column(String(100), nullable=False)
+    delta = Column(Integer, nullable=False)
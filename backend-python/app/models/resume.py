@@ -1,6 +1,7 @@
 """JobForge AI - Resume Model"""
-from sqlalchemy import Column, String, Boolean, DateTime, Float, Text, Enum, ForeignKey, JSON
+from sqlalchemy import Column, String, Boolean, DateTime, Float, Text, Enum, ForeignKey, JSON, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 import enum
@@ -8,6 +9,10 @@ from app.core.database import Base
 
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        Index("ix_resumes_user_updated", "user_id", "updated_at", "id"),
+        Index("ix_resumes_user_created", "user_id", "created_at", "id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
@@ -24,6 +29,32 @@ class Resume(Base):
     missing_keywords = Column(JSON, nullable=True)  # Keywords the resume should include
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    user = relationship("User", back_populates="resumes")
+    job_analyses = relationship("ResumeJobAnalysis", back_populates="resume", passive_deletes=True)
     
     def __repr__(self):
         return f"<Resume {self.title}>"
+
+class ResumeJobAnalysis(Base):
+    """AI analysis of a resume against one specific job"""
+    __tablename__ = "resume_job_analyses"
+    __table_args__ = (UniqueConstraint("resume_id", "job_id", name="uq_resume_job_analyses_resume_job"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    ats_score = Column(Float, nullable=True)  # 0-100
+    keyword_match_score = Column(Float, nullable=True)
+    strengths = Column(JSON, nullable=True)
+    weaknesses = Column(JSON, nullable=True)
+    suggestions = Column(JSON, nullable=True)
+    missing_keywords = Column(JSON, nullable=True)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    resume = relationship("Resume", back_populates="job_analyses")
+    job = relationship("Job")
+
+    def __repr__(self):
+        return f"<ResumeJobAnalysis {self.resume_id} vs {self.job_id}>"
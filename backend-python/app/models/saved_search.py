@@ -0,0 +1,41 @@
+"""JobForge AI - Saved Search Models"""
+from sqlalchemy import Column, String, DateTime, BigInteger, ForeignKey, JSON, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy.sql import func, text
+import uuid
+from app.core.database import Base
+
+class SavedSearch(Base):
+    """A job search a user wants to be notified about as new jobs arrive"""
+    __tablename__ = "saved_searches"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    name = Column(String(255), nullable=False)
+    query = Column(String(255), nullable=True)  # Same substring match as /jobs/search
+    skills = Column(ARRAY(String), nullable=True)  # Normalized, all required
+    filters = Column(JSON, nullable=True)  # JobFilters fields that are set
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<SavedSearch {self.name}>"
+
+class SavedSearchMatch(Base):
+    """A newly ingested job that matched a saved search; rows form the user's feed"""
+    __tablename__ = "saved_search_matches"
+    __table_args__ = (
+        UniqueConstraint("saved_search_id", "job_id", name="uq_saved_search_matches_search_job"),
+        Index("ix_saved_search_matches_user_feed", "user_id", "xact_id", "id"),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    saved_search_id = Column(UUID(as_uuid=True), ForeignKey("saved_searches.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    matched_at = Column(DateTime, server_default=func.now(), nullable=False)
+    # Inserting transaction; the feed pages on (xact_id, id) since ids are not commit-ordered.
+    xact_id = Column(BigInteger, server_default=text("txid_current()"), nullable=False)
+
+    def __repr__(self):
+        return f"<SavedSearchMatch {self.saved_search_id} -> {self.job_id}>"
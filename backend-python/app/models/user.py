@@ -1,6 +1,7 @@
 """JobForge AI - User Model"""
 from sqlalchemy import Column, String, Boolean, DateTime, Enum
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 import enum
@@ -33,6 +34,10 @@ class User(Base):
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     last_login_at = Column(DateTime, nullable=True)
+
+    applications = relationship("Application", back_populates="user", passive_deletes=True)
+    interviews = relationship("Interview", back_populates="user", passive_deletes=True)
+    resumes = relationship("Resume", back_populates="user", passive_deletes=True)
     
     def __repr__(self):
         return f"<User {self.email}>"
@@ -45,3 +45,19 @@ class InterviewQuestionsResponse(BaseModel):
     model: str
     prompt_tokens: Optional[int] = None
     completion_tokens: Optional[int] = None
+
+
+class UpstreamMetricsResponse(BaseModel):
+    limit: int
+    in_flight: int
+    queue_depth: int
+    backoff_seconds: float
+    ok: int
+    throttled: int
+    server_errors: int
+    timeouts: int
+    connection_errors: int
+    client_errors: int
+    cancelled: int
+    retries: int
+    rejected: int
@@ -1,9 +1,11 @@
 """JobForge AI - Application Schemas"""
 from pydantic import BaseModel, Field, HttpUrl
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
 from enum import Enum
+from app.schemas.interview import InterviewResponse
+from app.schemas.job import JobResponse
 
 class ApplicationStatus(str, Enum):
     DRAFT = "draft"
@@ -47,6 +49,21 @@ class ApplicationResponse(ApplicationBase):
     class Config:
         from_attributes = True
 
+class ApplicationDetailResponse(ApplicationResponse):
+    """Application with the related rows requested through ``include``; others are null"""
+    job: Optional[JobResponse] = None
+    interviews: Optional[List[InterviewResponse]] = None
+
+class ApplicationImportError(BaseModel):
+    line: int
+    detail: str
+
+class ApplicationImportResponse(BaseModel):
+    inserted: int
+    linked: int  # inserted rows attached to an existing job
+    skipped: int
+    errors: List[ApplicationImportError] = []
+
 class ApplicationStats(BaseModel):
     total: int
     by_status: dict
@@ -0,0 +1,14 @@
+"""JobForge AI - Dashboard Schemas"""
+from pydantic import BaseModel
+from typing import List
+from app.schemas.application import ApplicationResponse, ApplicationStats
+from app.schemas.interview import InterviewResponse
+from app.schemas.resume import ResumeResponse
+from app.schemas.user import UserResponse
+
+class DashboardResponse(BaseModel):
+    user: UserResponse
+    stats: ApplicationStats
+    recent_applications: List[ApplicationResponse]
+    upcoming_interviews: List[InterviewResponse]
+    resumes: List[ResumeResponse]
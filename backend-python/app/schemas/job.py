@@ -1,6 +1,6 @@
 """JobForge AI - Job Schemas"""
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from uuid import UUID
 
@@ -55,7 +55,50 @@ class JobResponse(JobBase):
     is_active: bool
     posted_date: Optional[datetime] = None
     ai_last_enriched_at: Optional[datetime] = None
+    canonical_job_id: Optional[UUID] = None
     created_at: datetime
 
     class Config:
         from_attributes = True
+
+class JobFilters(BaseModel):
+    """Structured filters shared by job listing, search and faceted search"""
+    remote_type: Optional[str] = None
+    job_type: Optional[str] = None
+    experience_level: Optional[str] = None
+    source_site: Optional[str] = None
+    salary_min: Optional[float] = Field(default=None, ge=0, description="Jobs paying at least this much")
+    salary_max: Optional[float] = Field(default=None, ge=0, description="Jobs starting at or below this much")
+    posted_after: Optional[datetime] = None
+    posted_before: Optional[datetime] = None
+
+    def is_empty(self) -> bool:
+        return not self.model_dump(exclude_none=True)
+
+class FacetedJobSearchResponse(BaseModel):
+    total: int
+    items: List[JobResponse]
+    facets: Dict[str, Dict[str, int]]
+
+class SkillCountResponse(BaseModel):
+    skill: str
+    job_count: int
+
+class JobMatchResponse(BaseModel):
+    job: JobResponse
+    match_score: float = Field(..., ge=0, le=100)
+
+class JobBulkIngestError(BaseModel):
+    line: int
+    detail: str
+
+class JobBulkIngestResponse(BaseModel):
+    inserted: int
+    updated: int
+    skipped: int
+    errors: List[JobBulkIngestError] = []
+
+class JobBatchEnrichResponse(BaseModel):
+    checked: int
+    unchanged: int
+    queued: int
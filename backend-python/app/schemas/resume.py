@@ -44,3 +44,28 @@ class ResumeAnalysisRequest(BaseModel):
     job_title: Optional[str] = None
     job_description: Optional[str] = None
     target_keywords: Optional[List[str]] = None
+
+class ResumeBatchAnalysisRequest(BaseModel):
+    job_ids: List[UUID] = Field(..., min_length=1, max_length=20)
+
+class ResumeJobAnalysisResponse(BaseModel):
+    job_id: UUID
+    ats_score: Optional[float] = None
+    keyword_match_score: Optional[float] = None
+    strengths: Optional[List[str]] = None
+    weaknesses: Optional[List[str]] = None
+    suggestions: Optional[List[str]] = None
+    missing_keywords: Optional[List[str]] = None
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class ResumeBatchAnalysisResponse(BaseModel):
+    resume_id: UUID
+    results: List[ResumeJobAnalysisResponse]
+    failed_job_ids: List[UUID] = []
+
+class SignedUrlResponse(BaseModel):
+    url: str
+    expires_at: datetime
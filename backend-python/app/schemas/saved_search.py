@@ -0,0 +1,38 @@
+"""JobForge AI - Saved Search Schemas"""
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+from uuid import UUID
+from app.schemas.job import JobFilters, JobResponse
+
+class SavedSearchBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    query: Optional[str] = Field(default=None, min_length=1, max_length=255)
+    skills: Optional[List[str]] = None
+    filters: JobFilters = Field(default_factory=JobFilters)
+
+class SavedSearchCreate(SavedSearchBase):
+    pass
+
+class SavedSearchUpdate(BaseModel):
+    name: Optional[str] = Field(default=None, min_length=1, max_length=255)
+    query: Optional[str] = Field(default=None, min_length=1, max_length=255)
+    skills: Optional[List[str]] = None
+    filters: Optional[JobFilters] = None
+
+class SavedSearchResponse(SavedSearchBase):
+    id: UUID
+    user_id: UUID
+    filters: Optional[JobFilters] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class SavedSearchFeedItem(BaseModel):
+    id: int
+    cursor: str  # pass as ``after`` to continue the feed after this item
+    saved_search_id: UUID
+    matched_at: datetime
+    job: JobResponse
@@ -1,48 +1,18 @@
 """LLM-powered generators for cover letters and interview preparation."""
 from __future__ import annotations
 
-import atexit
 import logging
 from typing import List, Optional
 
-import httpx
-from openai import OpenAI
-
 from app.core.config import settings
+from app.services.llm_client import create_chat_completion
+from app.services.prompt_builder import PromptBuilder
 
 logger = logging.getLogger(__name__)
 
-_openai_client: Optional[OpenAI] = None
-_httpx_client: Optional[httpx.Client] = None
-
-
-def _get_client() -> OpenAI:
-    global _openai_client, _httpx_client
-    if _openai_client is None:
-        _httpx_client = httpx.Client(
-            base_url=settings.OPENAI_BASE_URL,
-            timeout=httpx.Timeout(60.0, connect=30.0),
-            follow_redirects=True,
-        )
-        _openai_client = OpenAI(
-            api_key=settings.OPENAI_API_KEY,
-            base_url=settings.OPENAI_BASE_URL,
-            default_headers={
-                "HTTP-Referer": "http://localhost:3000",
-                "X-Title": "JobForge AI",
-            },
-            http_client=_httpx_client,
-        )
-    return _openai_client
-
-
-def _shutdown_httpx_client() -> None:
-    if _httpx_client and not _httpx_client.is_closed:
-        _httpx_client.close()
-
-
-atexit.register(_shutdown_httpx_client)
-
+# Token budgets for the variable-length parts of the generation prompts.
+JOB_DESCRIPTION_TOKEN_BUDGET = 1500
+RESUME_TOKEN_BUDGET = 3000
 
 def generate_cover_letter(
     *,
@@ -58,7 +28,6 @@ def generate_cover_letter(
     if not resume_text.strip():
         raise ValueError("Resume text is empty; cannot generate cover letter.")
 
-    client = _get_client()
     prompt_parts = [
         "Write a tailored cover letter for the candidate below.\n",
         f"Job Title: {job_title}\n",
@@ -68,17 +37,26 @@ def generate_cover_letter(
     ]
     if custom_notes:
         prompt_parts.append(f"Custom notes from user: {custom_notes}\n")
-    prompt_parts.append("Job Description:\n")
-    prompt_parts.append(job_description or "No description provided.\n")
-    prompt_parts.append("\nResume:\n")
-    prompt_parts.append(resume_text)
+    prompt = (
+        PromptBuilder("cover_letter")
+        .add("".join(prompt_parts))
+        .add_budgeted(
+            job_description, section="job_description", budget=JOB_DESCRIPTION_TOKEN_BUDGET,
+            label="Job Description:\n", placeholder="No description provided.",
+        )
+        .add_budgeted(
+            resume_text, section="resume", budget=RESUME_TOKEN_BUDGET, clean=False,
+            label="\nResume:\n",
+        )
+        .build()
+    )
 
     try:
-        completion = client.chat.completions.create(
+        completion = create_chat_completion(
             model=settings.OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": "You write concise, effective cover letters that sound human and sincere."},
-                {"role": "user", "content": "".join(prompt_parts)},
+                {"role": "user", "content": prompt.text},
             ],
             temperature=0.5,
         )
@@ -106,25 +84,31 @@ def generate_interview_questions(
     count: int = 12,
 ) -> dict:
     """Generate interview prep questions with brief guidance."""
-    client = _get_client()
     focus_text = f"Focus areas: {', '.join(focus_areas)}\n" if focus_areas else ""
     prompt = (
-        "Generate concise interview preparation questions with a short guidance note for each.\n"
-        f"Interview type: {interview_type}\n"
-        f"Seniority: {seniority or 'mid-level'}\n"
-        f"{focus_text}"
-        f"Job Title: {job_title}\n"
-        f"Company: {job_company}\n"
-        f"Job Description:\n{job_description or 'N/A'}\n"
-        f"Return exactly {count} questions."
+        PromptBuilder("interview_questions")
+        .add(
+            "Generate concise interview preparation questions with a short guidance note for each.\n"
+            f"Interview type: {interview_type}\n"
+            f"Seniority: {seniority or 'mid-level'}\n"
+            f"{focus_text}"
+            f"Job Title: {job_title}\n"
+            f"Company: {job_company}\n"
+        )
+        .add_budgeted(
+            job_description, section="job_description", budget=JOB_DESCRIPTION_TOKEN_BUDGET,
+            label="Job Description:\n", placeholder="N/A",
+        )
+        .add(f"Return exactly {count} questions.")
+        .build()
     )
 
     try:
-        completion = client.chat.completions.create(
+        completion = create_chat_completion(
             model=settings.OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": "You are an expert interview coach. Provide questions with 1-2 sentence guidance."},
-                {"role": "user", "content": prompt},
+                {"role": "user", "content": prompt.text},
             ],
             temperature=0.4,
         )
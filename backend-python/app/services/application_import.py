@@ -0,0 +1,144 @@
+"""Streaming bulk import of a user's applications (CSV, NDJSON or JSON array)."""
+from __future__ import annotations
+
+import csv
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.crud import application as application_crud
+from app.schemas.application import ApplicationCreate
+from app.services.dashboard_cache import invalidate_dashboard
+from app.services.job_ingest import JobIngestError, iter_job_payloads, iter_text
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+
+
+class ApplicationImportError(Exception):
+    """Raised when the upload cannot be parsed at all."""
+
+
+def _header_name(name: str) -> str:
+    return name.strip().lstrip("\ufeff").lower().replace(" ", "_")
+
+
+async def _iter_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Yield ``(line, row_dict)`` for each CSV record after the header row.
+
+    Records may span lines inside quoted fields; blank cells are dropped so
+    schema defaults apply.
+    """
+    header: Optional[List[str]] = None
+    pending = ""
+    start = line_no = 0
+
+    def parse(line: str) -> Optional[Tuple[int, Any]]:
+        nonlocal header, pending, start
+        if not pending:
+            start = line_no
+        pending += line + "\n"
+        if pending.count('"') % 2:
+            return None  # inside a quoted field
+        record, pending = pending[:-1], ""
+        values = next(csv.reader([record]), [])
+        if not any(value.strip() for value in values):
+            return None
+        if header is None:
+            header = [_header_name(name) for name in values]
+            return None
+        if len(values) > len(header):
+            return start, ValueError(f"expected {len(header)} fields, got {len(values)}")
+        return start, {name: value.strip() for name, value in zip(header, values) if value.strip()}
+
+    buffer = ""
+    async for text in iter_text(chunks):
+        buffer += text
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_no += 1
+            item = parse(line)
+            if item is not None:
+                yield item
+    if buffer:
+        line_no += 1
+        item = parse(buffer)
+        if item is not None:
+            yield item
+    if pending:
+        raise ApplicationImportError(f"Unterminated quoted field starting on line {start}")
+
+
+async def import_application_stream(
+    db: Session, user_id: UUID, chunks: AsyncIterator[bytes], content_type: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Validate and insert a stream of ``ApplicationCreate`` rows in one transaction.
+
+    Rows are inserted CHUNK_SIZE at a time; rows failing validation are
+    skipped and reported with their line number. Any database error rolls the
+    whole import back.
+    """
+    counts = {"inserted": 0, "linked": 0, "skipped": 0}
+    errors: List[Dict[str, Any]] = []
+    batch: List[Tuple[int, ApplicationCreate]] = []
+
+    def reject(position: int, detail: str) -> None:
+        counts["skipped"] += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({"line": position, "detail": detail})
+
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in CSV_CONTENT_TYPES:
+        payloads = _iter_csv(chunks)
+    else:
+        payloads = iter_job_payloads(chunks, content_type)
+
+    resume_text = await run_in_threadpool(application_crud.get_scoring_resume_text, db, user_id)
+
+    async def flush() -> None:
+        written = await run_in_threadpool(
+            application_crud.bulk_insert_applications, db, user_id, list(batch), resume_text
+        )
+        counts["inserted"] += written["inserted"]
+        counts["linked"] += written["linked"]
+        for position, detail in written["rejected"]:
+            reject(position, detail)
+        batch.clear()
+
+    try:
+        async for position, payload in payloads:
+            if isinstance(payload, Exception):
+                reject(position, f"Invalid row: {payload}")
+                continue
+            try:
+                batch.append((position, ApplicationCreate.model_validate(payload)))
+            except ValidationError as exc:
+                reject(position, "; ".join(
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in exc.errors()
+                ))
+                continue
+            if len(batch) >= CHUNK_SIZE:
+                await flush()
+        if batch:
+            await flush()
+        await run_in_threadpool(db.commit)
+    except JobIngestError as exc:
+        await run_in_threadpool(db.rollback)
+        raise ApplicationImportError(str(exc)) from exc
+    except Exception:
+        await run_in_threadpool(db.rollback)
+        raise
+
+    if counts["inserted"]:
+        invalidate_dashboard(user_id)
+    logger.info("Application import for user %s finished: %s", user_id, counts)
+    return {**counts, "errors": errors}
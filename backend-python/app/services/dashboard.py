@@ -0,0 +1,76 @@
+"""Everything the dashboard shows, gathered in one request.
+
+The sections are independent reads, so each runs on its own pooled session
+in a worker thread and the request waits only for the slowest of them. The
+combined sections are cached per user; the user profile is taken from the
+authenticated request and spliced in uncached.
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.crud import application as application_crud
+from app.crud import interview as interview_crud
+from app.crud import resume as resume_crud
+from app.crud.pagination import PageRequest
+from app.models.user import User
+from app.schemas.application import ApplicationResponse, ApplicationStats
+from app.schemas.interview import InterviewResponse
+from app.schemas.resume import ResumeResponse
+from app.schemas.user import UserResponse
+from app.services.dashboard_cache import cached_dashboard
+
+RECENT_APPLICATIONS = 10
+UPCOMING_INTERVIEWS = 5
+RESUMES = 10
+
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dashboard")
+
+
+def _stats(db: Session, user_id: UUID):
+    return ApplicationStats.model_validate(application_crud.get_application_stats(db, user_id)).model_dump(mode="json")
+
+
+def _recent_applications(db: Session, user_id: UUID):
+    page = application_crud.get_applications_by_user(db, user_id, PageRequest(limit=RECENT_APPLICATIONS))
+    return [ApplicationResponse.model_validate(item).model_dump(mode="json") for item in page.items]
+
+
+def _upcoming_interviews(db: Session, user_id: UUID):
+    page = interview_crud.get_upcoming_interviews(db, user_id, PageRequest(limit=UPCOMING_INTERVIEWS, descending=False))
+    return [InterviewResponse.model_validate(item).model_dump(mode="json") for item in page.items]
+
+
+def _resumes(db: Session, user_id: UUID):
+    page = resume_crud.get_resumes_by_user(db, user_id, PageRequest(limit=RESUMES))
+    return [ResumeResponse.model_validate(item).model_dump(mode="json") for item in page.items]
+
+
+SECTIONS: Dict[str, Callable[[Session, UUID], object]] = {
+    "stats": _stats,
+    "recent_applications": _recent_applications,
+    "upcoming_interviews": _upcoming_interviews,
+    "resumes": _resumes,
+}
+
+
+def _run_section(section: Callable[[Session, UUID], object], user_id: UUID):
+    with SessionLocal() as db:
+        return section(db, user_id)
+
+
+def load_sections(user_id: UUID) -> bytes:
+    futures = {name: _executor.submit(_run_section, section, user_id) for name, section in SECTIONS.items()}
+    sections = {name: future.result() for name, future in futures.items()}
+    return json.dumps(sections, separators=(",", ":")).encode()
+
+
+def render_dashboard(user: User) -> bytes:
+    """The dashboard payload as JSON bytes matching DashboardResponse"""
+    sections = cached_dashboard(user.id, lambda: load_sections(user.id))
+    profile = UserResponse.model_validate(user).model_dump_json().encode()
+    return b'{"user":' + profile + b"," + sections[1:]
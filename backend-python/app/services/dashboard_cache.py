@@ -0,0 +1,20 @@
+"""Per-user cache of the dashboard collections, dropped on any write to them."""
+from typing import Callable, Optional
+from uuid import UUID
+
+from app.core import cache
+from app.core.config import settings
+
+
+def _namespace(user_id: UUID) -> str:
+    return f"dashboard:{user_id}"
+
+
+def cached_dashboard(user_id: UUID, loader: Callable[[], bytes]) -> Optional[bytes]:
+    key = cache.make_key(_namespace(user_id), "sections")
+    return cache.get_or_load(key, loader, settings.DASHBOARD_CACHE_TTL_SECONDS)
+
+
+def invalidate_dashboard(user_id: UUID) -> None:
+    """Call after committing a change to the user's applications, interviews or resumes."""
+    cache.bump_namespace(_namespace(user_id))
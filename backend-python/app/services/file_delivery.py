@@ -0,0 +1,179 @@
+"""HTTP delivery of stored uploads: signed URLs, Range, ETags and proxy offload."""
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import Response, StreamingResponse
+
+from app.core.config import settings
+from app.services.file_storage import _get_upload_root
+
+CHUNK_SIZE = 64 * 1024
+
+# (path, size, mtime_ns) -> sha256 hex; uploads are write-once so entries never go stale.
+_etag_cache: Dict[Tuple[str, int, int], str] = {}
+_etag_cache_lock = threading.Lock()
+_ETAG_CACHE_MAX = 4096
+
+
+def _signature(path: str, expires: int) -> str:
+    message = f"{path}:{expires}".encode()
+    return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()
+
+
+def sign_file_url(relative_url: str, expires_in: Optional[int] = None) -> Tuple[str, int]:
+    """Return a short-lived URL for ``relative_url`` and its expiry timestamp."""
+    expires = int(time.time()) + (expires_in or settings.SIGNED_URL_TTL_SECONDS)
+    path = "/" + relative_url.lstrip("/")
+    query = urlencode({"expires": expires, "sig": _signature(path, expires)})
+    return f"{path}?{query}", expires
+
+
+def verify_signed_request(request: Request) -> bool:
+    """Check the signature on a request for an upload; no database access needed."""
+    expires = request.query_params.get("expires")
+    sig = request.query_params.get("sig")
+    if not expires or not sig or not expires.isdigit():
+        return False
+    if int(expires) < time.time():
+        return False
+    return hmac.compare_digest(sig, _signature(request.url.path, int(expires)))
+
+
+def _content_etag(path: Path, stat: os.stat_result) -> str:
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    with _etag_cache_lock:
+        cached = _etag_cache.get(key)
+    if cached:
+        return cached
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(block)
+    etag = f'"{digest.hexdigest()}"'
+    with _etag_cache_lock:
+        if len(_etag_cache) >= _ETAG_CACHE_MAX:
+            _etag_cache.clear()
+        _etag_cache[key] = etag
+    return etag
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=`` range; returns None to fall back to a full response."""
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_s, _, end_s = spec.strip().partition("-")
+    try:
+        if start_s:
+            start = int(start_s)
+            end = int(end_s) if end_s else size - 1
+        else:
+            length = int(end_s)
+            if length <= 0:
+                raise ValueError
+            start, end = max(size - length, 0), size - 1
+    except ValueError:
+        return None
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, min(end, size - 1)
+
+
+def _iter_file(path: Path, start: int, end: int) -> Iterator[bytes]:
+    with path.open("rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag in {tag.strip() for tag in if_none_match.split(",")} or if_none_match.strip() == "*"
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def build_file_response(
+    request: Request,
+    path: Path,
+    media_type: str,
+    filename: Optional[str] = None,
+) -> Response:
+    """
+    Serve ``path`` honouring conditional and Range requests.
+
+    In ``x-accel-redirect``/``x-sendfile`` mode the body is left to the front
+    proxy, which also handles Range; the app only emits validators.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    etag = _content_etag(path, stat)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, max-age=0, must-revalidate",
+    }
+    if filename:
+        headers["Content-Disposition"] = f"attachment; filename*=utf-8''{quote(filename)}"
+
+    if _not_modified(request, etag, stat.st_mtime):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    mode = settings.FILE_DELIVERY_MODE
+    if mode == "x-accel-redirect":
+        relative = path.relative_to(_get_upload_root()).as_posix()
+        headers["X-Accel-Redirect"] = settings.FILE_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(relative)
+        return Response(media_type=media_type, headers=headers)
+    if mode == "x-sendfile":
+        headers["X-Sendfile"] = str(path)
+        return Response(media_type=media_type, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if range_header:
+        if_range = request.headers.get("if-range")
+        if if_range is None or if_range.strip() == etag:
+            byte_range = _parse_range(range_header, stat.st_size)
+
+    if byte_range is None:
+        headers["Content-Length"] = str(stat.st_size)
+        return StreamingResponse(_iter_file(path, 0, stat.st_size - 1), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        _iter_file(path, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers,
+    )
+
@@ -1,7 +1,9 @@
 """Utilities for storing and serving uploaded files."""
 from __future__ import annotations
 
+import os
 import uuid
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
@@ -20,6 +22,7 @@ MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB
 UPLOAD_ROUTE_PREFIX = "uploads"
 
 
+@lru_cache()
 def _get_upload_root() -> Path:
     root = Path(settings.UPLOAD_DIR).expanduser().resolve()
     root.mkdir(parents=True, exist_ok=True)
@@ -81,6 +84,9 @@ def resolve_file_path(relative_url: str) -> Path:
     """
     Convert a stored relative URL into an absolute path within the uploads directory.
     Raises HTTP 404 if the resolved path is outside the upload dir for safety.
+
+    Paths are normalized lexically rather than with ``resolve(strict=True)``
+    so serving a file costs a single ``stat``; uploads never contain symlinks.
     """
     upload_root = _get_upload_root()
     trimmed = relative_url.lstrip("/")
@@ -88,11 +94,9 @@ def resolve_file_path(relative_url: str) -> Path:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file path")
 
     _, _, subpath = trimmed.partition("/")
-    candidate = (upload_root / subpath) if subpath else upload_root
-    try:
-        resolved = candidate.resolve(strict=True)
-    except FileNotFoundError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
-    if upload_root not in resolved.parents and resolved != upload_root:
+    candidate = Path(os.path.normpath(upload_root / subpath))
+    if upload_root not in candidate.parents:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file path")
-    return resolved
+    if not candidate.is_file():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    return candidate
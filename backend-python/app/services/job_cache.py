@@ -0,0 +1,124 @@
+"""Read-through cache for the public job listing, search and detail payloads."""
+from __future__ import annotations
+
+import json
+from typing import Callable, Iterable, List, Optional
+from uuid import UUID
+
+from app.core import cache
+from app.core.config import settings
+from app.models.job import Job, JobSkillCount
+from app.schemas.job import FacetedJobSearchResponse, JobFilters, JobResponse
+from app.services.skills import normalize_skills
+
+NAMESPACE = "jobs"
+
+
+def _may_store(from_replica: bool) -> bool:
+    # A replica may not have replayed the write that just bumped the namespace.
+    return not (from_replica and cache.recently_written(NAMESPACE))
+
+
+def _serialize_job(job: Job) -> dict:
+    return JobResponse.model_validate(job).model_dump(mode="json")
+
+
+def serialize_jobs(jobs: Iterable[Job]) -> bytes:
+    return json.dumps([_serialize_job(job) for job in jobs], separators=(",", ":")).encode()
+
+
+def serialize_job(job: Optional[Job]) -> Optional[bytes]:
+    if job is None:
+        return None
+    return json.dumps(_serialize_job(job), separators=(",", ":")).encode()
+
+
+def cached_job_list(
+    skip: int,
+    limit: int,
+    loader: Callable[[], Iterable[Job]],
+    skills: Optional[List[str]] = None,
+    filters: Optional[JobFilters] = None,
+    from_replica: bool = False,
+) -> bytes:
+    key = cache.make_key(NAMESPACE, "list", skip, limit, _skills_key(skills), _filters_key(filters))
+    return cache.get_or_load(
+        key, lambda: serialize_jobs(loader()), settings.JOB_CACHE_TTL_SECONDS, store=_may_store(from_replica)
+    )
+
+
+def cached_job_search(
+    query: str,
+    skip: int,
+    limit: int,
+    loader: Callable[[], Iterable[Job]],
+    skills: Optional[List[str]] = None,
+    filters: Optional[JobFilters] = None,
+    from_replica: bool = False,
+) -> bytes:
+    key = cache.make_key(NAMESPACE, "search", query.lower(), skip, limit, _skills_key(skills), _filters_key(filters))
+    return cache.get_or_load(
+        key, lambda: serialize_jobs(loader()), settings.JOB_CACHE_TTL_SECONDS, store=_may_store(from_replica)
+    )
+
+
+def cached_faceted_search(
+    query: Optional[str],
+    skip: int,
+    limit: int,
+    loader: Callable[[], dict],
+    skills: Optional[List[str]] = None,
+    filters: Optional[JobFilters] = None,
+    from_replica: bool = False,
+) -> bytes:
+    key = cache.make_key(
+        NAMESPACE, "faceted", (query or "").lower(), skip, limit, _skills_key(skills), _filters_key(filters)
+    )
+    return cache.get_or_load(
+        key, lambda: _serialize_faceted(loader()), settings.JOB_CACHE_TTL_SECONDS, store=_may_store(from_replica)
+    )
+
+
+def _serialize_faceted(result: dict) -> bytes:
+    response = FacetedJobSearchResponse(
+        total=result["total"],
+        items=[JobResponse.model_validate(job) for job in result["items"]],
+        facets=result["facets"],
+    )
+    return response.model_dump_json().encode()
+
+
+def cached_top_skills(
+    limit: int, loader: Callable[[], Iterable[JobSkillCount]], from_replica: bool = False
+) -> bytes:
+    key = cache.make_key(NAMESPACE, "skills", limit)
+    return cache.get_or_load(
+        key,
+        lambda: json.dumps(
+            [{"skill": row.skill, "job_count": row.job_count} for row in loader()], separators=(",", ":")
+        ).encode(),
+        settings.JOB_CACHE_TTL_SECONDS,
+        store=_may_store(from_replica),
+    )
+
+
+def cached_job_detail(
+    job_id: UUID, loader: Callable[[], Optional[Job]], from_replica: bool = False
+) -> Optional[bytes]:
+    key = cache.make_key(NAMESPACE, "detail", job_id)
+    return cache.get_or_load(
+        key, lambda: serialize_job(loader()), settings.JOB_CACHE_TTL_SECONDS, store=_may_store(from_replica)
+    )
+
+
+def _skills_key(skills: Optional[List[str]]) -> str:
+    return ",".join(sorted(normalize_skills(skills) or ()))
+
+
+def _filters_key(filters: Optional[JobFilters]) -> str:
+    return filters.model_dump_json(exclude_none=True) if filters is not None else "{}"
+
+
+def invalidate_jobs() -> None:
+    """Drop every cached job payload after a write."""
+    cache.bump_namespace(NAMESPACE)
@@ -0,0 +1,240 @@
+"""Near-duplicate detection for job postings scraped from several sources.
+
+Each job gets an exact fingerprint of its normalized title/company/description
+and a MinHash signature of its word shingles. Signatures are split into LSH
+bands stored in ``job_lsh_buckets`` so candidate duplicates are found with an
+indexed lookup instead of a scan; confirmed duplicates point at the cluster's
+canonical job through ``Job.canonical_job_id``.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.job import Job, JobLshBucket
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 8
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+SHINGLE_SIZE = 3
+# Estimated Jaccard similarity above which two postings are the same job.
+DUPLICATE_THRESHOLD = 0.8
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache()
+def _permutations() -> Tuple[np.ndarray, np.ndarray]:
+    import numpy as np
+
+    rng = np.random.default_rng(20240601)
+    # Multiply-shift hash family; odd multipliers keep each permutation a bijection.
+    perm_a = rng.integers(1, 2**63, size=NUM_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+    perm_b = rng.integers(0, 2**63, size=NUM_PERMUTATIONS, dtype=np.uint64)
+    return perm_a, perm_b
+
+
+class JobSignature:
+    __slots__ = ("fingerprint", "minhash")
+
+    def __init__(self, fingerprint: str, minhash: np.ndarray) -> None:
+        self.fingerprint = fingerprint
+        self.minhash = minhash
+
+    def bands(self) -> List[str]:
+        keys = []
+        for band in range(LSH_BANDS):
+            rows = self.minhash[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+            keys.append(f"{band}:{hashlib.blake2b(rows.tobytes(), digest_size=8).hexdigest()}")
+        return keys
+
+    def similarity(self, other: np.ndarray) -> float:
+        return float((self.minhash == other).mean())
+
+
+def normalize_text(text: Optional[str]) -> str:
+    if not text:
+        return ""
+    return _NON_WORD_RE.sub(" ", _TAG_RE.sub(" ", text).lower()).strip()
+
+
+def compute_signature(title: str, company: str, description: Optional[str]) -> JobSignature:
+    import numpy as np
+
+    title_n = normalize_text(title)
+    company_n = normalize_text(company)
+    body_n = normalize_text(description)
+    fingerprint = hashlib.sha1(f"{title_n}|{company_n}|{body_n}".encode()).hexdigest()
+
+    words = f"{title_n} {company_n} {body_n}".split()
+    if len(words) < SHINGLE_SIZE:
+        shingles = {" ".join(words)}
+    else:
+        shingles = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    hashed = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little") for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    perm_a, perm_b = _permutations()
+    with np.errstate(over="ignore"):
+        permuted = hashed[:, None] * perm_a[None, :] + perm_b[None, :]
+    return JobSignature(fingerprint, permuted.min(axis=0))
+
+
+def _signature_for(job) -> JobSignature:
+    return compute_signature(job.title, job.company, job.raw_description or job.description)
+
+
+def assign_duplicate_clusters(db: Session, job_ids: Sequence[UUID]) -> int:
+    """
+    Fingerprint ``job_ids`` and link each to an existing near-duplicate.
+
+    Candidate lookup goes through the indexed LSH buckets, so the cost does
+    not grow with the size of the jobs table.
+    Returns how many of the jobs were marked as duplicates. Caller commits.
+    """
+    if not job_ids:
+        return 0
+    import numpy as np
+
+    ids = list(job_ids)
+    rows = db.execute(
+        select(Job.id, Job.title, Job.company, Job.description, Job.raw_description)
+        .where(Job.id.in_(ids))
+    ).all()
+    signatures: Dict[UUID, JobSignature] = {row.id: _signature_for(row) for row in rows}
+    bands: Dict[UUID, List[str]] = {job_id: sig.bands() for job_id, sig in signatures.items()}
+
+    # Re-ingested jobs may have changed content; drop their stale buckets.
+    db.execute(delete(JobLshBucket).where(JobLshBucket.job_id.in_(ids)))
+
+    all_buckets = {key for keys in bands.values() for key in keys}
+    existing: Dict[str, Set[UUID]] = {}
+    for bucket, job_id in db.execute(
+        select(JobLshBucket.bucket, JobLshBucket.job_id).where(JobLshBucket.bucket.in_(all_buckets))
+    ):
+        existing.setdefault(bucket, set()).add(job_id)
+
+    candidate_ids = {job_id for members in existing.values() for job_id in members}
+    known: Dict[UUID, Tuple[str, np.ndarray, Optional[UUID]]] = {}
+    if candidate_ids:
+        for row in db.execute(
+            select(Job.id, Job.content_fingerprint, Job.minhash_signature, Job.canonical_job_id)
+            .where(Job.id.in_(candidate_ids), Job.is_active == True)
+        ):
+            if row.minhash_signature:
+                sig = np.array(row.minhash_signature, dtype=np.int64).view(np.uint64)
+                known[row.id] = (row.content_fingerprint, sig, row.canonical_job_id)
+
+    updates = []
+    bucket_rows = []
+    duplicates = 0
+    for job_id in ids:
+        sig = signatures.get(job_id)
+        if sig is None:
+            continue
+        canonical = _find_canonical(sig, bands[job_id], existing, known, exclude=job_id)
+        if canonical is not None:
+            duplicates += 1
+        updates.append({
+            "id": job_id,
+            "content_fingerprint": sig.fingerprint,
+            "minhash_signature": sig.minhash.view(np.int64).tolist(),
+            "canonical_job_id": canonical,
+        })
+        # Later jobs in the same batch can cluster with this one.
+        known[job_id] = (sig.fingerprint, sig.minhash, canonical)
+        for key in bands[job_id]:
+            existing.setdefault(key, set()).add(job_id)
+            bucket_rows.append({"bucket": key, "job_id": job_id})
+
+    if updates:
+        db.execute(update(Job), updates)
+        # A job that joined a cluster hands over any duplicates that pointed at it.
+        for row in updates:
+            if row["canonical_job_id"] is not None:
+                db.execute(
+                    update(Job)
+                    .where(Job.canonical_job_id == row["id"])
+                    .values(canonical_job_id=row["canonical_job_id"])
+                )
+    if bucket_rows:
+        db.execute(insert(JobLshBucket).values(bucket_rows).on_conflict_do_nothing())
+    return duplicates
+
+
+def _find_canonical(
+    sig: JobSignature,
+    keys: Iterable[str],
+    existing: Dict[str, Set[UUID]],
+    known: Dict[UUID, Tuple[str, np.ndarray, Optional[UUID]]],
+    exclude: UUID,
+) -> Optional[UUID]:
+    best: Optional[UUID] = None
+    best_score = DUPLICATE_THRESHOLD
+    for key in keys:
+        for candidate in existing.get(key, ()):
+            if candidate == exclude or candidate not in known:
+                continue
+            fingerprint, other, canonical = known[candidate]
+            score = 1.0 if fingerprint == sig.fingerprint else sig.similarity(other)
+            if score >= best_score:
+                root = canonical or candidate
+                if root != exclude:
+                    best, best_score = root, score
+    return best
+
+
+def promote_canonical(db: Session, job_id: UUID) -> None:
+    """Hand a deactivated canonical job's cluster to its oldest active duplicate."""
+    successor = db.execute(
+        select(Job.id)
+        .where(Job.canonical_job_id == job_id, Job.is_active == True)
+        .order_by(Job.created_at)
+        .limit(1)
+    ).scalar_one_or_none()
+    if successor is None:
+        return
+    db.execute(update(Job).where(Job.id == successor).values(canonical_job_id=None))
+    db.execute(
+        update(Job)
+        .where(Job.canonical_job_id == job_id, Job.id != successor)
+        .values(canonical_job_id=successor)
+    )
+
+
+def backfill_duplicate_clusters(db: Session, batch_size: int = 1000) -> int:
+    """
+    Fingerprint jobs ingested before dedupe existed. Commits per batch.
+
+    Run by ``python migrate.py upgrade`` (or ``backfill-duplicates``); a no-op
+    once every job has a fingerprint. Returns how many were marked duplicates.
+    """
+    total = 0
+    while True:
+        ids = db.execute(
+            select(Job.id)
+            .where(Job.content_fingerprint.is_(None))
+            .order_by(Job.created_at)
+            .limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            return total
+        total += assign_duplicate_clusters(db, ids)
+        db.commit()
+        logger.info("Backfilled duplicate clusters for %d jobs", len(ids))
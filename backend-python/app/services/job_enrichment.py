@@ -1,17 +1,17 @@
 """AI-powered enrichment for scraped job postings."""
 from __future__ import annotations
 
-import atexit
+import hashlib
 import json
 import logging
 from typing import List, Optional
 
-import httpx
-from openai import OpenAI
 from pydantic import BaseModel, Field, ValidationError
 
 from app.core.config import settings
 from app.models.job import Job
+from app.services.llm_client import create_chat_completion
+from app.services.prompt_builder import PromptBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -34,44 +34,23 @@ class JobEnrichmentResult(BaseModel):
     validated_url: Optional[str] = None
 
 
-_openai_client: Optional[OpenAI] = None
-_httpx_client: Optional[httpx.Client] = None
+# Bump whenever SYSTEM_PROMPT or _build_prompt changes so stored enrichments
+# are treated as stale and regenerated.
+PROMPT_VERSION = "1"
 
-
-def _get_client() -> OpenAI:
-    global _openai_client, _httpx_client
-    if _openai_client is None:
-        _httpx_client = httpx.Client(
-            base_url=settings.OPENAI_BASE_URL,
-            timeout=httpx.Timeout(60.0, connect=30.0),
-            follow_redirects=True,
-        )
-        _openai_client = OpenAI(
-            api_key=settings.OPENAI_API_KEY,
-            base_url=settings.OPENAI_BASE_URL,
-            default_headers={
-                "HTTP-Referer": "http://localhost:3000",
-                "X-Title": "JobForge AI",
-            },
-            http_client=_httpx_client,
-        )
-    return _openai_client
-
-
-def _shutdown_httpx_client() -> None:
-    if _httpx_client and not _httpx_client.is_closed:
-        _httpx_client.close()
-
-
-atexit.register(_shutdown_httpx_client)
+# Token budgets for the variable-length parts of the enrichment prompt.
+DESCRIPTION_TOKEN_BUDGET = 2500
+REQUIREMENTS_TOKEN_BUDGET = 800
 
 
 def _build_prompt(job: Job) -> str:
+    builder = PromptBuilder("job_enrichment").add(
+        "Clean up this scraped job posting and return structured JSON with keys:\n"
+        "summary (2 sentences max), highlights (list of short bullet phrases), "
+        "required_skills (list of technologies/tools), compensation (string if mentioned), "
+        "remote_policy (remote/hybrid/on-site summary), validated_url (absolute https link).\n\n"
+    )
     parts = [
-        "Clean up this scraped job posting and return structured JSON with keys:\n",
-        "summary (2 sentences max), highlights (list of short bullet phrases), ",
-        "required_skills (list of technologies/tools), compensation (string if mentioned), ",
-        "remote_policy (remote/hybrid/on-site summary), validated_url (absolute https link).\n\n",
         f"Job Title: {job.title}\n",
         f"Company: {job.company}\n",
         f"Location: {job.location}\n",
@@ -84,22 +63,48 @@ def _build_prompt(job: Job) -> str:
         parts.append(
             f"Salary Range: {job.salary_min or ''} - {job.salary_max or ''}\n"
         )
+    builder.add("".join(parts), section="metadata")
     if job.raw_description:
-        parts.append(f"\nRaw Description:\n{job.raw_description}\n")
+        builder.add_budgeted(
+            job.raw_description, section="description", budget=DESCRIPTION_TOKEN_BUDGET,
+            label="\nRaw Description:\n",
+        )
     else:
-        parts.append(f"\nDescription:\n{job.description}\n")
-    if job.requirements:
-        parts.append(f"\nRequirements:\n{job.requirements}\n")
-    return "".join(parts)
+        builder.add_budgeted(
+            job.description, section="description", budget=DESCRIPTION_TOKEN_BUDGET,
+            label="\nDescription:\n",
+        )
+    builder.add_budgeted(
+        job.requirements, section="requirements", budget=REQUIREMENTS_TOKEN_BUDGET,
+        label="\nRequirements:\n",
+    )
+    return builder.build().text
+
+
+def enrichment_content_hash(job: Job) -> str:
+    """Hash of everything that shapes the enrichment prompt, plus prompt version and model."""
+    fields = [
+        PROMPT_VERSION,
+        settings.OPENAI_MODEL,
+        job.title,
+        job.company,
+        job.location,
+        job.remote_type,
+        job.job_type,
+        job.salary_min,
+        job.salary_max,
+        job.raw_description or job.description,
+        job.requirements,
+    ]
+    return hashlib.sha256(json.dumps(fields, default=str).encode()).hexdigest()
 
 
 def enrich_job_posting(job: Job) -> JobEnrichmentResult:
     """Call OpenAI to enrich a single job posting."""
     prompt = _build_prompt(job)
-    client = _get_client()
 
     try:
-        completion = client.chat.completions.create(
+        completion = create_chat_completion(
             model=settings.OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
@@ -0,0 +1,130 @@
+"""Facet counts for job search.
+
+Counts by ``remote_type``, ``job_type``, ``experience_level``, ``source_site``
+and salary bucket are computed in one GROUPING SETS query over the filtered
+jobs. The unfiltered counts, requested on every search page load, are read
+from the ``job_facet_counts`` materialized view, which a background task
+refreshes every ``FACET_REFRESH_SECONDS``. The same task folds the deltas
+that statement triggers append to ``job_skill_count_deltas`` into
+``job_skill_counts``, so skill counts never need a full recount.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Dict
+
+from sqlalchemy import case, func, literal, select, text
+from sqlalchemy.orm import Session
+
+from app.core import cache
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+FACET_DIMENSIONS = ("remote_type", "job_type", "experience_level", "source_site", "salary_bucket")
+UNSPECIFIED = "unspecified"
+# Upper bounds (exclusive) of the salary buckets; keep in sync with the
+# job_facet_counts view definition in alembic/versions/0005.
+SALARY_BUCKETS = ((50_000, "<50k"), (100_000, "50k-100k"), (150_000, "100k-150k"), (200_000, "150k-200k"))
+TOP_SALARY_BUCKET = "200k+"
+# Delta rows (appended by the triggers from alembic/versions/0011) folded
+# per statement, so the backlog of one large ingest is not folded in one
+# long transaction.
+FOLD_BATCH_SIZE = 5000
+FOLD_SKILL_DELTAS = text("""
+WITH folded AS (
+    DELETE FROM job_skill_count_deltas
+    WHERE id IN (SELECT id FROM job_skill_count_deltas ORDER BY id LIMIT :batch_size)
+    RETURNING skill, delta
+), summed AS (
+    SELECT skill, sum(delta) AS delta, count(*) AS folded FROM folded GROUP BY skill
+), upserted AS (
+    INSERT INTO job_skill_counts (skill, job_count)
+    SELECT skill, delta FROM summed WHERE delta <> 0
+    ON CONFLICT (skill) DO UPDATE SET job_count = job_skill_counts.job_count + EXCLUDED.job_count
+)
+SELECT coalesce(sum(folded), 0)::int FROM summed
+""")
+PRUNE_EMPTY_SKILLS = text("DELETE FROM job_skill_counts WHERE job_count <= 0")
+_GROUPING_SETS = text(
+    "GROUPING SETS ((remote_type), (job_type), (experience_level), (source_site), (salary_bucket), ())"
+)
+
+
+def salary_bucket():
+    salary = func.coalesce(Job.salary_max, Job.salary_min)
+    return case(
+        (salary.is_(None), literal(UNSPECIFIED)),
+        *[(salary < bound, literal(label)) for bound, label in SALARY_BUCKETS],
+        else_=literal(TOP_SALARY_BUCKET),
+    )
+
+
+def _empty_facets() -> Dict[str, Dict[str, int]]:
+    return {dimension: {} for dimension in FACET_DIMENSIONS}
+
+
+def compute_facets(db: Session, jobs_query) -> tuple[int, Dict[str, Dict[str, int]]]:
+    """Return ``(total, facets)`` for the rows matched by a ``db.query(Job)`` query."""
+    subquery = jobs_query.with_entities(
+        Job.remote_type, Job.job_type, Job.experience_level, Job.source_site,
+        salary_bucket().label("salary_bucket"),
+    ).order_by(None).subquery()
+    columns = [subquery.c[name] for name in FACET_DIMENSIONS]
+    dimension = case(
+        *[(func.grouping(column) == 0, literal(name)) for name, column in zip(FACET_DIMENSIONS, columns)],
+        else_=literal("total"),
+    )
+    value = case(
+        *[(func.grouping(column) == 0, func.coalesce(column, UNSPECIFIED)) for column in columns],
+        else_=literal(""),
+    )
+    stmt = select(
+        dimension.label("dimension"), value.label("value"), func.count().label("job_count")
+    ).select_from(subquery).group_by(_GROUPING_SETS)
+    return _collect(db.execute(stmt))
+
+
+def precomputed_facets(db: Session) -> tuple[int, Dict[str, Dict[str, int]]]:
+    """Unfiltered counts from the materialized view."""
+    return _collect(db.execute(text("SELECT dimension, value, job_count FROM job_facet_counts")))
+
+
+def _collect(rows) -> tuple[int, Dict[str, Dict[str, int]]]:
+    total = 0
+    facets = _empty_facets()
+    for row in rows:
+        if row.dimension == "total":
+            total = row.job_count
+        else:
+            facets[row.dimension][row.value] = row.job_count
+    return total, facets
+
+
+def fold_skill_deltas(db: Session) -> int:
+    """Apply pending job_skill_count_deltas to job_skill_counts in batches; returns the rows folded."""
+    total = 0
+    while True:
+        folded = db.execute(FOLD_SKILL_DELTAS, {"batch_size": FOLD_BATCH_SIZE}).scalar()
+        db.execute(PRUNE_EMPTY_SKILLS)
+        db.commit()
+        total += folded
+        if folded < FOLD_BATCH_SIZE:
+            return total
+
+
+def refresh_facet_view() -> None:
+    """Refresh job_facet_counts and fold skill count deltas; the lock keeps it to one worker at a time."""
+    token = cache.acquire_lock("job-facets-refresh", ttl=settings.FACET_REFRESH_SECONDS)
+    if not token:
+        return
+    try:
+        with SessionLocal() as db:
+            db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY job_facet_counts"))
+            db.commit()
+            folded = fold_skill_deltas(db)
+    finally:
+        cache.release_lock("job-facets-refresh", token)
+    logger.info("Refreshed job_facet_counts and folded %d skill count deltas", folded)
@@ -0,0 +1,165 @@
+"""Streaming bulk ingestion of job postings (NDJSON or JSON array bodies)."""
+from __future__ import annotations
+
+import codecs
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.crud import job as job_crud
+from app.schemas.job import JobCreate
+from app.services.job_cache import invalidate_jobs
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+
+
+class JobIngestError(Exception):
+    """Raised when the request body cannot be parsed at all."""
+
+
+async def iter_text(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+async def _iter_ndjson(texts: AsyncIterator[str], buffer: str) -> AsyncIterator[Tuple[int, Any]]:
+    line_no = 0
+
+    def parse(line: str) -> Tuple[int, Any]:
+        try:
+            return line_no, json.loads(line)
+        except json.JSONDecodeError as exc:
+            return line_no, exc
+
+    async for text in texts:
+        buffer += text
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield parse(line)
+    if buffer.strip():
+        line_no += 1
+        yield parse(buffer)
+
+
+async def _iter_json_array(texts: AsyncIterator[str], buffer: str) -> AsyncIterator[Tuple[int, Any]]:
+    decoder = json.JSONDecoder()
+    buffer = buffer.lstrip()[1:]  # drop the opening bracket
+    index = 0
+    exhausted = False
+    while True:
+        buffer = buffer.lstrip().lstrip(",").lstrip()
+        if buffer.startswith("]"):
+            return
+        if buffer:
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise JobIngestError(f"Malformed JSON array near element {index + 1}")
+            else:
+                index += 1
+                yield index, item
+                buffer = buffer[end:]
+                continue
+        elif exhausted:
+            raise JobIngestError("Unterminated JSON array")
+        try:
+            buffer += await texts.__anext__()
+        except StopAsyncIteration:
+            exhausted = True
+
+
+async def iter_job_payloads(
+    chunks: AsyncIterator[bytes], content_type: Optional[str]
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Yield ``(position, decoded_object)`` pairs without buffering the whole body.
+
+    NDJSON is used when the content type says so or the body does not start
+    with ``[``; decoding errors on a single NDJSON line are yielded in place of
+    the object so the caller can report them per row.
+    """
+    texts = iter_text(chunks)
+    buffer = ""
+    async for text in texts:
+        buffer += text
+        if buffer.strip():
+            break
+
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type not in NDJSON_CONTENT_TYPES and buffer.lstrip().startswith("["):
+        parser = _iter_json_array(texts, buffer)
+    else:
+        parser = _iter_ndjson(texts, buffer)
+    async for item in parser:
+        yield item
+
+
+async def ingest_job_stream(
+    db: Session, chunks: AsyncIterator[bytes], content_type: Optional[str]
+) -> Dict[str, Any]:
+    """Validate and upsert a stream of ``JobCreate`` payloads in chunks."""
+    counts = {"inserted": 0, "updated": 0, "skipped": 0}
+    errors: List[Dict[str, Any]] = []
+    batch: List[JobCreate] = []
+
+    def reject(position: int, detail: str) -> None:
+        counts["skipped"] += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({"line": position, "detail": detail})
+
+    async def flush() -> None:
+        written = await run_in_threadpool(_write_chunk, db, list(batch))
+        for key, value in written.items():
+            counts[key] += value
+        batch.clear()
+
+    try:
+        async for position, payload in iter_job_payloads(chunks, content_type):
+            if isinstance(payload, Exception):
+                reject(position, f"Invalid JSON: {payload}")
+                continue
+            try:
+                batch.append(JobCreate.model_validate(payload))
+            except ValidationError as exc:
+                reject(position, "; ".join(
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in exc.errors()
+                ))
+                continue
+            if len(batch) >= CHUNK_SIZE:
+                await flush()
+        if batch:
+            await flush()
+    finally:
+        # Chunks are committed as they go, so a stream that fails partway
+        # still changed the catalogue.
+        if counts["inserted"] or counts["updated"]:
+            invalidate_jobs()
+    logger.info("Bulk job ingest finished: %s", counts)
+    return {**counts, "errors": errors}
+
+
+def _write_chunk(db: Session, jobs: List[JobCreate]) -> Dict[str, int]:
+    try:
+        counts = job_crud.bulk_upsert_jobs(db, jobs)
+        db.commit()
+        return counts
+    except Exception:
+        db.rollback()
+        raise
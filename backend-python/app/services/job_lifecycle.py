@@ -0,0 +1,98 @@
+"""Expiry and archival of job postings.
+
+A job expires ``JOB_EXPIRY_DAYS`` after its ``posted_date`` (``created_at``
+when the source gave none) and is deactivated like a deleted job, handing
+its duplicate cluster to a surviving posting. Inactive jobs are then moved
+to ``jobs_archive`` so ``jobs`` only grows with the live catalogue. Jobs
+that applications point at stay in ``jobs``; their near-duplicate, LSH,
+saved-search and analysis rows go with them through ON DELETE.
+
+Both steps run in batches of ``JOB_ARCHIVE_BATCH_SIZE`` rows, each in its own
+short transaction with ``SKIP LOCKED``, from a periodic task.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session, aliased
+
+from app.core import cache
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.application import Application
+from app.models.job import Job, job_archive
+from app.services.job_cache import invalidate_jobs
+from app.services.job_dedupe import promote_canonical
+
+logger = logging.getLogger(__name__)
+
+
+def expiry_cutoff(now: Optional[datetime] = None) -> datetime:
+    return (now or datetime.utcnow()) - timedelta(days=settings.JOB_EXPIRY_DAYS)
+
+
+def expire_jobs(db: Session, batch_size: int, now: Optional[datetime] = None) -> int:
+    """Deactivate one batch of expired jobs. Does not commit."""
+    batch = (
+        select(Job.id)
+        .where(Job.is_active == True, func.coalesce(Job.posted_date, Job.created_at) < expiry_cutoff(now))
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    expired = db.execute(
+        update(Job)
+        .where(Job.id.in_(batch.scalar_subquery()))
+        .values(is_active=False)
+        .returning(Job.id, Job.canonical_job_id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    for job_id, canonical_job_id in expired:
+        if canonical_job_id is None:
+            promote_canonical(db, job_id)
+    return len(expired)
+
+
+def archive_jobs(db: Session, batch_size: int) -> int:
+    """Move one batch of inactive, unreferenced jobs to jobs_archive. Does not commit."""
+    duplicate = aliased(Job)
+    batch = (
+        select(Job.id)
+        .where(
+            Job.is_active == False,
+            ~select(Application.id).where(Application.job_id == Job.id).exists(),
+            # An active duplicate still resolves through canonical_job_id.
+            ~select(duplicate.id).where(duplicate.canonical_job_id == Job.id, duplicate.is_active == True).exists(),
+        )
+        .order_by(Job.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    jobs = Job.__table__
+    moved = delete(jobs).where(jobs.c.id.in_(batch.scalar_subquery())).returning(*jobs.c).cte("moved")
+    result = db.execute(insert(job_archive).from_select(list(jobs.c.keys()), select(*moved.c)))
+    return result.rowcount
+
+
+def _drain(db: Session, step: Callable[[Session, int], int], batch_size: int) -> int:
+    total = 0
+    while True:
+        count = step(db, batch_size)
+        db.commit()
+        total += count
+        if count < batch_size:
+            return total
+
+
+def run_job_lifecycle() -> None:
+    """Expire and archive jobs until a batch comes back short; one worker per interval."""
+    if not cache.acquire_lock("job-lifecycle", ttl=settings.JOB_LIFECYCLE_INTERVAL_SECONDS):
+        return
+    with SessionLocal() as db:
+        expired = _drain(db, expire_jobs, settings.JOB_ARCHIVE_BATCH_SIZE)
+        archived = _drain(db, archive_jobs, settings.JOB_ARCHIVE_BATCH_SIZE)
+    if expired or archived:
+        invalidate_jobs()
+        logger.info("Expired %d jobs and archived %d", expired, archived)
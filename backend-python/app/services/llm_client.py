@@ -0,0 +1,120 @@
+"""Entry point for LLM chat completions, with request coalescing.
+
+All AI services send chat completions through ``create_chat_completion``.
+Identical concurrent requests (same model, parameters and whitespace-normalized
+messages) share one upstream call: within a process through an in-flight
+future, and across workers through a Redis lock plus a short-lived result key.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Dict
+
+from app.core import cache
+from app.core.config import settings
+from app.services import llm_providers
+
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletion
+
+logger = logging.getLogger(__name__)
+
+# How long a finished completion stays readable for waiters on other workers.
+RESULT_TTL_SECONDS = 30
+POLL_INTERVAL_SECONDS = 0.1
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_in_flight: Dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def request_key(params: Dict[str, Any]) -> str:
+    """Stable hash of a completion request with whitespace-normalized messages."""
+    normalized = dict(params)
+    normalized["messages"] = [
+        {**message, "content": _WHITESPACE_RE.sub(" ", message.get("content") or "").strip()}
+        for message in params.get("messages", [])
+    ]
+    payload = json.dumps(normalized, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def create_chat_completion(**params: Any) -> ChatCompletion:
+    """
+    Run a chat completion through the configured providers, coalescing duplicates.
+
+    The first caller for a key performs the request; concurrent callers in the
+    same process block on its future, and callers on other workers wait for
+    the result it publishes to Redis.
+    """
+    params.setdefault("model", settings.OPENAI_MODEL)
+    key = request_key(params)
+
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        leader = future is None
+        if leader:
+            future = _in_flight[key] = Future()
+    if not leader:
+        logger.debug("Coalesced LLM request %s onto in-flight call", key[:12])
+        return future.result()
+
+    try:
+        result = _run_across_workers(key, params)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _in_flight_lock:
+            _in_flight.pop(key, None)
+
+
+def _run_across_workers(key: str, params: Dict[str, Any]) -> ChatCompletion:
+    lock_name = f"llm:{key}"
+    result_key = f"jf:llm:result:{key}"
+    backend = cache.get_backend()
+    deadline = time.monotonic() + settings.LLM_COALESCE_WAIT_SECONDS
+
+    token = cache.acquire_lock(lock_name, ttl=settings.LLM_COALESCE_WAIT_SECONDS)
+    while token is None:
+        # Another worker owns this request; wait for its published result.
+        payload = backend.get(result_key)
+        if payload is not None:
+            logger.debug("Coalesced LLM request %s onto another worker", key[:12])
+            return _parse_completion(payload)
+        if time.monotonic() >= deadline:
+            return _call_upstream(params)
+        time.sleep(POLL_INTERVAL_SECONDS)
+        # Succeeds once the owner has finished or expired; it may have published.
+        token = cache.acquire_lock(lock_name, ttl=settings.LLM_COALESCE_WAIT_SECONDS)
+
+    try:
+        # The previous owner can publish and release between our last poll and
+        # taking the lock, so check for its result before calling upstream.
+        payload = backend.get(result_key)
+        if payload is not None:
+            return _parse_completion(payload)
+        completion = _call_upstream(params)
+        backend.set(result_key, completion.model_dump_json().encode(), RESULT_TTL_SECONDS)
+        return completion
+    finally:
+        cache.release_lock(lock_name, token)
+
+
+def _parse_completion(payload: bytes) -> ChatCompletion:
+    from openai.types.chat import ChatCompletion
+
+    return ChatCompletion.model_validate_json(payload)
+
+
+def _call_upstream(params: Dict[str, Any]) -> ChatCompletion:
+    return llm_providers.complete(params)
@@ -0,0 +1,226 @@
+"""Traffic control for the LLM upstream: adaptive concurrency and retries.
+
+``AdaptiveLimiter`` caps in-flight completions per process and adjusts the cap
+AIMD-style: it grows by one slot per window of healthy responses and halves
+when the upstream answers 429/5xx, times out or slows past the latency target.
+``call_with_retries`` retries retryable failures with full jitter inside a
+deadline and honours ``Retry-After``, sharing the back-off across workers
+through the cache backend so a 429 pauses every worker, not just one. Each
+provider gets its own limiter so one provider's overload does not throttle
+failover traffic to another.
+"""
+from __future__ import annotations
+
+import logging
+import random
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+from app.core import cache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+BACKOFF_KEY = "jf:llm:backoff-until:{provider}"
+RETRY_BASE_SECONDS = 0.5
+RETRY_CAP_SECONDS = 8.0
+# Minimum spacing between two multiplicative decreases, so one burst of 429s
+# halves the limit once instead of collapsing it to the floor.
+DECREASE_COOLDOWN_SECONDS = 2.0
+OVERLOAD_OUTCOMES = frozenset({"throttled", "server_errors", "timeouts"})
+
+
+class UpstreamBusyError(Exception):
+    """Raised when no upstream slot frees up before the request deadline."""
+
+
+class CallCancelled(Exception):
+    """Raised inside a call abandoned by its caller, e.g. the loser of a hedge."""
+
+
+class AdaptiveLimiter:
+    def __init__(self, initial: int, minimum: int, maximum: int, latency_target: float) -> None:
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self.queued = 0
+        self._cond = threading.Condition()
+        self._last_decrease = 0.0
+        self._backoff_until = 0.0
+        self.counters: Dict[str, int] = {
+            "ok": 0, "throttled": 0, "server_errors": 0, "timeouts": 0,
+            "connection_errors": 0, "client_errors": 0, "cancelled": 0, "retries": 0, "rejected": 0,
+        }
+
+    def acquire(self, deadline: float) -> None:
+        with self._cond:
+            self.queued += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = self._backoff_until - now
+                    if wait <= 0 and self.in_flight < int(self.limit):
+                        self.in_flight += 1
+                        return
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self.counters["rejected"] += 1
+                        raise UpstreamBusyError("LLM upstream is saturated; try again shortly")
+                    self._cond.wait(min(remaining, wait) if wait > 0 else remaining)
+            finally:
+                self.queued -= 1
+
+    def release(self, latency: float, outcome: str) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self.counters[outcome] = self.counters.get(outcome, 0) + 1
+            if outcome in OVERLOAD_OUTCOMES or (outcome == "ok" and latency > self.latency_target):
+                now = time.monotonic()
+                if now - self._last_decrease >= DECREASE_COOLDOWN_SECONDS:
+                    self.limit = max(self.minimum, self.limit / 2)
+                    self._last_decrease = now
+                    logger.warning("LLM concurrency limit lowered to %d (%s)", int(self.limit), outcome)
+            elif outcome == "ok":
+                # Additive increase: roughly +1 slot per `limit` successful calls.
+                self.limit = min(self.maximum, self.limit + 1.0 / max(self.limit, 1.0))
+            self._cond.notify_all()
+
+    def record_retry(self) -> None:
+        with self._cond:
+            self.counters["retries"] += 1
+
+    def back_off(self, seconds: float) -> None:
+        with self._cond:
+            self._backoff_until = max(self._backoff_until, time.monotonic() + seconds)
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "queue_depth": self.queued,
+                "backoff_seconds": round(max(0.0, self._backoff_until - time.monotonic()), 2),
+                **self.counters,
+            }
+
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(provider: str) -> AdaptiveLimiter:
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = _limiters[provider] = AdaptiveLimiter(
+                initial=settings.LLM_CONCURRENCY_INITIAL,
+                minimum=settings.LLM_CONCURRENCY_MIN,
+                maximum=settings.LLM_CONCURRENCY_MAX,
+                latency_target=settings.LLM_LATENCY_TARGET_SECONDS,
+            )
+        return limiter
+
+
+def snapshot_all() -> Dict[str, Dict[str, object]]:
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {name: limiter.snapshot() for name, limiter in limiters.items()}
+
+
+def classify(exc: BaseException) -> Tuple[str, bool, Optional[float]]:
+    """Return ``(outcome, retryable, retry_after)`` for an SDK exception."""
+    if isinstance(exc, CallCancelled):
+        return "cancelled", False, None
+    # Both SDKs share the same error hierarchy; only check the ones in use.
+    for sdk in filter(None, (sys.modules.get("openai"), sys.modules.get("anthropic"))):
+        if isinstance(exc, sdk.APITimeoutError):
+            return "timeouts", True, None
+        if isinstance(exc, sdk.APIConnectionError):
+            return "connection_errors", True, None
+        if isinstance(exc, sdk.APIStatusError):
+            if exc.status_code == 429:
+                return "throttled", True, _retry_after(exc.response)
+            if exc.status_code >= 500:
+                return "server_errors", True, _retry_after(exc.response)
+    return "client_errors", False, None
+
+
+def _retry_after(response) -> Optional[float]:
+    value = response.headers.get("retry-after") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+def _shared_backoff_remaining(provider: str) -> float:
+    payload = cache.get_backend().get(BACKOFF_KEY.format(provider=provider))
+    if not payload:
+        return 0.0
+    return max(0.0, float(payload) - time.time())
+
+
+def _publish_backoff(provider: str, seconds: float) -> None:
+    cache.get_backend().set(BACKOFF_KEY.format(provider=provider), str(time.time() + seconds).encode(), seconds)
+
+
+def call_with_retries(
+    call: Callable[[float], T],
+    *,
+    provider: str = "openai",
+    deadline: Optional[float] = None,
+    max_retries: Optional[int] = None,
+) -> T:
+    """
+    Run ``call(timeout)`` under ``provider``'s limiter, retrying transient failures.
+
+    ``call`` receives the seconds left before ``deadline`` (a ``time.monotonic``
+    timestamp) and should use it as its request timeout. Non-retryable errors
+    propagate immediately.
+    """
+    if deadline is None:
+        deadline = time.monotonic() + settings.LLM_DEADLINE_SECONDS
+    if max_retries is None:
+        max_retries = settings.LLM_MAX_RETRIES
+    limiter = get_limiter(provider)
+    attempt = 0
+    while True:
+        shared = _shared_backoff_remaining(provider)
+        if shared:
+            limiter.back_off(shared)
+        limiter.acquire(deadline)
+        started = time.monotonic()
+        try:
+            result = call(max(deadline - started, 1.0))
+        except Exception as exc:
+            outcome, retryable, retry_after = classify(exc)
+            limiter.release(time.monotonic() - started, outcome)
+            if not retryable:
+                raise
+            if retry_after:
+                limiter.back_off(retry_after)
+                _publish_backoff(provider, retry_after)
+            attempt += 1
+            jitter = random.uniform(0, min(RETRY_CAP_SECONDS, RETRY_BASE_SECONDS * 2 ** attempt))
+            delay = max(retry_after or 0.0, jitter)
+            if attempt > max_retries or time.monotonic() + delay >= deadline:
+                raise
+            limiter.record_retry()
+            logger.info("Retrying %s call in %.2fs after %s (attempt %d)", provider, delay, outcome, attempt)
+            time.sleep(delay)
+        else:
+            limiter.release(time.monotonic() - started, "ok")
+            return result
@@ -0,0 +1,443 @@
+"""LLM providers with ordered failover and hedged requests.
+
+``LLM_PROVIDERS`` lists the providers to try in order; unconfigured entries
+are skipped. Completions are streamed so the time to first token is visible:
+if the leading attempt has produced nothing by the hedge delay (the observed
+p95 first-token latency), the next provider is raced against it and whichever
+streams first wins while the other is cancelled: its response is closed,
+which drops that one connection from the provider's keep-alive pool (an
+attempt still waiting for headers is closed as soon as they arrive). A failed
+attempt fails over to the next provider. Every result is normalized to an OpenAI
+``ChatCompletion`` so callers do not care which provider answered.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+from abc import ABC, abstractmethod
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional
+
+from app.core.config import settings
+from app.services.llm_limiter import CallCancelled, UpstreamBusyError, call_with_retries
+
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletion
+
+logger = logging.getLogger(__name__)
+
+# First-token samples kept per provider, and how many are needed before the
+# observed p95 replaces LLM_HEDGE_DELAY_SECONDS.
+LATENCY_WINDOW = 200
+MIN_LATENCY_SAMPLES = 20
+ANTHROPIC_DEFAULT_MAX_TOKENS = 2048
+
+_shutdown_hooks: List[Callable[[], None]] = []
+
+
+def _build_completion(
+    model: str,
+    text: str,
+    finish_reason: Optional[str],
+    prompt_tokens: Optional[int],
+    completion_tokens: Optional[int],
+) -> ChatCompletion:
+    from openai.types.chat import ChatCompletion
+
+    usage = None
+    if prompt_tokens is not None and completion_tokens is not None:
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+    return ChatCompletion.model_validate({
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "finish_reason": finish_reason or "stop",
+            "message": {"role": "assistant", "content": text},
+        }],
+        "usage": usage,
+    })
+
+
+class Cancellation:
+    """Set when an attempt loses a hedge; closes whatever the attempt has open."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._closers: List[Callable[[], None]] = []
+
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    def set(self) -> None:
+        with self._lock:
+            self._event.set()
+            closers, self._closers = self._closers, []
+        for close in closers:
+            try:
+                close()
+            except Exception:
+                logger.debug("Closing a cancelled LLM request failed", exc_info=True)
+
+    def on_cancel(self, close: Callable[[], None]) -> None:
+        """Run ``close`` on cancellation, or right away if already cancelled."""
+        with self._lock:
+            if not self._event.is_set():
+                self._closers.append(close)
+                return
+        close()
+
+
+def _http_client(base_url: Optional[str] = None):
+    # One per provider, shared by every request so connections are kept alive.
+    import httpx
+
+    http_client = httpx.Client(
+        base_url=base_url or "",
+        timeout=httpx.Timeout(60.0, connect=30.0),
+        follow_redirects=True,
+    )
+    _shutdown_hooks.append(http_client.close)
+    return http_client
+
+
+class Provider(ABC):
+    """One upstream endpoint; ``stream`` returns the full completion."""
+
+    name: str
+    model: Optional[str]
+
+    @abstractmethod
+    def stream(
+        self,
+        params: Dict[str, Any],
+        timeout: float,
+        on_first_token: Callable[[], None],
+        cancelled: Cancellation,
+    ) -> ChatCompletion:
+        """Stream one completion; raise CallCancelled once ``cancelled`` is set."""
+
+
+class OpenAICompatibleProvider(Provider):
+    def __init__(self, name: str, base_url: str, api_key: str, model: Optional[str] = None) -> None:
+        self.name = name
+        self.base_url = base_url
+        self.api_key = api_key
+        # None means "use the model the caller asked for".
+        self.model = model
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    # Imported on first use to keep the SDKs off the API cold-start path.
+                    from openai import OpenAI
+
+                    # Provide a custom HTTPX client so we control compatibility with the OpenAI SDK
+                    self._client = OpenAI(
+                        api_key=self.api_key,
+                        base_url=self.base_url,
+                        default_headers={
+                            "HTTP-Referer": "http://localhost:3000",
+                            "X-Title": "JobForge AI",
+                        },
+                        http_client=_http_client(self.base_url),
+                        # Retries are owned by llm_limiter so they respect the shared back-off.
+                        max_retries=0,
+                    )
+        return self._client
+
+    def stream(self, params, timeout, on_first_token, cancelled):
+        request = {**params, "stream": True}
+        if self.model:
+            request["model"] = self.model
+        model = request["model"]
+        parts: List[str] = []
+        finish_reason = None
+        usage = None
+        try:
+            response = self.client.chat.completions.create(**request, timeout=timeout)
+            cancelled.on_cancel(response.response.close)
+            try:
+                for chunk in response:
+                    if cancelled.is_set():
+                        raise CallCancelled(self.name)
+                    model = chunk.model or model
+                    # Providers such as OpenRouter report usage on the final chunk.
+                    chunk_usage = getattr(chunk, "usage", None)
+                    if chunk_usage:
+                        usage = chunk_usage if isinstance(chunk_usage, dict) else chunk_usage.model_dump()
+                    for choice in chunk.choices:
+                        if choice.delta.content:
+                            if not parts:
+                                on_first_token()
+                            parts.append(choice.delta.content)
+                        if choice.finish_reason:
+                            finish_reason = choice.finish_reason
+            finally:
+                response.response.close()
+        except Exception as exc:
+            _raise_if_cancelled(exc, cancelled, self.name)
+            raise
+        return _build_completion(
+            model,
+            "".join(parts),
+            finish_reason,
+            usage.get("prompt_tokens") if usage else None,
+            usage.get("completion_tokens") if usage else None,
+        )
+
+
+class AnthropicProvider(Provider):
+    def __init__(self, api_key: str, model: str) -> None:
+        self.name = "anthropic"
+        self.api_key = api_key
+        self.model = model
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import anthropic
+
+                    self._client = anthropic.Anthropic(
+                        api_key=self.api_key,
+                        base_url=settings.ANTHROPIC_BASE_URL,
+                        http_client=_http_client(),
+                        max_retries=0,
+                    )
+        return self._client
+
+    def stream(self, params, timeout, on_first_token, cancelled):
+        messages = params.get("messages", [])
+        system = "\n\n".join(m["content"] for m in messages if m["role"] == "system")
+        request: Dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": params.get("max_tokens") or ANTHROPIC_DEFAULT_MAX_TOKENS,
+            "messages": [m for m in messages if m["role"] != "system"],
+            "timeout": timeout,
+        }
+        if system:
+            request["system"] = system
+        if params.get("temperature") is not None:
+            request["temperature"] = params["temperature"]
+
+        parts: List[str] = []
+        usage: Dict[str, int] = {}
+        try:
+            # The pinned SDK (0.8.x) only ships the Messages API under ``beta``.
+            with self.client.beta.messages.stream(**request) as response:
+                cancelled.on_cancel(response.close)
+                for event in response:
+                    if cancelled.is_set():
+                        raise CallCancelled(self.name)
+                    if event.type == "content_block_delta" and event.delta.text:
+                        if not parts:
+                            on_first_token()
+                        parts.append(event.delta.text)
+                    elif event.type in ("message_start", "message_delta"):
+                        usage.update(_anthropic_usage(event.message if event.type == "message_start" else event))
+                final = response.get_final_message()
+        except Exception as exc:
+            _raise_if_cancelled(exc, cancelled, self.name)
+            raise
+        return _build_completion(
+            final.model,
+            "".join(parts),
+            "length" if final.stop_reason == "max_tokens" else "stop",
+            usage.get("input_tokens"),
+            usage.get("output_tokens"),
+        )
+
+
+def _anthropic_usage(item) -> Dict[str, int]:
+    # The 0.8.x beta types do not declare ``usage``; the SDK keeps the field the
+    # API sends as an untyped extra (a dict).
+    usage = getattr(item, "usage", None)
+    if usage is None:
+        return {}
+    if not isinstance(usage, dict):
+        usage = usage.model_dump()
+    return {key: value for key, value in usage.items() if value is not None}
+
+
+def _raise_if_cancelled(exc: Exception, cancelled: Cancellation, provider: str) -> None:
+    # Closing the connection under a cancelled request surfaces as a
+    # connection error, which must not be retried or counted as a failure.
+    if cancelled.is_set() and not isinstance(exc, CallCancelled):
+        raise CallCancelled(provider) from exc
+
+
+@lru_cache()
+def get_providers() -> List[Provider]:
+    available: Dict[str, Callable[[], Optional[Provider]]] = {
+        "openai": lambda: OpenAICompatibleProvider("openai", settings.OPENAI_BASE_URL, settings.OPENAI_API_KEY),
+        "fallback": lambda: OpenAICompatibleProvider(
+            "fallback",
+            settings.LLM_FALLBACK_BASE_URL,
+            settings.LLM_FALLBACK_API_KEY or settings.OPENAI_API_KEY,
+            settings.LLM_FALLBACK_MODEL,
+        ) if settings.LLM_FALLBACK_BASE_URL else None,
+        "anthropic": lambda: AnthropicProvider(
+            settings.ANTHROPIC_API_KEY, settings.ANTHROPIC_MODEL
+        ) if settings.ANTHROPIC_API_KEY else None,
+    }
+    providers = []
+    for name in settings.LLM_PROVIDERS:
+        factory = available.get(name)
+        if factory is None:
+            logger.warning("Ignoring unknown LLM provider %r", name)
+            continue
+        provider = factory()
+        if provider is not None:
+            providers.append(provider)
+    if not providers:
+        raise RuntimeError("No LLM provider is configured; check LLM_PROVIDERS")
+    return providers
+
+
+def _shutdown_clients() -> None:
+    for hook in _shutdown_hooks:
+        hook()
+
+
+atexit.register(_shutdown_clients)
+
+
+_first_token_latency: Dict[str, Deque[float]] = {}
+_latency_lock = threading.Lock()
+
+
+def _record_first_token(provider: str, seconds: float) -> None:
+    with _latency_lock:
+        _first_token_latency.setdefault(provider, deque(maxlen=LATENCY_WINDOW)).append(seconds)
+
+
+def hedge_delay(provider: str) -> float:
+    """Seconds to wait for a first token before hedging: the observed p95."""
+    with _latency_lock:
+        samples = sorted(_first_token_latency.get(provider, ()))
+    if len(samples) < MIN_LATENCY_SAMPLES:
+        return settings.LLM_HEDGE_DELAY_SECONDS
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return max(settings.LLM_HEDGE_MIN_SECONDS, p95)
+
+
+class _Attempt:
+    def __init__(self, provider: Provider, params: Dict[str, Any], deadline: float, events: queue.Queue) -> None:
+        self.provider = provider
+        self.params = params
+        self.deadline = deadline
+        self.events = events
+        self.cancelled = Cancellation()
+
+    def start(self, max_retries: Optional[int]) -> None:
+        threading.Thread(
+            target=self._run, args=(max_retries,), name=f"llm-{self.provider.name}", daemon=True
+        ).start()
+
+    def _run(self, max_retries: Optional[int]) -> None:
+        started = time.monotonic()
+
+        def on_first_token() -> None:
+            _record_first_token(self.provider.name, time.monotonic() - started)
+            self.events.put(("first_token", self, None))
+
+        try:
+            result = call_with_retries(
+                lambda timeout: self.provider.stream(self.params, timeout, on_first_token, self.cancelled),
+                provider=self.provider.name,
+                deadline=self.deadline,
+                max_retries=max_retries,
+            )
+        except Exception as exc:
+            self.events.put(("error", self, exc))
+        else:
+            self.events.put(("done", self, result))
+
+
+def complete(params: Dict[str, Any]) -> ChatCompletion:
+    """Run a chat completion across the configured providers."""
+    pending = list(get_providers())
+    deadline = time.monotonic() + settings.LLM_DEADLINE_SECONDS
+    events: queue.Queue = queue.Queue()
+    active: List[_Attempt] = []
+    winner: Optional[_Attempt] = None
+    last_error: Optional[Exception] = None
+
+    def launch() -> None:
+        attempt = _Attempt(pending.pop(0), params, deadline, events)
+        active.append(attempt)
+        # With somewhere to fail over to, failing over beats retrying in place.
+        attempt.start(max_retries=0 if pending else None)
+
+    def cancel_others(keep: _Attempt) -> None:
+        for attempt in active:
+            if attempt is not keep:
+                attempt.cancelled.set()
+        active[:] = [keep]
+
+    launch()
+    hedge_at = (
+        time.monotonic() + hedge_delay(active[0].provider.name)
+        if settings.LLM_HEDGE_ENABLED and pending
+        else None
+    )
+
+    while active:
+        now = time.monotonic()
+        if now >= deadline:
+            break
+        wait = deadline - now
+        if winner is None and hedge_at is not None and pending:
+            wait = min(wait, max(hedge_at - now, 0.0))
+        try:
+            kind, attempt, payload = events.get(timeout=wait)
+        except queue.Empty:
+            if winner is None and hedge_at is not None and pending and time.monotonic() >= hedge_at:
+                logger.info("No first token from %s; hedging to %s", active[0].provider.name, pending[0].name)
+                launch()
+                hedge_at = None
+            continue
+
+        if attempt not in active:
+            continue  # a cancelled loser finishing up
+        if kind == "first_token":
+            if winner is None:
+                winner = attempt
+                cancel_others(attempt)
+        elif kind == "done":
+            cancel_others(attempt)
+            return payload
+        else:
+            active.remove(attempt)
+            if attempt is winner:
+                winner = None
+            last_error = payload
+            logger.warning("LLM provider %s failed: %s", attempt.provider.name, payload)
+            if not active and pending:
+                launch()
+
+    for attempt in active:
+        attempt.cancelled.set()
+    if last_error is not None:
+        raise last_error
+    raise UpstreamBusyError("No LLM provider answered before the deadline")
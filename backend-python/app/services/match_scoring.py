@@ -0,0 +1,237 @@
+"""Local resume-to-job match scoring.
+
+Jobs are indexed as a sparse matrix of BM25-weighted terms (title, body,
+requirements and ``ai_required_skills``, with title and skills boosted) with
+L2-normalized rows. A resume is weighted the same way, so ranking every job
+is a single sparse matrix-vector product and a score is the cosine
+similarity scaled to 0-100. Requests never build the index: it is built in
+a background thread at startup (``warm_index``) and rebuilt by a periodic
+task every ``MATCH_INDEX_REFRESH_SECONDS`` once the ``jobs`` cache namespace
+has moved on. Until the first build finishes, ``score_job`` returns None and
+``rank_jobs`` returns None, so callers store no score rather than wait.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core import cache
+from app.core.database import SessionLocal
+from app.models.job import Job
+from app.services.job_cache import NAMESPACE as JOBS_NAMESPACE
+
+if TYPE_CHECKING:
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+logger = logging.getLogger(__name__)
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 3
+SKILL_WEIGHT = 3
+
+# Keeps tokens such as c++, c#, node.js and ci/cd intact.
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+_TAG_RE = re.compile(r"<[^>]+>")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the this to we will with you "
+    "your who what their they them us etc able work working team role including".split()
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return [t for t in _TOKEN_RE.findall(_TAG_RE.sub(" ", text).lower()) if t not in _STOPWORDS]
+
+
+def _job_terms(job) -> Counter:
+    counts = Counter(tokenize(job.raw_description or job.description))
+    counts.update(tokenize(job.requirements))
+    for term in tokenize(job.title):
+        counts[term] += TITLE_WEIGHT
+    for skill in job.ai_required_skills or ():
+        for term in tokenize(skill):
+            counts[term] += SKILL_WEIGHT
+    return counts
+
+
+class MatchIndex:
+    def __init__(
+        self,
+        job_ids: List[UUID],
+        matrix: csr_matrix,
+        vocabulary: Dict[str, int],
+        idf: np.ndarray,
+        avg_length: float,
+        version: int,
+    ) -> None:
+        self.job_ids = job_ids
+        self.matrix = matrix
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.avg_length = avg_length
+        self.version = version
+        self._unseen_idf = math.log(1 + (len(job_ids) + 0.5) / 0.5)
+
+    def _term_idf(self, term: str) -> float:
+        column = self.vocabulary.get(term)
+        return float(self.idf[column]) if column is not None else self._unseen_idf
+
+    def weigh(self, counts: Counter) -> Dict[str, float]:
+        """BM25-saturated, L2-normalized term weights for an unindexed document."""
+        length = sum(counts.values()) or 1
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (self.avg_length or length))
+        weights = {
+            term: self._term_idf(term) * tf * (BM25_K1 + 1) / (tf + norm)
+            for term, tf in counts.items()
+        }
+        magnitude = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        return {term: w / magnitude for term, w in weights.items()}
+
+    def query_vector(self, resume_text: str) -> np.ndarray:
+        import numpy as np
+
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for term, weight in self.weigh(Counter(tokenize(resume_text))).items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                vector[column] = weight
+        return vector
+
+    def rank(self, resume_text: str, limit: int) -> List[Tuple[UUID, float]]:
+        import numpy as np
+
+        if not self.job_ids:
+            return []
+        scores = self.matrix @ self.query_vector(resume_text)
+        limit = min(limit, len(scores))
+        top = np.argpartition(scores, -limit)[-limit:]
+        top = top[np.argsort(scores[top])[::-1]]
+        return [(self.job_ids[i], _to_percent(scores[i])) for i in top if scores[i] > 0]
+
+
+def _to_percent(cosine: float) -> float:
+    return round(min(max(float(cosine), 0.0), 1.0) * 100, 1)
+
+
+def build_index(db: Session) -> MatchIndex:
+    import numpy as np
+    from scipy.sparse import csr_matrix, diags
+
+    version = cache.namespace_version(JOBS_NAMESPACE)
+    started = time.monotonic()
+    vocabulary: Dict[str, int] = {}
+    job_ids: List[UUID] = []
+    indptr = [0]
+    indices: List[int] = []
+    term_freqs: List[int] = []
+    lengths: List[int] = []
+
+    rows = db.query(
+        Job.id, Job.title, Job.description, Job.raw_description, Job.requirements, Job.ai_required_skills
+    ).filter(
+        Job.is_active == True,
+        Job.canonical_job_id.is_(None)
+    ).yield_per(2000)
+    for row in rows:
+        counts = _job_terms(row)
+        for term, tf in counts.items():
+            indices.append(vocabulary.setdefault(term, len(vocabulary)))
+            term_freqs.append(tf)
+        indptr.append(len(indices))
+        lengths.append(sum(counts.values()))
+        job_ids.append(row.id)
+
+    n_docs, n_terms = len(job_ids), len(vocabulary)
+    columns = np.asarray(indices, dtype=np.int32)
+    tf = np.asarray(term_freqs, dtype=np.float32)
+    doc_lengths = np.asarray(lengths, dtype=np.float32)
+    avg_length = float(doc_lengths.mean()) if n_docs else 0.0
+
+    doc_freq = np.bincount(columns, minlength=n_terms)
+    idf = np.log1p((n_docs - doc_freq + 0.5) / (doc_freq + 0.5)).astype(np.float32)
+    row_lengths = np.repeat(doc_lengths, np.diff(indptr))
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * row_lengths / (avg_length or 1.0))
+    weights = idf[columns] * tf * (BM25_K1 + 1) / (tf + norm)
+
+    matrix = csr_matrix((weights, columns, np.asarray(indptr)), shape=(n_docs, n_terms), dtype=np.float32)
+    magnitudes = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    magnitudes[magnitudes == 0] = 1.0
+    matrix = (diags(1.0 / magnitudes) @ matrix).tocsr()
+
+    logger.info(
+        "Built match index: %d jobs, %d terms in %.2fs", n_docs, n_terms, time.monotonic() - started
+    )
+    return MatchIndex(job_ids, matrix, vocabulary, idf, avg_length, version)
+
+
+_index: Optional[MatchIndex] = None
+_build_lock = threading.Lock()
+
+
+def _build() -> None:
+    global _index
+    # A build already in flight will publish a fresh enough index.
+    if not _build_lock.acquire(blocking=False):
+        return
+    try:
+        with SessionLocal() as db:
+            _index = build_index(db)
+    finally:
+        _build_lock.release()
+
+
+def warm_index() -> None:
+    """Build the index in a background thread so the first requests do not wait for it."""
+    threading.Thread(target=_build, name="match-index-build", daemon=True).start()
+
+
+def get_index() -> Optional[MatchIndex]:
+    """The process-wide index, or None while it has not been built yet."""
+    index = _index
+    if index is None and not _build_lock.locked():
+        warm_index()
+    return index
+
+
+def refresh_index() -> None:
+    """Build the index if missing or stale, off the request path (periodic task)."""
+    index = _index
+    if index is not None and cache.namespace_version(JOBS_NAMESPACE) == index.version:
+        return
+    _build()
+
+
+def rank_jobs(db: Session, resume_text: str, limit: int = 20) -> Optional[List[Tuple[UUID, float]]]:
+    """Best-matching active jobs for a resume as ``(job_id, score)``, highest first; None while the index is cold."""
+    index = get_index()
+    return index.rank(resume_text, limit) if index is not None else None
+
+
+def score_job(db: Session, resume_text: Optional[str], job: Job) -> Optional[float]:
+    """Score a single resume/job pair on the 0-100 scale used by ``rank_jobs``; None while the index is cold."""
+    if not resume_text or job is None:
+        return None
+    index = get_index()
+    if index is None:
+        return None
+    resume = index.weigh(Counter(tokenize(resume_text)))
+    posting = index.weigh(_job_terms(job))
+    return _to_percent(_dot(resume, posting))
+
+
+def _dot(left: Dict[str, float], right: Dict[str, float]) -> float:
+    if len(left) > len(right):
+        left, right = right, left
+    return sum(weight * right.get(term, 0.0) for term, weight in left.items())
+
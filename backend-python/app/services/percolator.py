@@ -0,0 +1,197 @@
+"""Match newly ingested jobs against every saved search.
+
+Rather than re-running each saved search, new jobs are run against an
+in-process inverted index of the searches. Every search is posted under one
+key that a job must produce to match it: the leading trigram of its query,
+else its first skill, else one of its equality filters, else a catch-all
+key. A job looks up the keys it produces (the 1-3 character substrings of
+its title, company and location, its skills and filter values) and only the
+searches found there are checked in full. Matches are appended to
+``saved_search_matches``, which backs each user's feed.
+
+The index is rebuilt when the ``saved_searches`` cache namespace moves on,
+so every worker sees a change on its next ingest.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core import cache
+from app.models.job import Job
+from app.models.saved_search import SavedSearch, SavedSearchMatch
+from app.schemas.job import JobFilters
+
+logger = logging.getLogger(__name__)
+
+NAMESPACE = "saved_searches"
+KEY_LENGTH = 3
+INSERT_BATCH_SIZE = 1000
+EQUALITY_FILTERS = ("remote_type", "job_type", "experience_level", "source_site")
+_CATCH_ALL = ("*",)
+
+
+class _Search(NamedTuple):
+    id: UUID
+    user_id: UUID
+    query: Optional[str]
+    skills: frozenset
+    filters: JobFilters
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # posted_date is stored naive UTC; filters may arrive with an offset.
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _load_search(row) -> _Search:
+    filters = JobFilters.model_validate(row.filters or {})
+    filters.posted_after = _naive_utc(filters.posted_after)
+    filters.posted_before = _naive_utc(filters.posted_before)
+    return _Search(
+        id=row.id,
+        user_id=row.user_id,
+        query=row.query.lower() if row.query else None,
+        skills=frozenset(row.skills or ()),
+        filters=filters,
+    )
+
+
+def _index_key(search: _Search) -> tuple:
+    if search.query:
+        return ("q", search.query[:KEY_LENGTH])
+    if search.skills:
+        return ("skill", min(search.skills))
+    for name in EQUALITY_FILTERS:
+        value = getattr(search.filters, name)
+        if value:
+            return (name, value)
+    return _CATCH_ALL
+
+
+def _job_texts(job) -> List[str]:
+    return [value.lower() for value in (job.title, job.company, job.location) if value]
+
+
+def _job_keys(job) -> Set[tuple]:
+    keys = {_CATCH_ALL}
+    for text in _job_texts(job):
+        for size in range(1, KEY_LENGTH + 1):
+            keys.update(("q", text[i:i + size]) for i in range(len(text) - size + 1))
+    keys.update(("skill", skill) for skill in job.skills_normalized or ())
+    keys.update((name, getattr(job, name)) for name in EQUALITY_FILTERS if getattr(job, name))
+    return keys
+
+
+def matches(search: _Search, job) -> bool:
+    """Python mirror of the /jobs/search predicate (see crud.job._listing_query)"""
+    if search.query and not any(search.query in text for text in _job_texts(job)):
+        return False
+    if search.skills and not search.skills.issubset(job.skills_normalized or ()):
+        return False
+    filters = search.filters
+    for name in EQUALITY_FILTERS:
+        value = getattr(filters, name)
+        if value and getattr(job, name) != value:
+            return False
+    if filters.salary_min is not None:
+        ceiling = job.salary_max if job.salary_max is not None else job.salary_min
+        if ceiling is None or ceiling < filters.salary_min:
+            return False
+    if filters.salary_max is not None:
+        floor = job.salary_min if job.salary_min is not None else job.salary_max
+        if floor is None or floor > filters.salary_max:
+            return False
+    if filters.posted_after is not None and (job.posted_date is None or job.posted_date < filters.posted_after):
+        return False
+    if filters.posted_before is not None and (job.posted_date is None or job.posted_date >= filters.posted_before):
+        return False
+    return True
+
+
+class SearchIndex:
+    def __init__(self, searches: Iterable[_Search], version: int) -> None:
+        self.postings: Dict[tuple, List[_Search]] = defaultdict(list)
+        for search in searches:
+            self.postings[_index_key(search)].append(search)
+        self.version = version
+
+    def match(self, job) -> List[_Search]:
+        return [
+            search
+            for key in _job_keys(job)
+            for search in self.postings.get(key, ())
+            if matches(search, job)
+        ]
+
+
+def build_index(db: Session) -> SearchIndex:
+    version = cache.namespace_version(NAMESPACE)
+    rows = db.query(
+        SavedSearch.id, SavedSearch.user_id, SavedSearch.query, SavedSearch.skills, SavedSearch.filters
+    ).yield_per(2000)
+    return SearchIndex((_load_search(row) for row in rows), version)
+
+
+_index: Optional[SearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index(db: Session) -> SearchIndex:
+    """Return the process-wide index, rebuilding it after saved searches change."""
+    global _index
+    version = cache.namespace_version(NAMESPACE)
+    index = _index
+    if index is not None and index.version == version:
+        return index
+    with _index_lock:
+        if _index is None or _index.version != version:
+            _index = build_index(db)
+        return _index
+
+
+def invalidate_saved_searches() -> None:
+    cache.bump_namespace(NAMESPACE)
+
+
+def percolate_jobs(db: Session, job_ids: Iterable[UUID]) -> int:
+    """
+    Record feed matches for the given jobs that are listed (active, canonical).
+
+    Runs in the caller's transaction and does not commit. Returns the number
+    of (search, job) matches found.
+    """
+    job_ids = list(job_ids)
+    if not job_ids:
+        return 0
+    index = get_index(db)
+    if not index.postings:
+        return 0
+    jobs = db.query(
+        Job.id, Job.title, Job.company, Job.location, Job.skills_normalized, Job.salary_min,
+        Job.salary_max, Job.posted_date, *[getattr(Job, name) for name in EQUALITY_FILTERS],
+    ).filter(
+        Job.id.in_(job_ids),
+        Job.is_active == True,
+        Job.canonical_job_id.is_(None)
+    ).all()
+    rows = [
+        {"saved_search_id": search.id, "user_id": search.user_id, "job_id": job.id}
+        for job in jobs
+        for search in index.match(job)
+    ]
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        db.execute(insert(SavedSearchMatch).values(rows[start:start + INSERT_BATCH_SIZE]).on_conflict_do_nothing(
+            constraint="uq_saved_search_matches_search_job"
+        ))
+    logger.debug("Percolated %d jobs against saved searches: %d matches", len(jobs), len(rows))
+    return len(rows)
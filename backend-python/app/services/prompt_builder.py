@@ -0,0 +1,185 @@
+"""Token-budgeted prompt assembly shared by the LLM services.
+
+Scraped job descriptions and resumes can run to tens of thousands of tokens,
+most of it markup and boilerplate. ``PromptBuilder`` cleans and trims each
+variable section to its own token budget, keeping requirement-style lines
+first, and reports per-section token counts before the upstream call.
+"""
+from __future__ import annotations
+
+import html
+import logging
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TRUNCATION_MARKER = "\n[…truncated]"
+
+_TAG_RE = re.compile(r"<(script|style)\b.*?</\1>|<[^>]+>", re.IGNORECASE | re.DOTALL)
+_BLOCK_TAG_RE = re.compile(r"<\s*(br|/p|/div|/li|/h\d|/tr)\b[^>]*>", re.IGNORECASE)
+_SPACE_RE = re.compile(r"[ \t\u00a0]+")
+_LINE_KEY_RE = re.compile(r"[^a-z0-9]+")
+_HEADER_RE = re.compile(r"^(#+\s*)?[A-Z][^.!?]{0,60}$")
+_PRIORITY_HEADER_RE = re.compile(
+    r"requirement|qualification|what you.?ll need|must have|skills|experience|you have|about you",
+    re.IGNORECASE,
+)
+_PRIORITY_LINE_RE = re.compile(
+    r"\b(required|must|minimum|\d+\+? years|proficien|experience (with|in)|degree|certif)",
+    re.IGNORECASE,
+)
+_BOILERPLATE_RE = re.compile(
+    r"equal opportunity|eeo\b|regardless of (race|gender)|reasonable accommodation|"
+    r"apply now|click (here|apply)|share this job|follow us|cookie|privacy policy|"
+    r"all rights reserved|we are an? .{0,40}employer|e-?verify",
+    re.IGNORECASE,
+)
+
+
+@lru_cache()
+def _encoding(model: str):
+    try:
+        import tiktoken
+    except ImportError:  # pragma: no cover - tiktoken is pinned in requirements
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # OpenRouter/local model names are unknown to tiktoken; cl100k is a close proxy.
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    encoding = _encoding(model or settings.OPENAI_MODEL)
+    if encoding is None:
+        return max(1, len(text) // 4) if text else 0
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _truncate_tokens(text: str, budget: int, model: str) -> str:
+    encoding = _encoding(model)
+    if encoding is None:
+        return text[: budget * 4]
+    return encoding.decode(encoding.encode(text, disallowed_special=())[:budget])
+
+
+def clean_text(text: Optional[str]) -> str:
+    """Strip HTML remnants, boilerplate and repeated lines from scraped text."""
+    if not text:
+        return ""
+    text = _BLOCK_TAG_RE.sub("\n", text)
+    text = html.unescape(_TAG_RE.sub(" ", text))
+    seen = set()
+    lines: List[str] = []
+    for raw_line in text.splitlines():
+        line = _SPACE_RE.sub(" ", raw_line).strip()
+        if not line:
+            if lines and lines[-1]:
+                lines.append("")
+            continue
+        key = _LINE_KEY_RE.sub("", line.lower())
+        if key in seen or _BOILERPLATE_RE.search(line):
+            continue
+        seen.add(key)
+        lines.append(line)
+    return "\n".join(lines).strip()
+
+
+def fit_to_budget(text: str, budget: int, model: Optional[str] = None) -> str:
+    """
+    Trim ``text`` to ``budget`` tokens, keeping requirement-style lines first.
+
+    Lines under a requirements/qualifications header or that read like a hard
+    requirement are selected before the rest; the output keeps source order.
+    The first requirement line that no longer fits is cut to the tokens left
+    rather than dropped in favour of shorter, less relevant lines.
+    """
+    model = model or settings.OPENAI_MODEL
+    if count_tokens(text, model) <= budget:
+        return text
+
+    lines = text.splitlines()
+    priority: List[bool] = []
+    in_priority_block = False
+    for line in lines:
+        if _HEADER_RE.match(line) and (line.endswith(":") or len(line.split()) <= 6):
+            in_priority_block = bool(_PRIORITY_HEADER_RE.search(line))
+        priority.append(in_priority_block or bool(_PRIORITY_LINE_RE.search(line)))
+
+    remaining = budget - count_tokens(TRUNCATION_MARKER, model)
+    keep = [False] * len(lines)
+    for wanted in (True, False):
+        for index, line in enumerate(lines):
+            if keep[index] or priority[index] != wanted:
+                continue
+            cost = count_tokens(line + "\n", model)
+            if cost <= remaining:
+                keep[index] = True
+                remaining -= cost
+            elif wanted:
+                lines[index] = _truncate_tokens(line, max(remaining - count_tokens("\n", model), 0), model)
+                keep[index] = bool(lines[index].strip())
+                remaining = 0
+                break
+    kept = "\n".join(line for line, flag in zip(lines, keep) if flag).strip()
+    if not kept:
+        kept = _truncate_tokens(text, max(remaining, 0), model)
+    return kept + TRUNCATION_MARKER
+
+
+@dataclass
+class BuiltPrompt:
+    text: str
+    section_tokens: Dict[str, int]
+    total_tokens: int
+
+
+@dataclass
+class PromptBuilder:
+    """Accumulates prompt sections and enforces per-section token budgets."""
+
+    name: str
+    model: str = field(default_factory=lambda: settings.OPENAI_MODEL)
+    _parts: List[tuple] = field(default_factory=list, init=False, repr=False)
+
+    def add(self, text: str, *, section: str = "instructions") -> "PromptBuilder":
+        """Add fixed text (instructions, labels) that is never trimmed."""
+        self._parts.append((section, text))
+        return self
+
+    def add_budgeted(
+        self,
+        text: Optional[str],
+        *,
+        section: str,
+        budget: int,
+        clean: bool = True,
+        label: Optional[str] = None,
+        placeholder: Optional[str] = None,
+    ) -> "PromptBuilder":
+        """Add variable-length content, cleaned and trimmed to ``budget`` tokens."""
+        body = clean_text(text) if clean else (text or "").strip()
+        if not body:
+            if placeholder is None:
+                return self
+            body = placeholder
+        body = fit_to_budget(body, budget, self.model)
+        self._parts.append((section, f"{label}{body}\n" if label else body))
+        return self
+
+    def build(self) -> BuiltPrompt:
+        section_tokens: Dict[str, int] = {}
+        for section, text in self._parts:
+            section_tokens[section] = section_tokens.get(section, 0) + count_tokens(text, self.model)
+        total = sum(section_tokens.values())
+        logger.info("Prompt %s: %d tokens %s", self.name, total, section_tokens)
+        if total > settings.PROMPT_MAX_TOKENS:
+            logger.warning(
+                "Prompt %s exceeds PROMPT_MAX_TOKENS (%d > %d)", self.name, total, settings.PROMPT_MAX_TOKENS
+            )
+        return BuiltPrompt("".join(text for _, text in self._parts), section_tokens, total)
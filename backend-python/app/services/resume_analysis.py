@@ -1,19 +1,23 @@
 """AI-powered resume analysis helpers."""
 from __future__ import annotations
 
-import atexit
 import json
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Type, TypeVar
+from uuid import UUID
 
-import httpx
-from openai import OpenAI
 from pydantic import BaseModel, Field, ValidationError
 
 from app.core.config import settings
+from app.models.job import Job
+from app.services.llm_client import create_chat_completion
+from app.services.prompt_builder import PromptBuilder
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T", bound=BaseModel)
+
 SYSTEM_PROMPT = (
     "You are an elite Applicant Tracking System (ATS) that scores resumes for job seekers. "
     "Always respond with valid JSON and no additional commentary."
@@ -33,54 +37,45 @@ class ResumeAnalysisResult(BaseModel):
     missing_keywords: List[str] = Field(default_factory=list)
 
 
-_openai_client: Optional[OpenAI] = None
-_httpx_client: Optional[httpx.Client] = None
+class ResumeJobAnalysisResult(ResumeAnalysisResult):
+    job_ref: str
 
 
-def _get_client() -> OpenAI:
-    global _openai_client, _httpx_client
-    if _openai_client is None:
-        # Provide a custom HTTPX client so we control compatibility with the OpenAI SDK.
-        _httpx_client = httpx.Client(
-            base_url=settings.OPENAI_BASE_URL,
-            timeout=httpx.Timeout(60.0, connect=30.0),
-            follow_redirects=True,
-        )
-        _openai_client = OpenAI(
-            api_key=settings.OPENAI_API_KEY,
-            base_url=settings.OPENAI_BASE_URL,
-            default_headers={
-                "HTTP-Referer": "http://localhost:3000",
-                "X-Title": "JobForge AI",
-            },
-            http_client=_httpx_client,
-        )
-    return _openai_client
+class _BatchAnalysisResult(BaseModel):
+    analyses: List[ResumeJobAnalysisResult] = Field(default_factory=list)
 
 
-def _shutdown_httpx_client() -> None:
-    if _httpx_client and not _httpx_client.is_closed:
-        _httpx_client.close()
+# Token budgets for the variable-length parts of the analysis prompt.
+JOB_DESCRIPTION_TOKEN_BUDGET = 1500
+RESUME_TOKEN_BUDGET = 3000
 
+# Batch analysis: jobs per prompt, per-job description budget and how many
+# group prompts may be in flight at once.
+BATCH_JOBS_PER_PROMPT = 4
+BATCH_JOB_TOKEN_BUDGET = 700
+BATCH_MAX_CONCURRENCY = 3
 
-atexit.register(_shutdown_httpx_client)
-    
 
 def _build_prompt(*, resume_text: str, job_title: Optional[str], job_description: Optional[str], target_keywords: Optional[List[str]]) -> str:
-    parts = [
-        "Analyze the resume below and provide structured recommendations.",
-        "Return JSON with the following keys: ats_score (0-100), keyword_match_score (0-100), ",
-        "strengths (list of short bullet points), weaknesses (list), suggestions (list), ",
-        "missing_keywords (list of keywords the candidate should add).",
-    ]
+    builder = PromptBuilder("resume_analysis").add(
+        "Analyze the resume below and provide structured recommendations."
+        "Return JSON with the following keys: ats_score (0-100), keyword_match_score (0-100), "
+        "strengths (list of short bullet points), weaknesses (list), suggestions (list), "
+        "missing_keywords (list of keywords the candidate should add)."
+    )
     if job_title:
-        parts.append(f"\nTarget Role: {job_title}")
-    if job_description:
-        parts.append(f"\nJob Description:\n{job_description}")
+        builder.add(f"\nTarget Role: {job_title}", section="metadata")
+    builder.add_budgeted(
+        job_description, section="job_description", budget=JOB_DESCRIPTION_TOKEN_BUDGET,
+        label="\nJob Description:\n",
+    )
     if target_keywords:
-        parts.append(f"\nTarget Keywords: {', '.join(target_keywords)}")
-    parts.append(f"\nResume Text:\n{resume_text}")
-    return "".join(parts)
+        builder.add(f"\nTarget Keywords: {', '.join(target_keywords)}", section="metadata")
+    builder.add_budgeted(
+        resume_text, section="resume", budget=RESUME_TOKEN_BUDGET, clean=False,
+        label="\nResume Text:\n",
+    )
+    return builder.build().text
 
 
 def analyze_resume_text(
@@ -101,9 +96,13 @@ def analyze_resume_text(
         target_keywords=target_keywords,
     )
 
-    client = _get_client()
+    result = _complete(prompt, ResumeAnalysisResult)
+    return result.model_dump()
+
+
+def _complete(prompt: str, result_model: Type[T]) -> T:
     try:
-        completion = client.chat.completions.create(
+        completion = create_chat_completion(
             model=settings.OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
@@ -121,8 +120,77 @@ def analyze_resume_text(
         raise ResumeAnalysisError("AI returned an empty response.")
 
     try:
-        result = ResumeAnalysisResult.model_validate_json(content)
-        return result.model_dump()
+        return result_model.model_validate_json(content)
     except (json.JSONDecodeError, ValidationError) as exc:
         logger.exception("Failed to parse AI analysis response: %s", content)
         raise ResumeAnalysisError("Received an invalid response from AI analysis.") from exc
+
+
+def _build_batch_prompt(resume_text: str, jobs: Sequence[Tuple[str, Job]]) -> str:
+    # Instructions and resume come first so every group in a batch shares the
+    # same prompt prefix and benefits from upstream prompt caching.
+    builder = PromptBuilder("resume_analysis_batch").add(
+        "Analyze the resume below against each target job that follows. "
+        "Return JSON with a single key, analyses: a list with one object per job containing "
+        "job_ref (the bracketed reference), ats_score (0-100), keyword_match_score (0-100), "
+        "strengths (list of short bullet points), weaknesses (list), suggestions (list), "
+        "missing_keywords (list of keywords the candidate should add for that job)."
+    )
+    builder.add_budgeted(
+        resume_text, section="resume", budget=RESUME_TOKEN_BUDGET, clean=False,
+        label="\nResume Text:\n",
+    )
+    for ref, job in jobs:
+        builder.add(f"\n[{ref}] Target Role: {job.title} at {job.company}\n", section="metadata")
+        if job.ai_required_skills:
+            builder.add(f"Required Skills: {', '.join(job.ai_required_skills)}\n", section="metadata")
+        builder.add_budgeted(
+            job.raw_description or job.description, section="job_description",
+            budget=BATCH_JOB_TOKEN_BUDGET, label="Job Description:\n",
+        )
+    return builder.build().text
+
+
+def analyze_resume_for_jobs(resume_text: str, jobs: Sequence[Job]) -> Dict[UUID, dict]:
+    """
+    Analyze one resume against several jobs.
+
+    Jobs are grouped BATCH_JOBS_PER_PROMPT to a prompt so the resume is sent
+    once per group, and groups run with at most BATCH_MAX_CONCURRENCY calls in
+    flight. Returns results keyed by job id; jobs whose group failed are
+    missing. Raises ResumeAnalysisError only if every group fails.
+    """
+    if not resume_text or not resume_text.strip():
+        raise ResumeAnalysisError("Resume text is empty; cannot analyze.")
+    if not jobs:
+        return {}
+
+    # Prompts are built here rather than in the pool: reading Job attributes
+    # may lazy-load through the caller's Session, which is not thread-safe.
+    groups: List[Tuple[str, Dict[str, UUID]]] = []
+    for start in range(0, len(jobs), BATCH_JOBS_PER_PROMPT):
+        refs = {f"J{index + 1}": job for index, job in enumerate(jobs[start:start + BATCH_JOBS_PER_PROMPT])}
+        groups.append((
+            _build_batch_prompt(resume_text, list(refs.items())),
+            {ref: job.id for ref, job in refs.items()},
+        ))
+
+    def analyze_group(prompt: str, job_ids: Dict[str, UUID]) -> Dict[UUID, dict]:
+        payload = _complete(prompt, _BatchAnalysisResult)
+        return {
+            job_ids[item.job_ref.strip("[] ")]: item.model_dump(exclude={"job_ref"})
+            for item in payload.analyses
+            if item.job_ref.strip("[] ") in job_ids
+        }
+
+    results: Dict[UUID, dict] = {}
+    errors: List[ResumeAnalysisError] = []
+    with ThreadPoolExecutor(max_workers=min(BATCH_MAX_CONCURRENCY, len(groups))) as pool:
+        for future in [pool.submit(analyze_group, *group) for group in groups]:
+            try:
+                results.update(future.result())
+            except ResumeAnalysisError as exc:
+                errors.append(exc)
+    if errors and not results:
+        raise errors[0]
+    return results
@@ -4,9 +4,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-import docx2txt
-from PyPDF2 import PdfReader
-
 
 def extract_text_from_file(file_path: Path) -> Optional[str]:
     """Extract text from supported resume formats."""
@@ -15,6 +12,8 @@ def extract_text_from_file(file_path: Path) -> Optional[str]:
         if suffix == ".pdf":
             return _extract_pdf_text(file_path)
         if suffix in {".doc", ".docx"}:
+            import docx2txt
+
             return docx2txt.process(str(file_path))
         if suffix == ".txt":
             return file_path.read_text(encoding="utf-8", errors="ignore")
@@ -25,6 +24,8 @@ def extract_text_from_file(file_path: Path) -> Optional[str]:
 
 
 def _extract_pdf_text(file_path: Path) -> str:
+    from PyPDF2 import PdfReader
+
     with file_path.open("rb") as f:
         reader = PdfReader(f)
         texts = []
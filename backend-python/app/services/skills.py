@@ -0,0 +1,70 @@
+"""Canonical skill names for filtering and faceting jobs.
+
+``ai_required_skills`` holds whatever the LLM or scraper produced ("Postgres",
+"PostgreSQL", "postgresql 14"). ``normalize_skills`` case-folds, trims and maps
+known aliases so ``Job.skills_normalized`` can be matched with array
+containment and counted per skill.
+"""
+import re
+from typing import Iterable, List, Optional
+
+_SPACE_RE = re.compile(r"\s+")
+_VERSION_SUFFIX_RE = re.compile(r"\s+v?\d+(\.\d+)*$")
+
+SKILL_ALIASES = {
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "pg": "postgresql",
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "node js": "node.js",
+    "react.js": "react",
+    "reactjs": "react",
+    "vue": "vue.js",
+    "vuejs": "vue.js",
+    "next": "next.js",
+    "nextjs": "next.js",
+    "golang": "go",
+    "py": "python",
+    "python3": "python",
+    "k8s": "kubernetes",
+    "aws cloud": "aws",
+    "amazon web services": "aws",
+    "gcp": "google cloud",
+    "google cloud platform": "google cloud",
+    "ms sql": "sql server",
+    "mssql": "sql server",
+    "mongo": "mongodb",
+    "tf": "terraform",
+    "ml": "machine learning",
+    "ci cd": "ci/cd",
+    "cicd": "ci/cd",
+    "c sharp": "c#",
+    "csharp": "c#",
+    "cpp": "c++",
+    "rest api": "rest",
+    "restful": "rest",
+    "restful apis": "rest",
+    "rest apis": "rest",
+}
+
+
+def normalize_skill(skill: Optional[str]) -> Optional[str]:
+    if not skill:
+        return None
+    name = _SPACE_RE.sub(" ", skill).strip().casefold()
+    name = _VERSION_SUFFIX_RE.sub("", name)
+    if not name:
+        return None
+    return SKILL_ALIASES.get(name, name)[:100]
+
+
+def normalize_skills(skills: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """Normalized, de-duplicated skills in their original order; None if empty."""
+    if not skills:
+        return None
+    normalized = dict.fromkeys(filter(None, (normalize_skill(skill) for skill in skills)))
+    return list(normalized) or None
@@ -7,16 +7,17 @@ Creates tables and inserts sample data for testing
 import sys
 sys.path.insert(0, '/home/ash/Programming/jobforge-ai/backend-python')
 
-from app.core.database import SessionLocal, Base, engine
+from app.core.database import SessionLocal
+from app.core.migrations import upgrade_to_head
 from app.models import User, Resume, Application, Job, Interview
 from app.core.security import get_password_hash
 from datetime import datetime, timedelta
 import uuid
 
 def init_database():
-    """Create all tables"""
-    print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    """Apply schema migrations"""
+    print("Applying database migrations...")
+    upgrade_to_head()
     print("✅ Tables created successfully")
 
 def seed_sample_data():
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+JobForge AI - Database Migration Command
+Applies versioned schema migrations; run before (re)starting API workers.
+Upgrading to head also fingerprints and clusters any jobs that predate
+duplicate detection, so new postings can be matched against them.
+
+Usage:
+    python migrate.py upgrade [revision]    # default: head
+    python migrate.py downgrade <revision>
+    python migrate.py current
+    python migrate.py backfill-duplicates   # only the job fingerprint backfill
+"""
+
+import sys
+
+from app.core.database import get_schema_revision
+from app.core.migrations import downgrade, head_revision, upgrade_to_head
+
+
+def backfill_duplicates():
+    from app.core.database import SessionLocal
+    from app.services.job_cache import invalidate_jobs
+    from app.services.job_dedupe import backfill_duplicate_clusters
+
+    with SessionLocal() as db:
+        duplicates = backfill_duplicate_clusters(db)
+    if duplicates:
+        invalidate_jobs()
+    print(f"✅ Job duplicate clusters backfilled ({duplicates} duplicates found)")
+
+
+def main(argv):
+    if not argv or argv[0] in {"-h", "--help"}:
+        print(__doc__)
+        return 0
+    command, args = argv[0], argv[1:]
+    if command == "upgrade":
+        upgrade_to_head(args[0] if args else "head")
+        print(f"✅ Database at revision {get_schema_revision()}")
+        if get_schema_revision() == head_revision():
+            backfill_duplicates()
+    elif command == "backfill-duplicates":
+        backfill_duplicates()
+    elif command == "downgrade" and args:
+        downgrade(args[0])
+        print(f"✅ Database at revision {get_schema_revision()}")
+    elif command == "current":
+        current, head = get_schema_revision(), head_revision()
+        state = "up to date" if current == head else f"expected {head}"
+        print(f"Current revision: {current or 'none'} ({state})")
+        return 0 if current == head else 1
+    else:
+        print(__doc__)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+JobForge AI - Job Listing Benchmark
+Grows the jobs table in steps with synthetic postings, most of them long
+expired, and times the listing queries at each step. With the lifecycle
+steps applied (the default) listing latency should stay flat as the total
+volume grows; ``--no-archive`` shows the same run without them.
+
+Needs a scratch database at DATABASE_URL migrated to head. Synthetic rows use
+source_site "benchmark" and are deleted from jobs and jobs_archive at the end.
+
+Usage:
+    python scripts/benchmark_job_listing.py [--volumes 10000,50000,200000] [--live-fraction 0.05] [--runs 50] [--no-archive]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+# Settings has required fields the benchmark never uses.
+for name, value in {
+    "REDIS_URL": "redis://localhost:6379/0",
+    "QDRANT_URL": "http://localhost:6333",
+    "SECRET_KEY": "job-listing-benchmark",
+    "OPENAI_API_KEY": "job-listing-benchmark",
+}.items():
+    os.environ.setdefault(name, value)
+
+from sqlalchemy import delete, func, insert, select, text  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+from app.crud.job import get_jobs  # noqa: E402
+from app.models.job import Job, job_archive  # noqa: E402
+from app.schemas.job import JobFilters  # noqa: E402
+from app.services.job_lifecycle import archive_jobs, expire_jobs  # noqa: E402
+
+SOURCE_SITE = "benchmark"
+INSERT_CHUNK = 5000
+REMOTE_TYPES = ("remote", "hybrid", "on-site")
+JOB_TYPES = ("full-time", "part-time", "contract")
+
+
+def synthetic_jobs(count, live_fraction, now):
+    for index in range(count):
+        if random.random() < live_fraction:
+            posted = now - timedelta(days=random.uniform(0, settings.JOB_EXPIRY_DAYS - 1))
+        else:
+            posted = now - timedelta(days=random.uniform(settings.JOB_EXPIRY_DAYS + 1, 3 * 365))
+        yield {
+            "id": uuid.uuid4(),
+            "title": f"Engineer {index}",
+            "company": f"Company {index % 500}",
+            "location": "Anywhere",
+            "remote_type": random.choice(REMOTE_TYPES),
+            "job_type": random.choice(JOB_TYPES),
+            "description": "Synthetic posting for the listing benchmark.",
+            "source_site": SOURCE_SITE,
+            "is_active": True,
+            "posted_date": posted,
+            "created_at": posted,
+        }
+
+
+def grow(db, count, live_fraction, now):
+    rows = list(synthetic_jobs(count, live_fraction, now))
+    for start in range(0, len(rows), INSERT_CHUNK):
+        db.execute(insert(Job.__table__), rows[start:start + INSERT_CHUNK])
+        db.commit()
+
+
+def apply_lifecycle(db, now):
+    for step in (lambda session, size: expire_jobs(session, size, now=now), archive_jobs):
+        while step(db, settings.JOB_ARCHIVE_BATCH_SIZE) == settings.JOB_ARCHIVE_BATCH_SIZE:
+            db.commit()
+        db.commit()
+
+
+def time_listing(db, runs):
+    queries = {
+        "all": lambda: get_jobs(db, limit=20),
+        "remote": lambda: get_jobs(db, limit=20, filters=JobFilters(remote_type="remote")),
+    }
+    timings = {}
+    for label, run in queries.items():
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            run()
+            samples.append((time.perf_counter() - started) * 1000)
+            db.expunge_all()
+        samples.sort()
+        timings[label] = (statistics.median(samples), samples[int(len(samples) * 0.95) - 1])
+    return timings
+
+
+def cleanup(db):
+    db.execute(delete(Job).where(Job.source_site == SOURCE_SITE))
+    db.execute(delete(job_archive).where(job_archive.c.source_site == SOURCE_SITE))
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--volumes", default="10000,50000,200000", help="cumulative synthetic jobs per step")
+    parser.add_argument("--live-fraction", type=float, default=0.05)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--no-archive", action="store_true", help="skip expiry and archival")
+    args = parser.parse_args()
+
+    volumes = sorted(int(volume) for volume in args.volumes.split(","))
+    now = datetime.utcnow()
+    random.seed(0)
+    print(f"{'generated':>10} {'jobs rows':>10} {'archived':>9} {'all p50/p95 ms':>16} {'remote p50/p95 ms':>19}")
+    with SessionLocal() as db:
+        try:
+            generated = 0
+            for volume in volumes:
+                grow(db, volume - generated, args.live_fraction, now)
+                generated = volume
+                if not args.no_archive:
+                    apply_lifecycle(db, now)
+                db.execute(text("ANALYZE jobs"))
+                db.commit()
+                in_jobs = db.scalar(select(func.count()).select_from(Job).where(Job.source_site == SOURCE_SITE))
+                archived = db.scalar(
+                    select(func.count()).select_from(job_archive).where(job_archive.c.source_site == SOURCE_SITE)
+                )
+                timings = time_listing(db, args.runs)
+                print(
+                    f"{generated:>10} {in_jobs:>10} {archived:>9} "
+                    f"{timings['all'][0]:>7.2f} / {timings['all'][1]:<6.2f} "
+                    f"{timings['remote'][0]:>9.2f} / {timings['remote'][1]:<6.2f}"
+                )
+        finally:
+            cleanup(db)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
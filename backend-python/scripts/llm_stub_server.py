@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+JobForge AI - LLM Stub Server
+Minimal OpenAI-compatible ``/chat/completions`` and Anthropic ``/v1/messages``
+endpoints for exercising provider failover and hedging locally (and in
+tests/test_llm_providers.py). Point a provider at it, e.g.:
+
+    python scripts/llm_stub_server.py --port 8801 --first-token-delay 8
+    python scripts/llm_stub_server.py --port 8802 --reply "fast answer"
+    OPENAI_BASE_URL=http://127.0.0.1:8801 LLM_FALLBACK_BASE_URL=http://127.0.0.1:8802 uvicorn app.main:app
+
+Set ANTHROPIC_BASE_URL to the same address to serve the Anthropic provider.
+
+Usage:
+    python scripts/llm_stub_server.py [--port 8801] [--first-token-delay 0] [--status 200]
+                                      [--retry-after N] [--reply TEXT] [--model NAME]
+"""
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_handler(args):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            path = self.path.rstrip("/")
+            if not path.endswith(("/chat/completions", "/messages")):
+                self.send_error(404)
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            if args.status != 200:
+                self.send_response(args.status)
+                if args.retry_after is not None:
+                    self.send_header("Retry-After", str(args.retry_after))
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(json.dumps({"error": {"message": f"stub status {args.status}"}}).encode())
+                return
+
+            completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+            words = args.reply.split(" ")
+            usage = {"prompt_tokens": 10, "completion_tokens": len(words), "total_tokens": 10 + len(words)}
+            time.sleep(args.first_token_delay)
+            if path.endswith("/messages"):
+                self._anthropic_stream(words, usage)
+                return
+            if not body.get("stream"):
+                self._json({
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": args.model,
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": args.reply}}],
+                    "usage": usage,
+                })
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for index, word in enumerate(words):
+                text = word if index == 0 else " " + word
+                self._event({"choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}]}, completion_id)
+                time.sleep(args.token_interval)
+            self._event({"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}], "usage": usage}, completion_id)
+            self.wfile.write(b"data: [DONE]\n\n")
+
+        def _anthropic_stream(self, words, usage):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            message = {"id": f"msg_{uuid.uuid4().hex}", "type": "message", "role": "assistant", "content": [],
+                       "model": args.model, "stop_reason": None, "stop_sequence": None,
+                       "usage": {"input_tokens": usage["prompt_tokens"], "output_tokens": 1}}
+            self._sse("message_start", {"message": message})
+            self._sse("content_block_start", {"index": 0, "content_block": {"type": "text", "text": ""}})
+            for index, word in enumerate(words):
+                text = word if index == 0 else " " + word
+                self._sse("content_block_delta", {"index": 0, "delta": {"type": "text_delta", "text": text}})
+                time.sleep(args.token_interval)
+            self._sse("content_block_stop", {"index": 0})
+            self._sse("message_delta", {"delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                                        "usage": {"output_tokens": usage["completion_tokens"]}})
+            self._sse("message_stop", {})
+
+        def _sse(self, event, payload):
+            try:
+                self.wfile.write(f"event: {event}\ndata: {json.dumps({'type': event, **payload})}\n\n".encode())
+                self.wfile.flush()
+            except BrokenPipeError:
+                pass
+
+        def _event(self, payload, completion_id):
+            payload = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                       "model": args.model, **payload}
+            try:
+                self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode())
+                self.wfile.flush()
+            except BrokenPipeError:
+                pass  # client cancelled (e.g. lost a hedge)
+
+        def _json(self, payload):
+            data = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8801)
+    parser.add_argument("--first-token-delay", type=float, default=0.0)
+    parser.add_argument("--token-interval", type=float, default=0.02)
+    parser.add_argument("--status", type=int, default=200)
+    parser.add_argument("--retry-after", type=int)
+    parser.add_argument("--reply", default='{"summary": "stub reply"}')
+    parser.add_argument("--model", default="stub-model")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args))
+    print(f"🧪 LLM stub listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Shared fixtures: a migrated database, a rolled-back session per test and a statement counter.
+
+Needs DATABASE_URL and REDIS_URL pointing at disposable services, as in CI.
+"""
+import os
+import re
+from contextlib import contextmanager
+from uuid import uuid4
+
+# Settings requires these; the tests never call either service.
+os.environ.setdefault("QDRANT_URL", "http://localhost:6333")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.database import get_engine
+from app.core.migrations import upgrade_to_head
+from app.core.security import create_access_token
+from app.models.user import User
+
+_TRANSACTION_CONTROL_RE = re.compile(r"^\s*(SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT)\b", re.IGNORECASE)
+
+
+@pytest.fixture(scope="session")
+def migrated_database():
+    upgrade_to_head()
+
+
+@pytest.fixture
+def db(migrated_database):
+    """Session inside an outer transaction; commits become savepoints and everything is rolled back."""
+    connection = get_engine().connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def user(db):
+    account = User(email=f"{uuid4().hex}@example.com", full_name="Test User")
+    db.add(account)
+    db.flush()
+    return account
+
+
+@pytest.fixture
+def auth_headers(user):
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id), 'email': user.email})}"}
+
+
+@pytest.fixture
+def client(db):
+    from fastapi.testclient import TestClient
+
+    from app.core.database import get_db
+    from app.main import app
+
+    def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        # Not entered as a context manager, so the lifespan's background tasks never start.
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+@contextmanager
+def count_statements():
+    """Record every SQL statement sent to the database, ignoring the test harness' savepoints."""
+    log = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not _TRANSACTION_CONTROL_RE.match(statement):
+            log.append(statement)
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield log
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def statements():
+    return count_statements
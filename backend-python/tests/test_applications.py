@@ -0,0 +1,68 @@
+"""Query counts for the application list endpoint."""
+from datetime import datetime, timedelta
+
+from app.models.application import Application
+from app.models.interview import Interview, InterviewType
+from app.models.job import Job
+
+
+def _add_applications(db, user, count):
+    for index in range(count):
+        job = Job(title=f"Engineer {index}", company="Acme", location="Remote", description="Build things")
+        application = Application(user_id=user.id, job=job, company_name="Acme", job_title=job.title)
+        db.add(application)
+        for offset in range(2):
+            db.add(Interview(
+                application=application,
+                user_id=user.id,
+                interview_type=InterviewType.VIDEO,
+                scheduled_at=datetime.utcnow() + timedelta(days=offset + 1),
+            ))
+    db.flush()
+    # Start the request from an empty identity map, as a real request would.
+    db.expunge_all()
+
+
+def _list_with_includes(client, auth_headers, statements):
+    with statements() as log:
+        response = client.get("/api/v1/applications/?include=job,interviews", headers=auth_headers)
+    assert response.status_code == 200
+    return response.json(), log
+
+
+def test_list_with_includes_uses_constant_statements(client, db, user, auth_headers, statements):
+    _add_applications(db, user, 1)
+    items, few = _list_with_includes(client, auth_headers, statements)
+    assert len(items) == 1
+
+    _add_applications(db, user, 9)
+    items, many = _list_with_includes(client, auth_headers, statements)
+    assert len(items) == 10
+    assert all(item["job"] and len(item["interviews"]) == 2 for item in items)
+
+    # Current user, applications joined to their jobs, then one IN query for all interviews.
+    assert len(few) == len(many) == 3, many
+
+
+def test_update_application_rescores_linked_job(db, user, monkeypatch):
+    from app.crud import application as application_crud
+    from app.models.resume import Resume
+    from app.schemas.application import ApplicationUpdate
+    from app.services import match_scoring
+
+    job = Job(title="Python Engineer", company="Acme", description="Python, Django and Postgres")
+    application = Application(user_id=user.id, job=job, company_name="Acme", job_title=job.title, match_score=0.0)
+    db.add_all([job, application, Resume(user_id=user.id, title="CV", raw_text="Python Django", is_primary=True)])
+    db.flush()
+    monkeypatch.setattr(match_scoring, "_index", match_scoring.build_index(db))
+
+    updated = application_crud.update_application(
+        db, application.id, ApplicationUpdate(notes="Called back"), owner_id=user.id
+    )
+    assert updated.notes == "Called back"
+    assert updated.match_score > 0
+
+    pinned = application_crud.update_application(
+        db, application.id, ApplicationUpdate(match_score=12.5), owner_id=user.id
+    )
+    assert pinned.match_score == 12.5
@@ -0,0 +1,30 @@
+"""Skill counts follow job writes through the delta table."""
+from sqlalchemy import text
+
+from app.models.job import Job
+from app.services.job_facets import fold_skill_deltas
+
+
+def _count(db, skill):
+    return db.execute(text("SELECT job_count FROM job_skill_counts WHERE skill = :skill"), {"skill": skill}).scalar()
+
+
+def test_job_writes_are_folded_into_skill_counts(db):
+    skill = "test-skill-fold"
+    jobs = [Job(title="Engineer", company="Acme", skills_normalized=[skill]) for _ in range(3)]
+    db.add_all(jobs)
+    db.flush()
+    fold_skill_deltas(db)
+    assert _count(db, skill) == 3
+
+    jobs[0].is_active = False
+    db.delete(jobs[1])
+    db.flush()
+    fold_skill_deltas(db)
+    assert _count(db, skill) == 1
+
+    db.delete(jobs[2])
+    db.flush()
+    fold_skill_deltas(db)
+    assert _count(db, skill) is None
+    assert db.execute(text("SELECT count(*) FROM job_skill_count_deltas WHERE skill = :skill"), {"skill": skill}).scalar() == 0
@@ -0,0 +1,111 @@
+"""Failover and hedging across providers, against scripts/llm_stub_server.py."""
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from app.core.config import settings
+from app.services import llm_providers
+
+STUB_SERVER = Path(__file__).resolve().parents[1] / "scripts" / "llm_stub_server.py"
+PARAMS = {"model": "stub-model", "messages": [{"role": "user", "content": "hello"}]}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def stub():
+    """Start stub servers: ``stub("--reply", "hi")`` returns the server's base URL."""
+    processes = []
+
+    def start(*args: str) -> str:
+        port = _free_port()
+        processes.append(subprocess.Popen(
+            [sys.executable, str(STUB_SERVER), "--port", str(port), "--token-interval", "0", *args],
+            stdout=subprocess.DEVNULL,
+        ))
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                return f"http://127.0.0.1:{port}"
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+
+    yield start
+    for process in processes:
+        process.terminate()
+        process.wait()
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """Point LLM_PROVIDERS at stub servers: ``configure(openai=url, fallback=url, anthropic=url)``."""
+
+    def apply(**urls: str) -> None:
+        monkeypatch.setattr(settings, "LLM_PROVIDERS", list(urls))
+        monkeypatch.setattr(settings, "LLM_HEDGE_DELAY_SECONDS", 0.3)
+        monkeypatch.setattr(settings, "LLM_DEADLINE_SECONDS", 20)
+        if "openai" in urls:
+            monkeypatch.setattr(settings, "OPENAI_BASE_URL", urls["openai"])
+        if "fallback" in urls:
+            monkeypatch.setattr(settings, "LLM_FALLBACK_BASE_URL", urls["fallback"])
+        if "anthropic" in urls:
+            monkeypatch.setattr(settings, "ANTHROPIC_API_KEY", "test")
+            monkeypatch.setattr(settings, "ANTHROPIC_BASE_URL", urls["anthropic"])
+        llm_providers.get_providers.cache_clear()
+        llm_providers._first_token_latency.clear()
+
+    yield apply
+    llm_providers.get_providers.cache_clear()
+
+
+def _text(completion) -> str:
+    return completion.choices[0].message.content
+
+
+def test_fails_over_to_the_next_provider(stub, configure):
+    configure(openai=stub("--status", "500"), fallback=stub("--reply", "from fallback"))
+    assert _text(llm_providers.complete(PARAMS)) == "from fallback"
+
+
+def test_hedges_a_slow_first_token(stub, configure):
+    configure(openai=stub("--first-token-delay", "5", "--reply", "too slow"), fallback=stub("--reply", "hedged"))
+    started = time.monotonic()
+    assert _text(llm_providers.complete(PARAMS)) == "hedged"
+    assert time.monotonic() - started < 3
+
+
+def test_fails_over_to_anthropic(stub, configure):
+    configure(openai=stub("--status", "503"), anthropic=stub("--reply", "from anthropic"))
+    completion = llm_providers.complete(PARAMS)
+    assert _text(completion) == "from anthropic"
+    assert completion.usage.prompt_tokens == 10
+    assert completion.usage.completion_tokens == 2
+
+
+def test_reuses_one_http_client_per_provider(stub, configure, monkeypatch):
+    import httpx
+
+    configure(openai=stub("--reply", "again"))
+    assert _text(llm_providers.complete(PARAMS)) == "again"
+    created = []
+    original_init = httpx.Client.__init__
+
+    def counting_init(self, *args, **kwargs):
+        created.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(httpx.Client, "__init__", counting_init)
+    for _ in range(3):
+        assert _text(llm_providers.complete(PARAMS)) == "again"
+    assert created == []
@@ -0,0 +1,17 @@
+"""Match scoring never builds the index on the request path."""
+import pytest
+
+from app.models.job import Job
+from app.services import match_scoring
+
+
+def test_cold_index_scores_nothing_and_builds_in_background(monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(match_scoring, "_index", None)
+    monkeypatch.setattr(match_scoring, "warm_index", lambda: scheduled.append(True))
+    monkeypatch.setattr(match_scoring, "build_index", lambda db: pytest.fail("index built inline"))
+
+    job = Job(title="Python Engineer", company="Acme", description="Python and Django")
+    assert match_scoring.score_job(None, "Python Django", job) is None
+    assert match_scoring.rank_jobs(None, "Python Django") is None
+    assert scheduled
@@ -0,0 +1,70 @@
+"""Statement counts for resume writes."""
+from uuid import uuid4
+
+from app.crud import resume as resume_crud
+from app.crud.base import update_returning
+from app.models.resume import Resume
+from app.schemas.resume import ResumeCreate
+
+
+def _resume(db, user, **values):
+    resume = Resume(user_id=user.id, title="Resume", **values)
+    db.add(resume)
+    db.flush()
+    return resume
+
+
+def test_update_returning_with_owner_is_one_statement(db, user, statements):
+    resume = _resume(db, user)
+    with statements() as log:
+        updated = update_returning(db, Resume, resume.id, {"title": "Renamed"}, owner_id=user.id)
+    assert updated.title == "Renamed"
+    assert len(log) == 1, log
+
+
+def test_update_returning_ignores_other_owners(db, user, statements):
+    resume = _resume(db, user)
+    with statements() as log:
+        assert update_returning(db, Resume, resume.id, {"title": "Renamed"}, owner_id=uuid4()) is None
+    assert len(log) == 1, log
+    db.refresh(resume)
+    assert resume.title == "Resume"
+
+
+def test_create_primary_resume_demotes_in_one_update(db, user, statements):
+    current = _resume(db, user, is_primary=True)
+    with statements() as log:
+        created = resume_crud.create_resume(db, ResumeCreate(title="New", is_primary=True), user.id)
+    # Demoting UPDATE, then the INSERT.
+    assert len(log) == 2, log
+    assert created.is_primary
+    db.refresh(current)
+    assert current.is_primary is False
+
+
+def test_create_first_resume_becomes_primary(db, user, statements):
+    with statements() as log:
+        created = resume_crud.create_resume(db, ResumeCreate(title="First"), user.id)
+    assert len(log) == 2, log
+    assert created.is_primary
+
+
+def test_set_primary_resume_is_one_statement(db, user, statements):
+    current = _resume(db, user, is_primary=True)
+    target = _resume(db, user, is_primary=False)
+    with statements() as log:
+        promoted = resume_crud.set_primary_resume(db, user.id, target.id)
+    assert len(log) == 1, log
+    assert promoted.id == target.id and promoted.is_primary
+    db.refresh(current)
+    assert current.is_primary is False
+
+
+def test_set_primary_resume_of_another_user_changes_nothing(db, user, statements):
+    current = _resume(db, user, is_primary=True)
+    other = _resume(db, user, is_primary=False)
+    with statements() as log:
+        assert resume_crud.set_primary_resume(db, uuid4(), other.id) is None
+    assert len(log) == 1, log
+    db.refresh(current)
+    assert current.is_primary is True
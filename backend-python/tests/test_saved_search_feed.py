@@ -0,0 +1,19 @@
+"""Feed cursors, including the bare match ids issued before revision 0010."""
+import pytest
+
+from app.crud.pagination import InvalidCursorError
+from app.crud.saved_search import decode_feed_cursor
+
+
+def test_decode_current_cursor():
+    assert decode_feed_cursor("1234.56") == (1234, 56)
+
+
+def test_decode_legacy_integer_cursor():
+    assert decode_feed_cursor("56") == (None, 56)
+
+
+@pytest.mark.parametrize("cursor", ["", "abc", "1.2.3", "-5", "1.x"])
+def test_decode_rejects_malformed_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_feed_cursor(cursor)
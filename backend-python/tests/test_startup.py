@@ -0,0 +1,32 @@
+"""Cold-start budget for the API module, using scripts/import_time_report.py."""
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _report():
+    spec = importlib.util.spec_from_file_location("import_time_report", BACKEND_ROOT / "scripts" / "import_time_report.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_cold_start_within_budget():
+    report = _report()
+    rows, wall_ms = report.run("app.main")
+    imported = {name for name, *_ in rows}
+    assert [name for name in report.LAZY_MODULES if name in imported] == []
+    assert wall_ms <= report.DEFAULT_BUDGET_MS, f"cold start {wall_ms:.0f} ms > {report.DEFAULT_BUDGET_MS} ms"
+
+
+def test_import_does_not_read_settings():
+    code = "import app.main; from app.core.config import get_settings; print(get_settings.cache_info().currsize)"
+    # No DATABASE_URL/SECRET_KEY: building Settings would fail validation.
+    env = {key: value for key, value in os.environ.items() if key not in ("DATABASE_URL", "REDIS_URL", "SECRET_KEY")}
+    proc = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_ROOT, env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "0"
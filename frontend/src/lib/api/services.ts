@@ -5,6 +5,23 @@
 
 import apiClient from './client';
 
+// Collection endpoints return one page at a time and the next page's cursor
+// in the X-Next-Cursor header; follow it so callers get the whole list.
+const PAGE_LIMIT = 200;
+
+async function getAllPages<T>(url: string, params: Record<string, unknown> = {}): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | undefined;
+  do {
+    const response = await apiClient.get<T[]>(url, {
+      params: { limit: PAGE_LIMIT, ...params, ...(cursor ? { cursor } : {}) },
+    });
+    items.push(...response.data);
+    cursor = response.headers['x-next-cursor'];
+  } while (cursor);
+  return items;
+}
+
 // ============================================
 // Types & Interfaces
 // ============================================
@@ -121,8 +138,7 @@ class UserService {
 
 class ResumeService {
   async getAll(): Promise<Resume[]> {
-    const response = await apiClient.get<Resume[]>('/api/v1/resumes');
-    return response.data;
+    return getAllPages<Resume>('/api/v1/resumes');
   }
 
   async getById(id: string): Promise<Resume> {
@@ -179,8 +195,7 @@ class ApplicationService {
     skip?: number;
     limit?: number;
   }): Promise<Application[]> {
-    const response = await apiClient.get<Application[]>('/api/v1/applications', { params });
-    return response.data;
+    return getAllPages<Application>('/api/v1/applications', params);
   }
 
   async getById(id: string): Promise<Application> {
@@ -244,8 +259,7 @@ export interface Interview {
 
 class InterviewService {
   async getAll(): Promise<Interview[]> {
-    const response = await apiClient.get<Interview[]>('/api/v1/interviews');
-    return response.data;
+    return getAllPages<Interview>('/api/v1/interviews');
   }
 
   async getById(id: string): Promise<Interview> {